@@ -0,0 +1,103 @@
+"""
+Benchmark near-duplicate clustering on synthetic news items
+
+Usage: python -m benchmarks.bench_dedup
+"""
+
+import random
+import time
+from src.news.dedup import cluster_items
+from src.news.models import NewsItem
+
+WORDS = (
+    "model agents open source chip launch funding regulation research lab "
+    "startup cloud training inference benchmark policy europe china court "
+    "robot vision speech data privacy safety release update partnership "
+    "billion million record market shares revenue investors study paper"
+).split()
+
+PUBLISHERS = ["Reuters", "BBC", "TechCrunch", "The Verge", "Wired", "CNBC"]
+
+
+def make_story(rng: random.Random, story_id: int) -> NewsItem:
+    title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(7, 12)))
+    description = " ".join(rng.choice(WORDS) for _ in range(rng.randint(25, 45)))
+    return NewsItem(
+        title=title.capitalize(),
+        description=description,
+        link=f"https://news.example.com/{story_id}/story",
+        source=rng.choice(PUBLISHERS),
+    )
+
+
+def make_variant(rng: random.Random, story: NewsItem) -> NewsItem:
+    """Re-report a story: new link, publisher suffix, slightly edited text"""
+    words = story.description.split()
+    if rng.random() < 0.5:
+        # Reworded ending, as in a syndicated copy trimmed by another outlet
+        words = words[:-2] + [rng.choice(WORDS)]
+    title = story.title
+    link = f"https://mirror{rng.randint(1, 9)}.example.org/{rng.random():.8f}"
+    if rng.random() < 0.5:
+        title = f"{title} - {rng.choice(PUBLISHERS)}"
+        link = story.link + "?utm_source=rss&utm_medium=feed"
+    return NewsItem(
+        title=title,
+        description=" ".join(words),
+        link=link,
+        source=rng.choice(PUBLISHERS),
+    )
+
+
+def make_items(count: int, seed: int = 7):
+    """Build ~count items, a third of them near-duplicates of another item"""
+    rng = random.Random(seed)
+    items, truth = [], []
+    story_id = 0
+    while len(items) < count:
+        story = make_story(rng, story_id)
+        items.append(story)
+        truth.append(story_id)
+        for _ in range(rng.choice([0, 0, 1, 2])):
+            items.append(make_variant(rng, story))
+            truth.append(story_id)
+        story_id += 1
+    return items[:count], truth[:count]
+
+
+def main():
+    print(f"{'items':>6} {'clusters':>9} {'true':>6} {'precision':>9} {'recall':>7} {'time':>8}")
+    for count in (1000, 2000, 4000, 8000):
+        items, truth = make_items(count)
+        start = time.perf_counter()
+        clusters = cluster_items(items)
+        elapsed = time.perf_counter() - start
+
+        predicted = {}
+        for cluster_id, members in enumerate(clusters):
+            for index in members:
+                predicted[index] = cluster_id
+
+        # Pairwise precision/recall over same-story pairs within clusters
+        true_pairs = found_pairs = correct_pairs = 0
+        by_story = {}
+        for index, story in enumerate(truth):
+            by_story.setdefault(story, []).append(index)
+        for members in by_story.values():
+            true_pairs += len(members) * (len(members) - 1) // 2
+        for members in clusters:
+            for i, a in enumerate(members):
+                for b in members[i + 1:]:
+                    found_pairs += 1
+                    correct_pairs += truth[a] == truth[b]
+
+        precision = correct_pairs / found_pairs if found_pairs else 1.0
+        recall = correct_pairs / true_pairs if true_pairs else 1.0
+        print(
+            f"{count:>6} {len(clusters):>9} {len(by_story):>6} "
+            f"{precision:>9.3f} {recall:>7.3f} {elapsed * 1000:>6.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark the memory footprint of news items: plain dicts vs NewsItem
+
+Usage: python -m benchmarks.bench_news_item
+"""
+
+import gc
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from src.news.models import NewsItem
+
+SOURCES = ["Reuters", "BBC", "TechCrunch", "The Verge", "Wired", "CNBC"]
+NOW = datetime(2025, 10, 13, tzinfo=timezone.utc)
+
+
+def make_fields(rng: random.Random, index: int) -> dict:
+    """Field values of one item; strings are shared by both representations"""
+    return {
+        "title": f"Story {index}: {rng.random():.12f}",
+        "link": f"https://news.example.com/{index}/story",
+        "description": f"Description of story {index} " * rng.randint(3, 8),
+        "published": "Mon, 13 Oct 2025 08:00:00 GMT",
+        "source": rng.choice(SOURCES),
+        "language": "en",
+        "category": "technology",
+        "published_at": NOW - timedelta(minutes=index),
+    }
+
+
+def container_bytes(build, rows) -> int:
+    """Bytes allocated by the item containers alone (values already exist)"""
+    gc.collect()
+    tracemalloc.start()
+    items = [build(row) for row in rows]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return size
+
+
+def main():
+    print(
+        f"{'items':>7} {'dict B/item':>12} {'NewsItem B/item':>16} "
+        f"{'saved':>6} {'dict build':>11} {'item build':>11}"
+    )
+    for count in (10_000, 50_000, 100_000):
+        rng = random.Random(7)
+        rows = [make_fields(rng, index) for index in range(count)]
+
+        dict_bytes = container_bytes(dict, rows)
+        item_bytes = container_bytes(lambda row: NewsItem(**row), rows)
+
+        start = time.perf_counter()
+        [dict(row) for row in rows]
+        dict_time = time.perf_counter() - start
+        start = time.perf_counter()
+        [NewsItem(**row) for row in rows]
+        item_time = time.perf_counter() - start
+
+        print(
+            f"{count:>7} {dict_bytes / count:>12.0f} {item_bytes / count:>16.0f} "
+            f"{1 - item_bytes / dict_bytes:>6.0%} {dict_time * 1000:>9.0f}ms "
+            f"{item_time * 1000:>9.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Benchmark feed parser backends: throughput, memory and extraction completeness
+
+Runs on a fixture bundle recorded from our real feeds (set news.fixtures.mode
+to record for one run), or on a synthetic corpus of RSS 2.0, RSS 1.0 (RDF),
+Atom and slightly malformed feeds when no bundle is given. Memory is the
+peak RSS growth while parsing the corpus once, measured in a fresh process
+per backend (so lxml's and libxml2's allocations count too; Linux only).
+
+Usage: python -m benchmarks.bench_parsers [fixture_dir] [max_items]
+       (pass "" as fixture_dir for the synthetic corpus)
+"""
+
+import gzip
+import json
+import random
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List, Tuple
+from xml.sax.saxutils import escape
+from src.news.parsers import FEED_PARSERS, FeedParseError, available_parsers, get_feed_parser
+
+CORPUS_PATH = Path(__file__).parent / "data" / "feed_descriptions.json"
+CHUNK_SIZE = 16 * 1024
+MAX_BYTES = 5 * 1024 * 1024
+ROUNDS = 5
+FIELDS = ("title", "link", "description", "published")
+
+
+def load_bundle(fixture_dir: Path) -> Dict[str, bytes]:
+    """Read the successful GET bodies of a recorded fixture bundle"""
+    index = json.loads((fixture_dir / "index.json").read_text(encoding="utf-8"))
+    return {
+        entry["url"]: gzip.decompress((fixture_dir / entry["body_file"]).read_bytes())
+        for entry in index.values()
+        if entry["method"] == "GET" and entry["status"] == 200
+    }
+
+
+def synthetic_corpus(feed_count: int = 200, items_per_feed: int = 40) -> Dict[str, bytes]:
+    """Build feeds in the formats our registry serves"""
+    descriptions = json.loads(CORPUS_PATH.read_text(encoding="utf-8"))
+    rng = random.Random(20)
+    corpus = {}
+    for feed in range(feed_count):
+        kind = ("rss", "rss-content", "rdf", "atom", "malformed")[feed % 5]
+        items = []
+        for i in range(items_per_feed):
+            title = f"Story {feed}-{i} &amp; more"
+            link = f"https://example.com/{feed}/{i}"
+            text = escape(rng.choice(descriptions))
+            if kind == "rss":
+                items.append(
+                    f"<item><title>{title}</title><link>{link}</link>"
+                    f"<description>{text}</description>"
+                    f"<pubDate>Mon, 13 Oct 2025 {i % 24:02d}:00:00 GMT</pubDate></item>"
+                )
+            elif kind == "rss-content":
+                items.append(
+                    f"<item><title>{title}</title><guid>{link}</guid>"
+                    f"<content:encoded>{text}</content:encoded>"
+                    f"<dc:date>2025-10-13T{i % 24:02d}:00:00Z</dc:date></item>"
+                )
+            elif kind == "rdf":
+                items.append(
+                    f'<item rdf:about="{link}"><title>{title}</title><link>{link}</link>'
+                    f"<description>{text}</description>"
+                    f"<dc:date>2025-10-13T{i % 24:02d}:00:00+09:00</dc:date></item>"
+                )
+            elif kind == "atom":
+                items.append(
+                    f'<entry><title>{title}</title><link rel="alternate" href="{link}"/>'
+                    f"<summary>{text}</summary>"
+                    f"<updated>2025-10-13T{i % 24:02d}:00:00Z</updated></entry>"
+                )
+            else:
+                # Unescaped ampersand, as some CMS plugins emit
+                items.append(
+                    f"<item><title>Story {feed}-{i} & more</title><link>{link}</link>"
+                    f"<description>{text}</description>"
+                    f"<pubDate>Mon, 13 Oct 2025 {i % 24:02d}:00:00 GMT</pubDate></item>"
+                )
+        body = "".join(items)
+        if kind == "rdf":
+            xml = (
+                '<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#" '
+                'xmlns="http://purl.org/rss/1.0/" xmlns:dc="http://purl.org/dc/elements/1.1/">'
+                f'<channel rdf:about="https://example.com/{feed}"><title>Feed {feed}</title>'
+                f"</channel>{body}</rdf:RDF>"
+            )
+        elif kind == "atom":
+            xml = (
+                f'<feed xmlns="http://www.w3.org/2005/Atom"><title>Feed {feed}</title>'
+                f"{body}</feed>"
+            )
+        else:
+            xml = (
+                '<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/" '
+                'xmlns:dc="http://purl.org/dc/elements/1.1/">'
+                f"<channel><title>Feed {feed}</title>{body}</channel></rss>"
+            )
+        corpus[f"https://feeds.example.com/{kind}/{feed}.xml"] = (
+            '<?xml version="1.0" encoding="utf-8"?>' + xml
+        ).encode("utf-8")
+    return corpus
+
+
+def chunked(body: bytes) -> List[bytes]:
+    """Split a body like a streamed response"""
+    return [body[i : i + CHUNK_SIZE] for i in range(0, len(body), CHUNK_SIZE)]
+
+
+def parse_corpus(name: str, corpus: Dict[str, bytes], max_items: int) -> Dict[str, list]:
+    """Parse every feed once; return URL -> entries (None for parse errors)"""
+    parser = get_feed_parser(name)
+    results = {}
+    for url, body in corpus.items():
+        try:
+            results[url], _ = parser.parse(chunked(body), max_items, MAX_BYTES)
+        except FeedParseError:
+            results[url] = None
+    return results
+
+
+def _memory_kb(field: str) -> int:
+    """Read a memory counter (VmRSS, VmHWM) of this process in KB"""
+    status = Path("/proc/self/status").read_text()
+    return int(re.search(rf"{field}:\s+(\d+)", status).group(1))
+
+
+def measure_memory(name: str, corpus: Dict[str, bytes], max_items: int) -> float:
+    """Peak RSS growth in MB while parsing the corpus (run in a fresh process)"""
+    get_feed_parser(name)
+    # Reset the high-water mark left by unpickling the corpus (Linux only)
+    Path("/proc/self/clear_refs").write_text("5")
+    before = _memory_kb("VmRSS")
+    parse_corpus(name, corpus, max_items)
+    return (_memory_kb("VmHWM") - before) / 1024
+
+
+def completeness(results: Dict[str, list]) -> Tuple[int, int, Dict[str, float]]:
+    """Count failed feeds and items, and the share of items with each field"""
+    failed = sum(1 for entries in results.values() if entries is None)
+    items = [entry for entries in results.values() if entries for entry in entries]
+    shares = {
+        field: (sum(1 for entry in items if entry[field]) / len(items) if items else 0.0)
+        for field in FIELDS
+    }
+    return failed, len(items), shares
+
+
+def main() -> None:
+    fixture_dir = Path(sys.argv[1]) if len(sys.argv) > 1 and sys.argv[1] else None
+    max_items = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+
+    if fixture_dir:
+        corpus = load_bundle(fixture_dir)
+        source = f"recorded bundle {fixture_dir}"
+    else:
+        corpus = synthetic_corpus()
+        source = "synthetic corpus (RSS 2.0, content:encoded, RDF, Atom, malformed)"
+    size_mb = sum(len(body) for body in corpus.values()) / 1024 / 1024
+    print(f"{len(corpus)} feeds, {size_mb:.1f} MB, {source}, max_items={max_items}")
+
+    missing = [name for name in FEED_PARSERS if name not in available_parsers()]
+    if missing:
+        print(f"Not installed, skipped: {', '.join(missing)}")
+
+    print(
+        f"{'parser':<11} {'feeds/s':>8} {'MB/s':>6} {'mem MB':>7} {'failed':>6} "
+        f"{'items':>6}  " + " ".join(f"{field:>11}" for field in FIELDS)
+    )
+    for name in available_parsers():
+        parse_corpus(name, corpus, max_items)
+        start = time.perf_counter()
+        for _ in range(ROUNDS):
+            results = parse_corpus(name, corpus, max_items)
+        elapsed = (time.perf_counter() - start) / ROUNDS
+
+        with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+            memory = pool.submit(measure_memory, name, corpus, max_items).result()
+
+        failed, items, shares = completeness(results)
+        print(
+            f"{name:<11} {len(corpus) / elapsed:>8.0f} {size_mb / elapsed:>6.1f} "
+            f"{memory:>7.1f} {failed:>6} {items:>6}  "
+            + " ".join(f"{shares[field]:>10.0%} " for field in FIELDS)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark the Stage 1 pre-ranker: scoring time and prompt token savings
+
+Usage: python -m benchmarks.bench_ranker
+"""
+
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from src.news.generator import NewsGenerator
+from src.news.models import NewsItem
+from src.news.ranker import RelevanceRanker, estimate_tokens
+
+TOPICS = [
+    "Latest AI developments and breakthroughs",
+    "Large language model releases and research",
+    "AI regulation and policy",
+]
+ON_TOPIC = (
+    "ai model language large release research breakthrough regulation policy "
+    "openai anthropic gemini training inference agents"
+).split()
+OFF_TOPIC = (
+    "football election weather recipe travel housing market concert film "
+    "traffic holiday fashion banking oil retail"
+).split()
+FILLER = "the a of to in on for with said report week company people".split()
+NOW = datetime(2025, 10, 13, 12, tzinfo=timezone.utc)
+
+
+def make_items(count: int, seed: int = 11):
+    """Build items, a quarter of them on topic; return (items, on-topic flags)"""
+    rng = random.Random(seed)
+    items, relevant = [], []
+    for index in range(count):
+        on_topic = rng.random() < 0.25
+        vocabulary = ON_TOPIC if on_topic else OFF_TOPIC
+        words = lambda n: " ".join(
+            rng.choice(vocabulary) if rng.random() < 0.4 else rng.choice(FILLER)
+            for _ in range(n)
+        )
+        items.append(
+            NewsItem(
+                title=words(10).capitalize(),
+                description=words(40),
+                link=f"https://news.example.com/{index}",
+                source=f"Source {index % 40}",
+                published_at=NOW - timedelta(hours=rng.uniform(0, 72)),
+                cluster_size=rng.choice([1, 1, 1, 2, 3]),
+            )
+        )
+        relevant.append(on_topic)
+    return items, relevant
+
+
+def main():
+    ranker = RelevanceRanker(TOPICS)
+    print(
+        f"{'items':>6} {'kept':>5} {'on-topic kept':>14} {'rank time':>10} "
+        f"{'tokens before':>14} {'after':>7} {'saved':>6}"
+    )
+    for count in (500, 1000, 2000, 5000):
+        items, relevant = make_items(count)
+        split = count * 3 // 4
+        news_data = {"international": items[:split], "domestic": items[split:]}
+
+        start = time.perf_counter()
+        selected = ranker.select(news_data, max_candidates=120, now=NOW)
+        elapsed = time.perf_counter() - start
+
+        kept = {id(item) for section in selected.values() for item in section}
+        on_topic = sum(1 for item, flag in zip(items, relevant) if flag and id(item) in kept)
+        before, _ = NewsGenerator._format_news_with_ids(None, news_data)
+        after, _ = NewsGenerator._format_news_with_ids(None, selected)
+        print(
+            f"{count:>6} {len(kept):>5} {on_topic / len(kept):>14.0%} "
+            f"{elapsed * 1000:>8.0f}ms {estimate_tokens(before):>14} "
+            f"{estimate_tokens(after):>7} {1 - len(after) / len(before):>6.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
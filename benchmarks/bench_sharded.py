@@ -0,0 +1,125 @@
+"""
+Benchmark sharded multi-process fetching on synthetic feeds
+
+Feeds are served from a generated fixture bundle with zero latency, so the
+run is CPU-bound (XML parsing and text cleaning) like a 1,000+ feed
+registry on a fast network.
+
+Usage: python -m benchmarks.bench_sharded [feeds] [items_per_feed]
+"""
+
+import gzip
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from xml.sax.saxutils import escape
+from src.http_fixtures import FixtureHttpClient, fixture_key
+from src.news.fetcher import NewsFetcher
+from src.news.host_scheduler import HostScheduler
+from src.news.sharded import ShardedFetcher
+
+CORPUS_PATH = Path(__file__).parent / "data" / "feed_descriptions.json"
+FEEDS_PER_HOST = 4
+
+
+def quiet_logs() -> None:
+    """Silence per-feed logging (also in worker processes)"""
+    for name in list(logging.root.manager.loggerDict):
+        if name.startswith("src."):
+            logging.getLogger(name).setLevel(logging.WARNING)
+
+
+def build_bundle(fixture_dir: Path, feed_count: int, items_per_feed: int) -> dict:
+    """Write a replay bundle of synthetic RSS feeds; return name -> URL"""
+    descriptions = json.loads(CORPUS_PATH.read_text(encoding="utf-8"))
+    rng = random.Random(19)
+    index = {}
+    feeds = {}
+    for feed in range(feed_count):
+        url = f"https://feeds{feed // FEEDS_PER_HOST}.example.com/rss/{feed}.xml"
+        items = "".join(
+            f"<item><title>Story {feed}-{i} &amp; more</title>"
+            f"<link>https://example.com/{feed}/{i}</link>"
+            f"<description>{escape(rng.choice(descriptions))}</description>"
+            f"<pubDate>Mon, 13 Oct 2025 {i % 24:02d}:00:00 GMT</pubDate></item>"
+            for i in range(items_per_feed)
+        )
+        body = (
+            f'<?xml version="1.0"?><rss version="2.0"><channel><title>Feed {feed}</title>'
+            f"{items}</channel></rss>"
+        ).encode("utf-8")
+        key = fixture_key("GET", url)
+        body_file = f"{key[:32]}.body.gz"
+        (fixture_dir / body_file).write_bytes(gzip.compress(body))
+        index[key] = {
+            "method": "GET",
+            "url": url,
+            "status": 200,
+            "reason": "OK",
+            "headers": {"Content-Type": "application/rss+xml"},
+            "latency": 0.0,
+            "size": len(body),
+            "body_file": body_file,
+            "recorded_at": "2025-10-13T00:00:00",
+        }
+        feeds[f"Feed {feed}"] = url
+    (fixture_dir / "index.json").write_text(json.dumps(index), encoding="utf-8")
+    return feeds
+
+
+def bench_fetcher(fixture_dir: str) -> NewsFetcher:
+    """Build a fetcher that replays the bundle (also used in worker processes)"""
+    quiet_logs()
+    return NewsFetcher(
+        http_client=FixtureHttpClient("replay", fixture_dir=fixture_dir, latency_scale=0),
+        host_scheduler=HostScheduler(max_in_flight=FEEDS_PER_HOST),
+        max_workers=8,
+    )
+
+
+def main() -> None:
+    feed_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    items_per_feed = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    cpus = os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as tmp:
+        fixture_dir = Path(tmp)
+        feeds = build_bundle(fixture_dir, feed_count, items_per_feed)
+        print(f"{feed_count} feeds x {items_per_feed} items, {cpus} CPUs")
+
+        fetcher = bench_fetcher(str(fixture_dir))
+        start = time.perf_counter()
+        results = fetcher.fetch_feeds(feeds, max_items=items_per_feed)
+        baseline = time.perf_counter() - start
+        items = sum(len(feed_items) for feed_items in results.values())
+        print(f"  single process        {baseline:6.2f}s  ({items} items)")
+
+        for processes in sorted({1, 2, 4, cpus}):
+            sharded = ShardedFetcher(
+                processes=processes,
+                fetcher_factory=bench_fetcher,
+                factory_args=(str(fixture_dir),),
+            )
+            # Start the workers outside the timing
+            sharded.start()
+            start = time.perf_counter()
+            items = sum(
+                len(feed_items)
+                for _, feed_items in sharded.iter_feeds(feeds, max_items=items_per_feed)
+            )
+            elapsed = time.perf_counter() - start
+            sharded.close()
+            print(
+                f"  {processes} process(es)        {elapsed:6.2f}s  ({items} items, "
+                f"{baseline / elapsed:.2f}x)"
+            )
+
+
+if __name__ == "__main__":
+    quiet_logs()
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark feed description cleaning: legacy tag stripping vs clean_text
+
+Usage: python -m benchmarks.bench_text
+"""
+
+import html
+import json
+import re
+import time
+from pathlib import Path
+from src.news.ranker import estimate_tokens
+from src.news.text import clean_text
+
+CORPUS_PATH = Path(__file__).parent / "data" / "feed_descriptions.json"
+ROUNDS = 2000
+
+# Inputs with the expected clean_text output: text that looks a bit like
+# markup must survive, real (or cut-off) markup must not
+SANITY_CASES = [
+    ("Price < 10", "Price < 10"),
+    ("5 < 6 and 7 > 3", "5 < 6 and 7 > 3"),
+    ("Rates rose as CPI<Target for the third month, analysts said.",
+     "Rates rose as CPI<Target for the third month, analysts said."),
+    ("a<b", "a<b"),
+    ("<p>First</p><p>Second</p>", "First Second"),
+    ("Open<b>AI</b> &amp; partners&nbsp;said", "OpenAI & partners said"),
+    ('Read more at <a href="https://example.com/story', "Read more at"),
+]
+
+
+def legacy_clean(text: str) -> str:
+    """The previous NewsFetcher._clean_html: tags only, regex compiled per call"""
+    import re
+
+    clean = re.compile("<.*?>")
+    return re.sub(clean, "", text).strip()
+
+
+def multi_pass_clean(text: str, max_chars: int) -> str:
+    """Separate passes for tags, entities, whitespace and truncation"""
+    text = re.sub(r"<[^>]*>", " ", text)
+    text = html.unescape(text)
+    text = " ".join(text.split())
+    return text[:max_chars]
+
+
+def run(clean, corpus, rounds):
+    """Clean the corpus repeatedly; return (microseconds per item, output)"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        output = [clean(text) for text in corpus]
+    elapsed = time.perf_counter() - start
+    return elapsed / (rounds * len(corpus)) * 1e6, output
+
+
+def main():
+    corpus = json.loads(CORPUS_PATH.read_text(encoding="utf-8"))
+    raw_tokens = sum(estimate_tokens(text) for text in corpus)
+    candidates = [
+        ("legacy (tags only)", legacy_clean),
+        ("multi-pass", lambda text: multi_pass_clean(text, 1000)),
+        ("clean_text", lambda text: clean_text(text, 1000)),
+    ]
+
+    print(f"{len(corpus)} descriptions, ~{raw_tokens} raw tokens, {ROUNDS} rounds")
+    print(
+        f"{'cleaner':<20} {'us/item':>8} {'tokens':>7} {'leftover markup':>16} "
+        f"{'sanity':>7}"
+    )
+    for name, clean in candidates:
+        per_item, output = run(clean, corpus, ROUNDS)
+        sanity = sum(clean(text) == expected for text, expected in SANITY_CASES)
+        tokens = sum(estimate_tokens(text) for text in output)
+        # A "<" that doesn't open a tag is text (e.g. "< 200 ms"), not markup
+        leftovers = sum(
+            len(re.findall(r"&[#\w]+;|<[A-Za-z/!?][^>]*>|\s{2,}", text)) for text in output
+        )
+        print(
+            f"{name:<20} {per_item:>8.1f} {tokens:>7} {leftovers:>16} "
+            f"{sanity:>4}/{len(SANITY_CASES)}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,19 @@ Generates and distributes daily news digests using configurable LLM providers.
 
 import sys
 from datetime import datetime
+from typing import Dict, List
 from src.config import Config
+from src.language_runner import LanguageRunner
+from src.llm_providers import CachingProvider, ResponseCache
 from src.logger import setup_logger
-from src.news import NewsGenerator
+from src.http_fixtures import create_http_client
+from src.news import (
+    NewsGenerator,
+    NewsFetcher,
+    RunPlanner,
+    FetchQuorum,
+    ShardedFetcher,
+)
 from src.notifiers import (
     EmailNotifier,
     WebhookNotifier,
@@ -41,162 +51,321 @@ def main():
             logger.info(f"LLM Model: {config.llm_model}")
         logger.info(f"Languages: {', '.join(languages)}")
         logger.info(f"Web Search: {config.enable_web_search}")
+        logger.info(f"Parallel languages: {config.max_parallel_languages}")
         logger.info("=" * 60)
 
-        # Initialize news generator once
-        logger.info("Initializing news generator...")
-        news_gen = NewsGenerator(
-            provider_name=config.llm_provider,
-            api_key=config.llm_api_key,
-            model=config.llm_model,
-            enable_web_search=config.enable_web_search,
-        )
+        # Shared keep-alive HTTP connections for feeds, search and notifiers
+        http_client = create_http_client(config)
 
-        # Get enabled notification methods
-        notification_methods = config.notification_methods
-        logger.info(f"Enabled notification methods: {notification_methods}")
+        # Split very large feed sets across worker processes (not while
+        # recording fixtures: workers would overwrite each other's index)
+        sharded_fetcher = None
+        if config.fetch_processes > 1 and config.http_fixtures_mode != "record":
+            sharded_fetcher = ShardedFetcher(
+                processes=config.fetch_processes,
+                factory_args=(str(config.config_path),),
+                min_feeds=config.fetch_shard_min_feeds,
+            )
 
-        # Track overall results
-        overall_results = {"sent": [], "failed": []}
+        news_gen = None
+        try:
+            # Initialize news generator once
+            logger.info("Initializing news generator...")
+            news_gen = NewsGenerator(
+                provider_name=config.llm_provider,
+                api_key=config.llm_api_key,
+                model=config.llm_model,
+                enable_web_search=config.enable_web_search,
+                http_client=http_client,
+                max_concurrent_requests=config.llm_max_concurrent_requests,
+                requests_per_minute=config.llm_requests_per_minute,
+                prompt_caching=config.llm_prompt_caching,
+                response_cache=(
+                    ResponseCache(
+                        cache_dir=config.llm_cache_dir,
+                        ttl_hours=config.llm_cache_ttl_hours,
+                        max_size_mb=config.llm_cache_max_size_mb,
+                        bypass=config.llm_cache_bypass,
+                    )
+                    if config.llm_cache_enabled
+                    else None
+                ),
+                news_fetcher=NewsFetcher.from_config(
+                    config, http_client=http_client, sharded_fetcher=sharded_fetcher
+                ),
+            )
 
-        # Process each language
-        for language in languages:
-            logger.info("=" * 60)
-            logger.info(f"Processing language: {language.upper()}")
-            logger.info("=" * 60)
+            # Get enabled notification methods
+            notification_methods = config.notification_methods
+            logger.info(f"Enabled notification methods: {notification_methods}")
+
+            # Start Stage 1 before the slowest feeds finish if a quorum is set
+            quorum = None
+            if config.fetch_quorum_enabled:
+                quorum = FetchQuorum(
+                    min_fraction=config.fetch_quorum_min_fraction,
+                    min_items=config.fetch_quorum_min_items,
+                    deadline_seconds=config.fetch_quorum_deadline,
+                )
 
-            try:
-                # Generate news digest for this language
+            # Fetch every feed needed by all languages once, up front (in the
+            # background with a quorum, so the first language can start early)
+            logger.info("Fetching news sources for all languages...")
+            news_pool = RunPlanner(news_gen.news_fetcher).execute(
+                languages,
+                max_items_per_source=config.max_items_per_source,
+                background=quorum is not None,
+            )
+            if quorum is None:
                 logger.info(
-                    f"Generating AI news digest in {language.upper()} from real-time sources..."
+                    f"Fetched {news_pool.item_count} items from {len(news_pool)} feeds"
                 )
-                news_digest = news_gen.generate_news_digest_from_sources(
+                if news_gen.news_fetcher.feed_cache is not None:
+                    logger.info(news_gen.news_fetcher.feed_cache.summary())
+
+            # Select among the international news once for every language
+            shared_selection = None
+            if (
+                config.shared_selection_enabled
+                and len(languages) > 1
+                and not config.translation_enabled
+            ):
+                try:
+                    shared_selection = news_gen.select_shared_items(
+                        languages,
+                        max_items_per_source=config.max_items_per_source,
+                        stage1_template=config.stage1_prompt_template,
+                        news_pool=news_pool,
+                        dedup_max_distance=config.dedup_max_distance,
+                        only_new_items=config.only_new_items,
+                        max_age_hours=config.max_age_hours,
+                        sort_by_freshness=config.sort_by_freshness,
+                        max_candidates=config.prerank_max_candidates,
+                        topics=config.news_topics,
+                        source_weights=config.prerank_source_weights,
+                        quorum=quorum,
+                        late_items=config.fetch_late_items,
+                        max_late_items=config.fetch_max_late_items,
+                        followup_template=config.stage1_followup_prompt_template,
+                    )
+                except Exception as selection_error:
+                    logger.warning(
+                        f"Shared selection failed ({str(selection_error)}); "
+                        f"running Stage 1 per language"
+                    )
+
+            def generate_digest(language: str) -> str:
+                """Generate one language's digest from the fetched sources"""
+                return news_gen.generate_news_digest_from_sources(
                     language=language,
                     max_items_per_source=config.max_items_per_source,
                     stage1_template=config.stage1_prompt_template,
                     stage2_template=config.stage2_prompt_template,
+                    news_pool=news_pool,
+                    dedup_max_distance=config.dedup_max_distance,
+                    only_new_items=config.only_new_items,
+                    max_age_hours=config.max_age_hours,
+                    sort_by_freshness=config.sort_by_freshness,
+                    max_candidates=config.prerank_max_candidates,
+                    topics=config.news_topics,
+                    source_weights=config.prerank_source_weights,
+                    quorum=quorum,
+                    late_items=config.fetch_late_items,
+                    max_late_items=config.fetch_max_late_items,
+                    followup_template=config.stage1_followup_prompt_template,
+                    shared_selection=shared_selection,
+                    max_domestic_items=config.shared_selection_max_domestic_items,
+                    domestic_template=config.stage1_domestic_prompt_template,
                 )
 
+            # Translate-once mode: generate the primary language's digest from
+            # the sources, then translate it instead of generating the others
+            primary_language = None
+            primary_digest = None
+            if config.translation_enabled and len(languages) > 1:
+                primary_language = config.translation_primary_language or languages[0]
+                if primary_language not in languages:
+                    raise ValueError(
+                        f"Translation primary language '{primary_language}' "
+                        f"is not in languages: {', '.join(languages)}"
+                    )
                 logger.info(
-                    f"News digest generated for {language.upper()} ({len(news_digest)} characters)"
+                    f"Translate-once mode: generating {primary_language.upper()}, "
+                    f"translating into the other languages"
                 )
-                logger.info("-" * 60)
-                logger.info(f"News Digest Preview ({language.upper()}):")
-                logger.info("-" * 60)
-                # Print first 500 characters as preview
-                preview = (
-                    news_digest[:500] + "..." if len(news_digest) > 500 else news_digest
-                )
-                logger.info(preview)
-                logger.info("-" * 60)
-
-                # Track notification results for this language
-                lang_results = {"sent": [], "failed": []}
-
-                # Send email notification if enabled
-                if "email" in notification_methods:
-                    logger.info(f"Sending email notification for {language.upper()}...")
-                    email_notifier = EmailNotifier()
-                    if email_notifier.send(news_digest, language=language):
-                        lang_results["sent"].append("email")
-                        logger.info(
-                            f"Email notification sent successfully for {language.upper()}"
-                        )
-                    else:
-                        lang_results["failed"].append("email")
-                        logger.warning(
-                            f"Email notification failed for {language.upper()}"
-                        )
+                try:
+                    primary_digest = generate_digest(primary_language)
+                except Exception as primary_error:
+                    logger.warning(
+                        f"Primary digest failed ({str(primary_error)}); "
+                        f"generating each language separately"
+                    )
+
+            # Process each language (several at a time if configured)
+            def process_language(language: str) -> Dict[str, List[str]]:
+                """Generate and send one language's digest; return its notification results"""
+                logger.info("=" * 60)
+                logger.info(f"Processing language: {language.upper()}")
+                logger.info("=" * 60)
 
-                # Send webhook notification if enabled
-                if "webhook" in notification_methods:
+                try:
+                    # Generate news digest for this language
                     logger.info(
-                        f"Sending webhook notification for {language.upper()}..."
+                        f"Generating AI news digest in {language.upper()} from real-time sources..."
                     )
-                    webhook_notifier = WebhookNotifier()
-                    if webhook_notifier.send(news_digest, language=language):
-                        lang_results["sent"].append("webhook")
-                        logger.info(
-                            f"Webhook notification sent successfully for {language.upper()}"
+                    if language == primary_language and primary_digest is not None:
+                        news_digest = primary_digest
+                    elif primary_digest is not None:
+                        news_digest = news_gen.translate_digest(
+                            primary_digest,
+                            language,
+                            source_language=primary_language,
+                            template=config.translation_prompt_template,
                         )
                     else:
-                        lang_results["failed"].append("webhook")
-                        logger.warning(
-                            f"Webhook notification failed for {language.upper()}"
-                        )
+                        news_digest = generate_digest(language)
 
-                # Send Slack notification if enabled
-                if "slack" in notification_methods:
-                    logger.info(f"Sending Slack notification for {language.upper()}...")
-                    slack_notifier = SlackNotifier()
-                    if slack_notifier.send(news_digest, language=language):
-                        lang_results["sent"].append("slack")
-                        logger.info(
-                            f"Slack notification sent successfully for {language.upper()}"
-                        )
-                    else:
-                        lang_results["failed"].append("slack")
-                        logger.warning(
-                            f"Slack notification failed for {language.upper()}"
-                        )
-
-                # Send Telegram notification if enabled
-                if "telegram" in notification_methods:
                     logger.info(
-                        f"Sending Telegram notification for {language.upper()}..."
+                        f"News digest generated for {language.upper()} ({len(news_digest)} characters)"
+                    )
+                    logger.info("-" * 60)
+                    logger.info(f"News Digest Preview ({language.upper()}):")
+                    logger.info("-" * 60)
+                    # Print first 500 characters as preview
+                    preview = (
+                        news_digest[:500] + "..." if len(news_digest) > 500 else news_digest
                     )
-                    telegram_notifier = TelegramNotifier()
-                    if telegram_notifier.send(news_digest, language=language):
-                        lang_results["sent"].append("telegram")
+                    logger.info(preview)
+                    logger.info("-" * 60)
+
+                    # Track notification results for this language
+                    lang_results = {"sent": [], "failed": []}
+
+                    # Send email notification if enabled
+                    if "email" in notification_methods:
+                        logger.info(f"Sending email notification for {language.upper()}...")
+                        email_notifier = EmailNotifier()
+                        if email_notifier.send(news_digest, language=language):
+                            lang_results["sent"].append("email")
+                            logger.info(
+                                f"Email notification sent successfully for {language.upper()}"
+                            )
+                        else:
+                            lang_results["failed"].append("email")
+                            logger.warning(
+                                f"Email notification failed for {language.upper()}"
+                            )
+
+                    # Send webhook notification if enabled
+                    if "webhook" in notification_methods:
                         logger.info(
-                            f"Telegram notification sent successfully for {language.upper()}"
+                            f"Sending webhook notification for {language.upper()}..."
                         )
-                    else:
-                        lang_results["failed"].append("telegram")
-                        logger.warning(
-                            f"Telegram notification failed for {language.upper()}"
+                        webhook_notifier = WebhookNotifier(http_client=http_client)
+                        if webhook_notifier.send(news_digest, language=language):
+                            lang_results["sent"].append("webhook")
+                            logger.info(
+                                f"Webhook notification sent successfully for {language.upper()}"
+                            )
+                        else:
+                            lang_results["failed"].append("webhook")
+                            logger.warning(
+                                f"Webhook notification failed for {language.upper()}"
+                            )
+
+                    # Send Slack notification if enabled
+                    if "slack" in notification_methods:
+                        logger.info(f"Sending Slack notification for {language.upper()}...")
+                        slack_notifier = SlackNotifier(http_client=http_client)
+                        if slack_notifier.send(news_digest, language=language):
+                            lang_results["sent"].append("slack")
+                            logger.info(
+                                f"Slack notification sent successfully for {language.upper()}"
+                            )
+                        else:
+                            lang_results["failed"].append("slack")
+                            logger.warning(
+                                f"Slack notification failed for {language.upper()}"
+                            )
+
+                    # Send Telegram notification if enabled
+                    if "telegram" in notification_methods:
+                        logger.info(
+                            f"Sending Telegram notification for {language.upper()}..."
                         )
+                        telegram_notifier = TelegramNotifier(http_client=http_client)
+                        if telegram_notifier.send(news_digest, language=language):
+                            lang_results["sent"].append("telegram")
+                            logger.info(
+                                f"Telegram notification sent successfully for {language.upper()}"
+                            )
+                        else:
+                            lang_results["failed"].append("telegram")
+                            logger.warning(
+                                f"Telegram notification failed for {language.upper()}"
+                            )
 
-                # Send Discord notification if enabled
-                if "discord" in notification_methods:
-                    logger.info(
-                        f"Sending Discord notification for {language.upper()}..."
-                    )
-                    discord_notifier = DiscordNotifier()
-                    if discord_notifier.send(news_digest, language=language):
-                        lang_results["sent"].append("discord")
+                    # Send Discord notification if enabled
+                    if "discord" in notification_methods:
                         logger.info(
-                            f"Discord notification sent successfully for {language.upper()}"
+                            f"Sending Discord notification for {language.upper()}..."
                         )
-                    else:
-                        lang_results["failed"].append("discord")
-                        logger.warning(
-                            f"Discord notification failed for {language.upper()}"
+                        discord_notifier = DiscordNotifier(http_client=http_client)
+                        if discord_notifier.send(news_digest, language=language):
+                            lang_results["sent"].append("discord")
+                            logger.info(
+                                f"Discord notification sent successfully for {language.upper()}"
+                            )
+                        else:
+                            lang_results["failed"].append("discord")
+                            logger.warning(
+                                f"Discord notification failed for {language.upper()}"
+                            )
+
+                    # Only a delivered digest counts for only_new_items, so a
+                    # rerun after failed notifications sends the same items.
+                    # Translated digests record the primary language's
+                    # candidate count, since that is what they were built from
+                    item_store = news_gen.news_fetcher.item_store
+                    if item_store is not None and lang_results["sent"]:
+                        item_store.record_digest(
+                            language,
+                            news_gen.digest_stats.get(language, {}).get("candidates", 0),
                         )
 
-                # Update overall results
-                for method in lang_results["sent"]:
-                    result_key = f"{method} ({language.upper()})"
-                    if result_key not in overall_results["sent"]:
-                        overall_results["sent"].append(result_key)
+                    logger.info(f"Language {language.upper()} completed successfully")
+                    return lang_results
+
+                except Exception as lang_error:
+                    logger.error(
+                        f"Error processing language {language.upper()}: {str(lang_error)}",
+                        exc_info=True,
+                    )
+                    # Mark all notification methods as failed for this language
+                    return {"sent": [], "failed": list(notification_methods)}
 
-                for method in lang_results["failed"]:
-                    result_key = f"{method} ({language.upper()})"
-                    if result_key not in overall_results["failed"]:
-                        overall_results["failed"].append(result_key)
+            results = LanguageRunner(
+                max_parallel=config.max_parallel_languages
+            ).run(languages, process_language)
 
-                logger.info(f"Language {language.upper()} completed successfully")
+            # Track overall results, in language order
+            overall_results = {"sent": [], "failed": []}
+            for language, lang_results in results.items():
+                for status in ("sent", "failed"):
+                    for method in lang_results[status]:
+                        result_key = f"{method} ({language.upper()})"
+                        if result_key not in overall_results[status]:
+                            overall_results[status].append(result_key)
+        finally:
+            # Let background feed revalidations refresh the cache for the
+            # next run, and stop the worker processes even if the run failed
+            if news_gen is not None:
+                news_gen.news_fetcher.wait_for_revalidation(timeout=config.fetch_timeout)
+            if sharded_fetcher is not None:
+                sharded_fetcher.close()
 
-            except Exception as lang_error:
-                logger.error(
-                    f"Error processing language {language.upper()}: {str(lang_error)}",
-                    exc_info=True,
-                )
-                # Mark all notification methods as failed for this language
-                for method in notification_methods:
-                    result_key = f"{method} ({language.upper()})"
-                    if result_key not in overall_results["failed"]:
-                        overall_results["failed"].append(result_key)
+        if quorum is not None and news_gen.news_fetcher.feed_cache is not None:
+            logger.info(news_gen.news_fetcher.feed_cache.summary())
 
         # Final Summary
         logger.info("=" * 60)
@@ -209,6 +378,17 @@ def main():
         )
         if overall_results["failed"]:
             logger.warning(f"Failed to send: {', '.join(overall_results['failed'])}")
+        if primary_digest is not None:
+            tokens_saved = sum(
+                stats.get("tokens_saved", 0) for stats in news_gen.digest_stats.values()
+            )
+            logger.info(
+                f"Translation saved ~{tokens_saved} prompt tokens versus separate Stage 2 runs"
+            )
+        logger.info(http_client.summary())
+        logger.info(news_gen.provider.usage_summary())
+        if isinstance(news_gen.provider, CachingProvider):
+            logger.info(news_gen.provider.cache.summary())
         logger.info("=" * 60)
 
         # Return exit code based on results
@@ -14,6 +14,7 @@ logger = setup_logger(__name__)
 
 # Supported language codes and their display names
 LANGUAGE_NAMES = {
+    "en": "English",
     "zh": "Chinese (中文)",
     "es": "Spanish (Español)",
     "fr": "French (Français)",
@@ -133,12 +134,56 @@ CRITICAL: Select exactly 15-20 items. No more, no less."""
 
         return self.config_data.get("news", {}).get("stage1_prompt_template", default_template)
 
+    @property
+    def stage1_followup_prompt_template(self) -> str:
+        """Get the prompt template for selecting among feeds that missed the quorum"""
+        default_template = """{formatted_news}
+
+## YOUR TASK - FOLLOW-UP SELECTION
+
+The {total_items} news items above arrived after the main selection was made. The digest already covers these stories:
+
+{selected_titles}
+
+Select at most {max_items} of the items above that are important enough to add to the digest and are not already covered. Select none if none qualify.
+
+### OUTPUT FORMAT:
+Return ONLY a JSON array of selected news IDs (an empty array if none). No explanations, no markdown, just the JSON array.
+
+Example format:
+["LATE-INT-2", "LATE-DOM-1"]"""
+
+        return self.config_data.get("news", {}).get(
+            "stage1_followup_prompt_template", default_template
+        )
+
+    @property
+    def stage1_domestic_prompt_template(self) -> str:
+        """Get the prompt template for a language's domestic pass of a shared selection"""
+        default_template = """{formatted_news}
+
+## YOUR TASK - DOMESTIC NEWS SELECTION
+
+The {total_items} domestic news items above are candidates for a digest for {language_name} readers. The digest already covers these international stories:
+
+{selected_titles}
+
+Select at most {max_items} of the domestic items above that are important for {language_name} readers and not already covered. Select none if none qualify.
+
+### OUTPUT FORMAT:
+Return ONLY a JSON array of selected news IDs (an empty array if none). No explanations, no markdown, just the JSON array.
+
+Example format:
+["DOM-3", "DOM-1"]"""
+
+        return self.config_data.get("news", {}).get(
+            "stage1_domestic_prompt_template", default_template
+        )
+
     @property
     def stage2_prompt_template(self) -> str:
         """Get the Stage 2 summarization prompt template"""
-        default_template = """You are a senior AI industry analyst. Create a comprehensive, in-depth news digest for the {count} pre-selected news items below.
-
-{selected_news}
+        default_template = """You are a senior AI industry analyst. Create a comprehensive, in-depth news digest for the pre-selected news items at the end of this prompt.
 
 ## OUTPUT STRUCTURE:
 
@@ -165,7 +210,7 @@ For each news item:
 - Context and analysis
 
 ## QUALITY REQUIREMENTS:
-- ✅ Summarize ALL {count} items (no skipping)
+- ✅ Summarize ALL items (no skipping)
 - ✅ Each summary exactly 4-6 sentences
 - ✅ Include specific numbers and data
 - ✅ Balanced coverage across categories
@@ -175,10 +220,41 @@ For each news item:
 ❌ Generic statements
 ❌ Wrong summary length
 ❌ Missing links
-❌ Skipping items"""
+❌ Skipping items
+
+{selected_news}
+Write the digest for all {count} news items above."""
 
         return self.config_data.get("news", {}).get("stage2_prompt_template", default_template)
 
+    @property
+    def translation_prompt_template(self) -> str:
+        """Get the prompt template for translating a finished digest"""
+        default_template = """Translate the following news digest from {source_language_name} into {language_name}.
+
+- Keep the markdown structure exactly: headings, bold text, lists, links and line breaks
+- Keep every placeholder such as {{{{URL-1}}}} exactly as it is; they stand for links
+- Keep source names, product names and company names as they are
+- Translate everything else naturally for {language_name} readers
+- Output only the translated digest, with no notes before or after
+
+{digest}"""
+
+        return self.config_data.get("news", {}).get(
+            "translation_prompt_template", default_template
+        )
+
+    @property
+    def translation_enabled(self) -> bool:
+        """Whether to translate the primary language digest instead of generating the others"""
+        return bool(self.get("news.translation.enabled", False))
+
+    @property
+    def translation_primary_language(self) -> Optional[str]:
+        """Language generated from sources in translate-once mode (None = first language)"""
+        value = self.get("news.translation.primary_language")
+        return str(value).strip().lower() if value else None
+
     @property
     def log_level(self) -> str:
         """Get logging level"""
@@ -236,6 +312,261 @@ For each news item:
         """Maximum news items to fetch per source"""
         return self.config_data.get("news", {}).get("max_items_per_source", 5)
 
+    @property
+    def feed_registry_path(self) -> Optional[str]:
+        """Feed registry file (None = the bundled src/news/feeds.yaml)"""
+        return self.get("news.feeds.registry") or None
+
+    @property
+    def fetch_max_workers(self) -> int:
+        """Maximum number of RSS feeds fetched concurrently"""
+        return int(self.get("news.fetch.max_workers", 10))
+
+    @property
+    def fetch_processes(self) -> int:
+        """Worker processes for sharded fetching of large feed sets (1 = off)"""
+        return max(1, int(self.get("news.fetch.processes", 1)))
+
+    @property
+    def fetch_shard_min_feeds(self) -> int:
+        """Smallest feed batch that is split across worker processes"""
+        return int(self.get("news.fetch.shard_min_feeds", 200))
+
+    @property
+    def fetch_max_per_host(self) -> int:
+        """Maximum concurrent RSS requests to a single host"""
+        return int(self.get("news.fetch.max_per_host", 4))
+
+    @property
+    def fetch_host_limits(self) -> Dict[str, Dict[str, float]]:
+        """Per-host max_in_flight, requests_per_minute and burst overrides"""
+        return self.get("news.fetch.hosts", {}) or {}
+
+    @property
+    def fetch_max_retry_wait(self) -> float:
+        """Retry a throttled feed once if its host asks to wait at most this long"""
+        return float(self.get("news.fetch.max_retry_wait", 30))
+
+    @property
+    def fetch_throttle_cooldown(self) -> float:
+        """Seconds to pause a throttling host that sends no Retry-After"""
+        return float(self.get("news.fetch.throttle_cooldown", 120))
+
+    @property
+    def fetch_hedge_requests(self) -> bool:
+        """Whether to send a second request for feeds slower than usual"""
+        return bool(self.get("news.fetch.hedging.enabled", False))
+
+    @property
+    def fetch_hedge_percentile(self) -> float:
+        """Latency percentile of a feed after which its request is hedged"""
+        return float(self.get("news.fetch.hedging.percentile", 90))
+
+    @property
+    def fetch_max_hedge_ratio(self) -> float:
+        """Maximum share of feed requests that may be hedged"""
+        return float(self.get("news.fetch.hedging.max_ratio", 0.1))
+
+    @property
+    def fetch_min_hedge_delay(self) -> float:
+        """Minimum seconds before a feed request is hedged"""
+        return float(self.get("news.fetch.hedging.min_delay", 0.5))
+
+    @property
+    def fetch_quorum_enabled(self) -> bool:
+        """Whether Stage 1 may start before every feed has answered"""
+        return bool(self.get("news.fetch.quorum.enabled", False))
+
+    @property
+    def fetch_quorum_min_fraction(self) -> float:
+        """Share of a language's feeds that must be in before Stage 1 starts"""
+        return float(self.get("news.fetch.quorum.min_fraction", 0.8))
+
+    @property
+    def fetch_quorum_min_items(self) -> Optional[int]:
+        """Start Stage 1 once this many items are in (None = no item quorum)"""
+        value = self.get("news.fetch.quorum.min_items", 0)
+        return int(value) if value else None
+
+    @property
+    def fetch_quorum_deadline(self) -> Optional[float]:
+        """Start Stage 1 this many seconds after fetching began (None = no deadline)"""
+        value = self.get("news.fetch.quorum.deadline_seconds", 5)
+        return float(value) if value else None
+
+    @property
+    def fetch_late_items(self) -> str:
+        """What to do with feeds that miss the quorum: 'merge' or 'drop'"""
+        value = str(self.get("news.fetch.quorum.late_items", "merge")).lower()
+        if value not in ("merge", "drop"):
+            raise ValueError(f"Invalid news.fetch.quorum.late_items: {value} (expected 'merge' or 'drop')")
+        return value
+
+    @property
+    def fetch_max_late_items(self) -> int:
+        """Maximum number of late items the follow-up selection may add"""
+        return int(self.get("news.fetch.quorum.max_late_items", 3))
+
+    @property
+    def fetch_max_feed_bytes(self) -> int:
+        """Maximum number of bytes read from a single feed"""
+        return int(self.get("news.fetch.max_feed_kb", 5120)) * 1024
+
+    @property
+    def fetch_parser(self) -> str:
+        """Default feed parser backend: 'etree', 'lxml' or 'feedparser'"""
+        value = str(self.get("news.fetch.parser", "etree")).lower()
+        if value not in ("etree", "lxml", "feedparser"):
+            raise ValueError(
+                f"Invalid news.fetch.parser: {value} (expected 'etree', 'lxml' or 'feedparser')"
+            )
+        return value
+
+    @property
+    def fetch_max_description_chars(self) -> Optional[int]:
+        """Truncate feed descriptions near this many characters (None = no limit)"""
+        value = self.get("news.fetch.max_description_chars", 1000)
+        return int(value) if value else None
+
+    @property
+    def feed_cache_enabled(self) -> bool:
+        """Whether to cache feeds on disk and revalidate with conditional GETs"""
+        return bool(self.get("news.cache.enabled", True))
+
+    @property
+    def feed_cache_dir(self) -> str:
+        """Directory for the on-disk feed cache"""
+        return self.get("news.cache.dir", ".cache/feeds")
+
+    @property
+    def feed_max_stale_hours(self) -> Optional[float]:
+        """Serve a failed feed's last-good snapshot up to this age (None = never)"""
+        value = self.get("news.cache.max_stale_hours", 24)
+        return float(value) if value else None
+
+    @property
+    def feed_revalidate_in_background(self) -> bool:
+        """Retry failed feeds in the background to refresh their snapshots"""
+        return bool(self.get("news.cache.revalidate_in_background", True))
+
+    @property
+    def fetch_timeout(self) -> float:
+        """Request timeout for a single feed in seconds"""
+        return float(self.get("news.fetch.timeout", 10))
+
+    @property
+    def feed_health_enabled(self) -> bool:
+        """Whether to track feed health for adaptive timeouts and circuit breaking"""
+        return bool(self.get("news.health.enabled", True))
+
+    @property
+    def feed_health_path(self) -> str:
+        """File holding the persisted feed health records"""
+        return self.get("news.health.path", ".cache/feed_health.json")
+
+    @property
+    def feed_health_failure_threshold(self) -> int:
+        """Consecutive failures before a feed is skipped"""
+        return int(self.get("news.health.failure_threshold", 3))
+
+    @property
+    def feed_health_backoff_minutes(self) -> float:
+        """Delay before re-probing a skipped feed (doubles on each failed probe)"""
+        return float(self.get("news.health.backoff_minutes", 30))
+
+    @property
+    def dedup_max_distance(self) -> Optional[int]:
+        """SimHash distance for merging near-duplicate stories (None = disabled)"""
+        if not self.get("news.dedup.enabled", True):
+            return None
+        return int(self.get("news.dedup.max_distance", 3))
+
+    @property
+    def prerank_max_candidates(self) -> Optional[int]:
+        """Maximum pre-ranked items sent to Stage 1 (None = send all)"""
+        if not self.get("news.prerank.enabled", True):
+            return None
+        return int(self.get("news.prerank.max_candidates", 120))
+
+    @property
+    def prerank_source_weights(self) -> Dict[str, float]:
+        """Pre-ranker score multiplier per source name"""
+        weights = self.get("news.prerank.source_weights", {}) or {}
+        return {name: float(weight) for name, weight in weights.items()}
+
+    @property
+    def item_store_enabled(self) -> bool:
+        """Whether to record fetched items in the local SQLite item store"""
+        return bool(self.get("news.item_store.enabled", True))
+
+    @property
+    def item_store_path(self) -> str:
+        """SQLite file of the item store"""
+        return self.get("news.item_store.path", ".cache/items.db")
+
+    @property
+    def shared_selection_enabled(self) -> bool:
+        """Whether to run Stage 1 once over the international news for all languages"""
+        return bool(self.get("news.shared_selection.enabled", False))
+
+    @property
+    def shared_selection_max_domestic_items(self) -> int:
+        """Maximum domestic items each language's pass adds to the shared selection"""
+        return int(self.get("news.shared_selection.max_domestic_items", 5))
+
+    @property
+    def only_new_items(self) -> bool:
+        """Only send items first seen since the last digest to the LLM"""
+        return bool(self.get("news.item_store.only_new_items", False))
+
+    @property
+    def max_age_hours(self) -> Optional[float]:
+        """Drop items published longer ago than this many hours (None = keep all)"""
+        value = self.get("news.max_age_hours", 72)
+        return float(value) if value else None
+
+    @property
+    def sort_by_freshness(self) -> bool:
+        """Order candidate items newest first before Stage 1"""
+        return bool(self.get("news.sort_by_freshness", True))
+
+    @property
+    def http_pool_connections(self) -> int:
+        """Number of per-host HTTP connection pools kept alive"""
+        return int(self.get("http.pool_connections", 32))
+
+    @property
+    def http_pool_maxsize(self) -> int:
+        """Maximum idle keep-alive connections per host"""
+        return int(self.get("http.pool_maxsize", 10))
+
+    @property
+    def http_max_retries(self) -> int:
+        """Retries for failed HTTP connection attempts"""
+        return int(self.get("http.max_retries", 0))
+
+    @property
+    def http_fixtures_mode(self) -> str:
+        """HTTP fixture mode: 'off', 'record' or 'replay'"""
+        # Check environment variable first, then config file
+        mode = os.getenv("HTTP_FIXTURES", "").strip().lower()
+        if not mode:
+            # An unquoted 'off' in YAML loads as False
+            mode = str(self.get("http.fixtures.mode") or "off").strip().lower()
+        return mode
+
+    @property
+    def http_fixtures_dir(self) -> str:
+        """Directory of the HTTP fixture bundle"""
+        return os.getenv("HTTP_FIXTURES_DIR", "").strip() or self.get(
+            "http.fixtures.dir", "fixtures/http"
+        )
+
+    @property
+    def http_fixtures_latency_scale(self) -> float:
+        """Multiplier for recorded latencies when replaying (0 = instant)"""
+        return float(self.get("http.fixtures.latency_scale", 1.0))
+
     @property
     def llm_provider(self) -> str:
         """Get the LLM provider to use (claude or deepseek)"""
@@ -254,6 +585,59 @@ For each news item:
             return env_model
         return self.config_data.get("llm", {}).get("model")
 
+    @property
+    def llm_max_concurrent_requests(self) -> Optional[int]:
+        """Maximum LLM calls in flight at once (None = unlimited)"""
+        value = self.get("llm.max_concurrent_requests", 3)
+        return int(value) if value else None
+
+    @property
+    def llm_requests_per_minute(self) -> Optional[float]:
+        """Maximum LLM calls started per minute (None = unlimited)"""
+        value = self.get("llm.requests_per_minute", 0)
+        return float(value) if value else None
+
+    @property
+    def llm_cache_enabled(self) -> bool:
+        """Whether to cache LLM responses on disk for identical requests"""
+        return bool(self.get("llm.response_cache.enabled", True))
+
+    @property
+    def llm_cache_dir(self) -> str:
+        """Directory for the on-disk LLM response cache"""
+        return self.get("llm.response_cache.dir", ".cache/llm")
+
+    @property
+    def llm_cache_ttl_hours(self) -> Optional[float]:
+        """Age after which a cached LLM response expires (None = never)"""
+        value = self.get("llm.response_cache.ttl_hours", 24)
+        return float(value) if value else None
+
+    @property
+    def llm_cache_max_size_mb(self) -> Optional[float]:
+        """Size of the LLM response cache above which old entries are evicted (None = unbounded)"""
+        value = self.get("llm.response_cache.max_size_mb", 50)
+        return float(value) if value else None
+
+    @property
+    def llm_cache_bypass(self) -> bool:
+        """Whether to skip cached LLM responses (fresh ones are still stored)"""
+        # Check environment variable first, then config file
+        env_value = os.getenv("LLM_CACHE_BYPASS", "").strip().lower()
+        if env_value:
+            return env_value in ("true", "1", "yes", "on")
+        return bool(self.get("llm.response_cache.bypass", False))
+
+    @property
+    def llm_prompt_caching(self) -> bool:
+        """Whether to mark the stable Stage 2 prompt prefix for provider prompt caching"""
+        return bool(self.get("llm.prompt_caching", True))
+
+    @property
+    def max_parallel_languages(self) -> int:
+        """Maximum number of languages generated and sent at the same time"""
+        return max(1, int(self.get("news.max_parallel_languages", 1)))
+
     @property
     def llm_api_key(self) -> Optional[str]:
         """Get the API key for the LLM provider"""
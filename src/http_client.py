@@ -0,0 +1,126 @@
+"""
+Shared HTTP client - Pooled keep-alive connections for all outbound requests
+"""
+import threading
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from .logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class HttpClient:
+    """
+    Thread-safe HTTP client backed by one pooled requests.Session.
+
+    Connections are kept alive and reused per host, so repeated requests to
+    the same host (news.google.com feeds, multi-part Telegram sends) skip
+    the TCP and TLS setup after the first request.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 32,
+        pool_maxsize: int = 10,
+        max_retries: int = 0,
+    ):
+        """
+        Initialize the HTTP client.
+
+        Args:
+            pool_connections: Number of per-host connection pools to keep
+            pool_maxsize: Maximum idle connections kept per host
+            max_retries: Retries for failed connection attempts
+        """
+        self.session = requests.Session()
+        self._adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+        )
+        self.session.mount("https://", self._adapter)
+        self.session.mount("http://", self._adapter)
+
+        logger.debug(
+            f"HttpClient initialized (pools: {pool_connections}, "
+            f"connections per host: {pool_maxsize})"
+        )
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request through the shared session.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Arguments passed to requests.Session.request
+
+        Returns:
+            The response
+        """
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """Send a GET request (see request)"""
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """Send a POST request (see request)"""
+        return self.request("POST", url, **kwargs)
+
+    def connection_stats(self) -> Dict[str, Dict[str, int]]:
+        """
+        Get connection reuse counters per host.
+
+        Returns:
+            Mapping of host to {'requests', 'connections', 'reused'}
+        """
+        stats = {}
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host_stats = stats.setdefault(
+                pool.host, {"requests": 0, "connections": 0, "reused": 0}
+            )
+            host_stats["requests"] += pool.num_requests
+            host_stats["connections"] += pool.num_connections
+            host_stats["reused"] += max(0, pool.num_requests - pool.num_connections)
+        return stats
+
+    def summary(self) -> str:
+        """Get a one-line summary of requests and connection reuse"""
+        stats = self.connection_stats()
+        requests_sent = sum(s["requests"] for s in stats.values())
+        connections = sum(s["connections"] for s in stats.values())
+        reused = sum(s["reused"] for s in stats.values())
+        return (
+            f"HTTP: {requests_sent} requests to {len(stats)} hosts over "
+            f"{connections} connections ({reused} reused)"
+        )
+
+    def close(self) -> None:
+        """Close all pooled connections"""
+        self.session.close()
+
+
+_default_client: Optional[HttpClient] = None
+_default_client_lock = threading.Lock()
+
+
+def get_default_http_client() -> HttpClient:
+    """
+    Get the process-wide HTTP client used when none is injected.
+
+    Returns:
+        Shared HttpClient instance
+    """
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
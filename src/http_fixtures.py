@@ -0,0 +1,262 @@
+"""
+HTTP fixtures - Record live GET responses and replay them offline
+"""
+import gzip
+import hashlib
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Optional
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from .http_client import HttpClient
+from .logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+FIXTURE_MODES = ("off", "record", "replay")
+
+# Bodies are stored decoded, so transfer headers no longer apply on replay
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection"}
+
+# Stripped when recording so the origin sends full bodies, not 304s
+_CONDITIONAL_HEADERS = {"if-none-match", "if-modified-since"}
+
+
+def fixture_key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Get the fixture key of a request.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        params: Query parameters passed separately from the URL
+
+    Returns:
+        Hex digest identifying the request
+    """
+    query = urlencode(sorted((params or {}).items()), doseq=True)
+    return hashlib.sha256(f"{method.upper()} {url} {query}".encode("utf-8")).hexdigest()
+
+
+class FixtureHttpClient(HttpClient):
+    """
+    HttpClient that records GET responses into a fixture bundle, or serves
+    them from one.
+
+    A bundle is a directory with an ``index.json`` (status, headers,
+    latency per request) and one gzipped body file per response. Record mode
+    sends requests without conditional headers (so a warm feed cache
+    doesn't turn recordings into empty 304s) and stores each GET response
+    fully read. Replay mode never touches the network for GETs: recorded
+    responses are returned after their recorded latency times
+    ``latency_scale``, and unrecorded URLs fail like a refused connection.
+    Other methods (notifier POSTs) are always sent for real.
+    """
+
+    def __init__(
+        self,
+        mode: str,
+        fixture_dir: str = "fixtures/http",
+        latency_scale: float = 1.0,
+        **kwargs,
+    ):
+        """
+        Initialize the fixture client.
+
+        Args:
+            mode: 'record' or 'replay'
+            fixture_dir: Directory of the fixture bundle
+            latency_scale: Multiplier for recorded latencies on replay
+                (0 replays instantly)
+            **kwargs: Connection pool arguments passed to HttpClient
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Invalid fixture mode: {mode} (expected 'record' or 'replay')")
+        super().__init__(**kwargs)
+        self.mode = mode
+        self.fixture_dir = Path(fixture_dir)
+        self.latency_scale = max(0.0, latency_scale)
+        self._index_path = self.fixture_dir / "index.json"
+        self._index_lock = threading.Lock()
+        self.index: Dict[str, Dict[str, Any]] = self._load_index()
+        self.stats = {"recorded": 0, "replayed": 0, "missing": 0}
+
+        if mode == "replay" and not self.index:
+            logger.warning(f"Replaying from an empty fixture bundle: {self.fixture_dir}")
+        logger.info(
+            f"HTTP fixtures: {mode} mode, {len(self.index)} responses in {self.fixture_dir}"
+        )
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the bundle index"""
+        if not self._index_path.exists():
+            return {}
+        try:
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable fixture index {self._index_path}: {str(e)}")
+            return {}
+
+    def _save_index(self) -> None:
+        """Persist the bundle index; caller holds the index lock"""
+        tmp_path = self._index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=1, sort_keys=True)
+        tmp_path.replace(self._index_path)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send, record or replay a request.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            **kwargs: Arguments passed to requests.Session.request
+
+        Returns:
+            The response (fully read in record and replay mode)
+        """
+        if method.upper() != "GET":
+            return super().request(method, url, **kwargs)
+
+        key = fixture_key(method, url, kwargs.get("params"))
+        if self.mode == "replay":
+            return self._replay(key, url, kwargs.get("headers") or {})
+
+        # A warm feed cache sends validators; record the full response
+        # instead, replay answers conditional requests itself
+        if kwargs.get("headers"):
+            kwargs["headers"] = {
+                name: value
+                for name, value in kwargs["headers"].items()
+                if name.lower() not in _CONDITIONAL_HEADERS
+            }
+
+        start = time.monotonic()
+        response = super().request(method, url, **kwargs)
+        # Read the whole body so it can be stored (even for stream=True)
+        body = response.content
+        latency = time.monotonic() - start
+        self._record(key, method, url, response, body, latency)
+        return response
+
+    def _record(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        response: requests.Response,
+        body: bytes,
+        latency: float,
+    ) -> None:
+        """Store one response in the bundle"""
+        with self._index_lock:
+            recorded = self.index.get(key)
+        if response.status_code == 304 and recorded and recorded["status"] == 200:
+            # Never replace a recorded body with an empty 304
+            return
+        body_file = f"{key[:32]}.body.gz"
+        try:
+            self.fixture_dir.mkdir(parents=True, exist_ok=True)
+            (self.fixture_dir / body_file).write_bytes(gzip.compress(body))
+            with self._index_lock:
+                self.index[key] = {
+                    "method": method.upper(),
+                    "url": response.url or url,
+                    "status": response.status_code,
+                    "reason": response.reason,
+                    "headers": {
+                        name: value
+                        for name, value in response.headers.items()
+                        if name.lower() not in _DROPPED_HEADERS
+                    },
+                    "latency": round(latency, 4),
+                    "size": len(body),
+                    "body_file": body_file,
+                    "recorded_at": datetime.now().isoformat(),
+                }
+                self._save_index()
+                self.stats["recorded"] += 1
+        except Exception as e:
+            logger.warning(f"Failed to record fixture for {url}: {str(e)}")
+
+    def _replay(
+        self, key: str, url: str, request_headers: Dict[str, str]
+    ) -> requests.Response:
+        """Build the recorded response of a request"""
+        with self._index_lock:
+            entry = self.index.get(key)
+            self.stats["replayed" if entry else "missing"] += 1
+        if entry is None:
+            raise requests.ConnectionError(f"No recorded fixture for GET {url}")
+
+        if self.latency_scale:
+            time.sleep(entry["latency"] * self.latency_scale)
+
+        headers = CaseInsensitiveDict(entry["headers"])
+        status = entry["status"]
+        body = gzip.decompress((self.fixture_dir / entry["body_file"]).read_bytes())
+
+        # Answer conditional requests like the origin would
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        if status == 200 and (
+            (etag and request_headers.get("If-None-Match") == etag)
+            or (last_modified and request_headers.get("If-Modified-Since") == last_modified)
+        ):
+            status, body = 304, b""
+
+        response = requests.Response()
+        response.status_code = status
+        response.reason = "Not Modified" if status == 304 else entry.get("reason", "")
+        response.headers = headers
+        response.url = entry["url"]
+        response.encoding = requests.utils.get_encoding_from_headers(headers)
+        response.elapsed = timedelta(seconds=entry["latency"])
+        response._content = body
+        response._content_consumed = True
+        return response
+
+    def summary(self) -> str:
+        """Get a one-line summary including fixture usage"""
+        if self.mode == "replay":
+            return (
+                f"HTTP fixtures: {self.stats['replayed']} responses replayed, "
+                f"{self.stats['missing']} missing from {self.fixture_dir}"
+            )
+        return (
+            f"{super().summary()}; {self.stats['recorded']} responses "
+            f"recorded to {self.fixture_dir}"
+        )
+
+
+def create_http_client(config) -> HttpClient:
+    """
+    Build the run's HTTP client from configuration.
+
+    Args:
+        config: Config instance
+
+    Returns:
+        HttpClient, or a FixtureHttpClient when fixtures are recorded or replayed
+    """
+    http_options = dict(
+        pool_connections=config.http_pool_connections,
+        pool_maxsize=config.http_pool_maxsize,
+        max_retries=config.http_max_retries,
+    )
+    if config.http_fixtures_mode == "off":
+        return HttpClient(**http_options)
+    return FixtureHttpClient(
+        config.http_fixtures_mode,
+        fixture_dir=config.http_fixtures_dir,
+        latency_scale=config.http_fixtures_latency_scale,
+        **http_options,
+    )
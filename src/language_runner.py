@@ -0,0 +1,140 @@
+"""
+Language runner - Process several digest languages in parallel with grouped logs
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
+
+
+class _HeldBackFilter(logging.Filter):
+    """Handler filter that diverts records logged on capturing threads"""
+
+    def __init__(self, logs: "_GroupedLogs", handler: logging.Handler):
+        super().__init__()
+        self.logs = logs
+        self.handler = handler
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        buffer = self.logs.buffer_of_current_thread()
+        if buffer is None:
+            return True
+        buffer.append((self.handler, record))
+        return False
+
+
+class _GroupedLogs:
+    """
+    Hold back the log records of worker threads and emit them in groups.
+
+    A filter is attached to every handler of the loggers that exist when
+    the context is entered. Records logged on a thread running
+    ``capture`` are buffered instead of emitted; ``flush`` emits one
+    group. Records from helper threads that a worker starts are not
+    captured and appear immediately.
+    """
+
+    def __init__(self):
+        self._buffers: Dict[int, List[Tuple[logging.Handler, logging.LogRecord]]] = {}
+        self._groups: Dict[str, List[Tuple[logging.Handler, logging.LogRecord]]] = {}
+        self._lock = threading.Lock()
+        self._filters: List[_HeldBackFilter] = []
+
+    def __enter__(self) -> "_GroupedLogs":
+        loggers = [logging.getLogger()] + [
+            logger
+            for logger in list(logging.root.manager.loggerDict.values())
+            if isinstance(logger, logging.Logger)
+        ]
+        handlers = {id(h): h for logger in loggers for h in logger.handlers}
+        for handler in handlers.values():
+            log_filter = _HeldBackFilter(self, handler)
+            handler.addFilter(log_filter)
+            self._filters.append(log_filter)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        for log_filter in self._filters:
+            log_filter.handler.removeFilter(log_filter)
+        # Don't lose anything that was never flushed
+        for group in list(self._groups):
+            self.flush(group)
+
+    def buffer_of_current_thread(self):
+        with self._lock:
+            return self._buffers.get(threading.get_ident())
+
+    def capture(self, group: str, function: Callable[..., Any], *args) -> Any:
+        """Run a function on this thread, holding back its records under a group"""
+        buffer: List[Tuple[logging.Handler, logging.LogRecord]] = []
+        thread_id = threading.get_ident()
+        with self._lock:
+            self._buffers[thread_id] = buffer
+            self._groups[group] = buffer
+        try:
+            return function(*args)
+        finally:
+            with self._lock:
+                self._buffers.pop(thread_id, None)
+
+    def flush(self, group: str) -> None:
+        """Emit the held-back records of a group"""
+        with self._lock:
+            records = self._groups.pop(group, [])
+        for handler, record in records:
+            handler.handle(record)
+
+
+class LanguageRunner:
+    """
+    Run one function per language, several languages at a time.
+
+    Each language runs on its own worker thread. Its log output is held
+    back and written as one block once the language (and every language
+    before it) has finished, so the log reads the same as a sequential
+    run regardless of which language finishes first.
+    """
+
+    def __init__(self, max_parallel: int = 1):
+        """
+        Initialize the runner.
+
+        Args:
+            max_parallel: Maximum languages processed at the same time
+                (1 = one after the other on the calling thread)
+        """
+        self.max_parallel = max(1, max_parallel)
+
+    def run(
+        self, languages: List[str], process: Callable[[str], Any]
+    ) -> Dict[str, Any]:
+        """
+        Process every language.
+
+        Args:
+            languages: Language codes, in the order their logs are written
+            process: Function that processes one language; it should handle
+                its own errors, anything it raises is re-raised here after
+                the language's logs are written
+
+        Returns:
+            Mapping of language code to the result of process, in language order
+        """
+        if self.max_parallel == 1 or len(languages) <= 1:
+            return {language: process(language) for language in languages}
+
+        results = {}
+        with _GroupedLogs() as logs, ThreadPoolExecutor(
+            max_workers=min(self.max_parallel, len(languages)),
+            thread_name_prefix="language",
+        ) as executor:
+            futures = [
+                executor.submit(logs.capture, language, process, language)
+                for language in languages
+            ]
+            for language, future in zip(languages, futures):
+                try:
+                    results[language] = future.result()
+                finally:
+                    logs.flush(language)
+        return results
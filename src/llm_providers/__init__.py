@@ -1,20 +1,32 @@
 """
 LLM Providers Module - Abstracts different LLM API providers
 """
+from typing import Optional
 from .base_provider import BaseLLMProvider
 from .claude_provider import ClaudeProvider
 from .deepseek_provider import DeepSeekProvider
 from .gemini_provider import GeminiProvider
 from .grok_provider import GrokProvider
 from .openai_provider import OpenAIProvider
+from .rate_limited import RateLimitedProvider
+from .response_cache import CachingProvider, ResponseCache
 
 
-def get_llm_provider(provider_name: str, **kwargs) -> BaseLLMProvider:
+def get_llm_provider(
+    provider_name: str,
+    max_concurrent_requests: Optional[int] = None,
+    requests_per_minute: Optional[float] = None,
+    response_cache: Optional[ResponseCache] = None,
+    **kwargs
+) -> BaseLLMProvider:
     """
     Factory function to get the appropriate LLM provider.
     
     Args:
         provider_name: Name of the provider ('claude', 'deepseek', 'gemini', 'grok', or 'openai')
+        max_concurrent_requests: Maximum calls in flight (None = unlimited)
+        requests_per_minute: Maximum calls started per minute (None = unlimited)
+        response_cache: Cache answering repeated identical requests (None = no cache)
         **kwargs: Additional arguments passed to the provider constructor
         
     Returns:
@@ -38,15 +50,28 @@ def get_llm_provider(provider_name: str, **kwargs) -> BaseLLMProvider:
             f"Available providers: {', '.join(providers.keys())}"
         )
     
-    return provider_class(**kwargs)
+    provider = provider_class(**kwargs)
+    if max_concurrent_requests or requests_per_minute:
+        provider = RateLimitedProvider(
+            provider,
+            max_concurrent_requests=max_concurrent_requests,
+            requests_per_minute=requests_per_minute,
+        )
+    if response_cache is not None:
+        # Outermost, so cache hits don't wait for a rate limit slot
+        provider = CachingProvider(provider, response_cache)
+    return provider
 
 
 __all__ = [
     'BaseLLMProvider',
+    'CachingProvider',
     'ClaudeProvider',
     'DeepSeekProvider',
     'GeminiProvider',
     'GrokProvider',
     'OpenAIProvider',
+    'RateLimitedProvider',
+    'ResponseCache',
     'get_llm_provider',
 ]
@@ -1,8 +1,13 @@
 """
 Base LLM Provider - Abstract base class for all LLM providers
 """
+import threading
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
+from ..logger import setup_logger
+
+
+logger = setup_logger(__name__)
 
 
 class BaseLLMProvider(ABC):
@@ -18,6 +23,17 @@ class BaseLLMProvider(ABC):
         """
         self.api_key = api_key
         self.model = model
+        # Token counts over all generate calls; prompt tokens include the
+        # cached parts
+        self.usage = {
+            "calls": 0,
+            "prompt_tokens": 0,
+            "output_tokens": 0,
+            "cache_read_tokens": 0,
+            "cache_write_tokens": 0,
+            "seconds": 0.0,
+        }
+        self._usage_lock = threading.Lock()
     
     @abstractmethod
     def generate(
@@ -31,7 +47,10 @@ class BaseLLMProvider(ABC):
         Generate a response from the LLM.
         
         Args:
-            messages: List of message dicts with 'role' and 'content' keys
+            messages: List of message dicts with 'role' and 'content' keys;
+                content is a string or a list of text blocks, where a block
+                with 'cache_control' ends a prefix to cache (see
+                flatten_messages for providers without explicit caching)
             max_tokens: Maximum tokens in response
             temperature: Sampling temperature
             **kwargs: Additional provider-specific parameters
@@ -82,3 +101,94 @@ class BaseLLMProvider(ABC):
     def default_model(self) -> str:
         """Return the default model name for this provider"""
         pass
+
+    @staticmethod
+    def flatten_messages(messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Join the text blocks of each message into plain string content.
+
+        For providers without explicit cache markers: they cache a repeated
+        prompt prefix automatically, which the stable-first block order
+        already gives them.
+
+        Args:
+            messages: List of message dicts
+
+        Returns:
+            Messages with string content
+        """
+        flattened = []
+        for message in messages:
+            content = message.get("content")
+            if isinstance(content, list):
+                message = dict(message)
+                message["content"] = "".join(
+                    block.get("text", "") for block in content if isinstance(block, dict)
+                )
+            flattened.append(message)
+        return flattened
+
+    def record_usage(
+        self,
+        prompt_tokens: int = 0,
+        output_tokens: int = 0,
+        cache_read_tokens: int = 0,
+        cache_write_tokens: int = 0,
+        seconds: float = 0.0,
+    ) -> None:
+        """
+        Add one call's token counts to the provider's usage.
+
+        Args:
+            prompt_tokens: Prompt tokens, including cached ones
+            output_tokens: Generated tokens
+            cache_read_tokens: Prompt tokens read from the provider's prompt cache
+            cache_write_tokens: Prompt tokens written to the provider's prompt cache
+            seconds: Duration of the call
+        """
+        with self._usage_lock:
+            self.usage["calls"] += 1
+            self.usage["prompt_tokens"] += prompt_tokens or 0
+            self.usage["output_tokens"] += output_tokens or 0
+            self.usage["cache_read_tokens"] += cache_read_tokens or 0
+            self.usage["cache_write_tokens"] += cache_write_tokens or 0
+            self.usage["seconds"] += seconds
+        logger.debug(
+            f"{self.provider_name} call: {prompt_tokens} prompt tokens "
+            f"({cache_read_tokens or 0} cache read, {cache_write_tokens or 0} cache write), "
+            f"{output_tokens} output tokens, {seconds:.1f}s"
+        )
+
+    def record_openai_usage(self, usage: Any, seconds: float = 0.0) -> None:
+        """
+        Record the usage object of an OpenAI-compatible response.
+
+        Cached prompt tokens come from prompt_tokens_details.cached_tokens
+        (OpenAI, Grok) or prompt_cache_hit_tokens (DeepSeek); these APIs
+        cache automatically and don't report cache writes.
+
+        Args:
+            usage: The response's usage object (may be None)
+            seconds: Duration of the call
+        """
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        cached = getattr(details, "cached_tokens", None) or getattr(
+            usage, "prompt_cache_hit_tokens", 0
+        )
+        self.record_usage(
+            prompt_tokens=getattr(usage, "prompt_tokens", 0),
+            output_tokens=getattr(usage, "completion_tokens", 0),
+            cache_read_tokens=cached or 0,
+            seconds=seconds,
+        )
+
+    def usage_summary(self) -> str:
+        """Get a one-line summary of token usage and prompt cache hits"""
+        usage = self.usage
+        return (
+            f"LLM usage: {usage['calls']} calls, {usage['prompt_tokens']} prompt tokens "
+            f"({usage['cache_read_tokens']} cache read, {usage['cache_write_tokens']} cache write), "
+            f"{usage['output_tokens']} output tokens, {usage['seconds']:.1f}s in calls"
+        )
@@ -2,6 +2,7 @@
 Claude Provider - Anthropic Claude API implementation
 """
 import os
+import time
 from typing import List, Dict, Any, Optional
 from anthropic import Anthropic
 from .base_provider import BaseLLMProvider
@@ -68,6 +69,9 @@ class ClaudeProvider(BaseLLMProvider):
         try:
             logger.debug(f"Calling Claude API with {len(messages)} messages")
             
+            # Text blocks with cache_control are sent as is: Claude caches
+            # the prompt up to each marked block
+            start = time.monotonic()
             response = self.client.messages.create(
                 model=self.model,
                 max_tokens=max_tokens,
@@ -75,6 +79,7 @@ class ClaudeProvider(BaseLLMProvider):
                 messages=messages,
                 **kwargs
             )
+            self._record_claude_usage(response, time.monotonic() - start)
             
             # Extract text from response
             for block in response.content:
@@ -87,6 +92,21 @@ class ClaudeProvider(BaseLLMProvider):
             logger.error(f"Claude API error: {str(e)}", exc_info=True)
             raise
     
+    def _record_claude_usage(self, response: Any, seconds: float) -> None:
+        """Record a response's token counts (input_tokens excludes cached tokens)"""
+        usage = getattr(response, "usage", None)
+        if usage is None:
+            return
+        cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+        cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+        self.record_usage(
+            prompt_tokens=(usage.input_tokens or 0) + cache_read + cache_write,
+            output_tokens=usage.output_tokens or 0,
+            cache_read_tokens=cache_read,
+            cache_write_tokens=cache_write,
+            seconds=seconds,
+        )
+    
     def generate_with_tools(
         self,
         messages: List[Dict[str, Any]],
@@ -2,6 +2,7 @@
 Gemini Provider - Google Gemini API implementation
 """
 import os
+import time
 from typing import List, Dict, Any, Optional
 import google.generativeai as genai
 from .base_provider import BaseLLMProvider
@@ -72,7 +73,9 @@ class GeminiProvider(BaseLLMProvider):
             logger.debug(f"Calling Gemini API with {len(messages)} messages")
 
             # Convert messages to Gemini format
-            gemini_messages = self._convert_messages_to_gemini_format(messages)
+            gemini_messages = self._convert_messages_to_gemini_format(
+                self.flatten_messages(messages)
+            )
 
             # Configure generation settings
             generation_config = genai.types.GenerationConfig(
@@ -81,10 +84,19 @@ class GeminiProvider(BaseLLMProvider):
             )
 
             # Generate response
+            start = time.monotonic()
             response = self.client.generate_content(
                 gemini_messages,
                 generation_config=generation_config,
             )
+            usage = getattr(response, "usage_metadata", None)
+            if usage is not None:
+                self.record_usage(
+                    prompt_tokens=getattr(usage, "prompt_token_count", 0),
+                    output_tokens=getattr(usage, "candidates_token_count", 0),
+                    cache_read_tokens=getattr(usage, "cached_content_token_count", 0),
+                    seconds=time.monotonic() - start,
+                )
 
             if response.text:
                 return response.text
@@ -2,6 +2,7 @@
 Grok Provider - xAI Grok API implementation using OpenAI-compatible interface
 """
 import os
+import time
 from typing import List, Dict, Any, Optional
 from openai import OpenAI
 from .base_provider import BaseLLMProvider
@@ -73,13 +74,18 @@ class GrokProvider(BaseLLMProvider):
         try:
             logger.debug(f"Calling Grok API with {len(messages)} messages")
 
+            # The API caches repeated prompt prefixes automatically
+            start = time.monotonic()
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=messages,
+                messages=self.flatten_messages(messages),
                 max_tokens=max_tokens,
                 temperature=temperature,
                 **kwargs
             )
+            self.record_openai_usage(
+                getattr(response, "usage", None), time.monotonic() - start
+            )
 
             # Extract text from response
             if response.choices and len(response.choices) > 0:
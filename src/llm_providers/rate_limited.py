@@ -0,0 +1,109 @@
+"""
+Rate-Limited Provider - Bounds concurrent and per-minute calls to an LLM provider
+"""
+import threading
+import time
+from typing import List, Dict, Any, Optional
+from .base_provider import BaseLLMProvider
+from ..logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class RateLimitedProvider(BaseLLMProvider):
+    """
+    Wrap a provider so that parallel callers (e.g. languages generated
+    concurrently) stay within the provider's rate limits.
+
+    At most ``max_concurrent_requests`` calls run at a time, and calls are
+    spaced so that no more than ``requests_per_minute`` start per minute.
+    """
+
+    def __init__(
+        self,
+        provider: BaseLLMProvider,
+        max_concurrent_requests: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+    ):
+        """
+        Initialize the wrapper.
+
+        Args:
+            provider: Provider to wrap
+            max_concurrent_requests: Maximum calls in flight (None = unlimited)
+            requests_per_minute: Maximum calls started per minute (None = unlimited)
+        """
+        super().__init__(api_key=provider.api_key, model=provider.model)
+        self.provider = provider
+        # Report the wrapped provider's token counts
+        self.usage = provider.usage
+        self._slots = (
+            threading.BoundedSemaphore(max_concurrent_requests)
+            if max_concurrent_requests
+            else None
+        )
+        self._interval = 60.0 / requests_per_minute if requests_per_minute else 0.0
+        self._next_start = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def provider_name(self) -> str:
+        return self.provider.provider_name
+
+    @property
+    def default_model(self) -> str:
+        return self.provider.default_model
+
+    def _wait_for_turn(self) -> None:
+        """Sleep until the per-minute limit allows another call to start"""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_start)
+            self._next_start = start_at + self._interval
+        if start_at > now:
+            logger.debug(f"Waiting {start_at - now:.1f}s for the LLM rate limit")
+            time.sleep(start_at - now)
+
+    def _call(self, method, *args, **kwargs) -> str:
+        """Run a provider call within the limits"""
+        if self._slots is None:
+            self._wait_for_turn()
+            return method(*args, **kwargs)
+        with self._slots:
+            self._wait_for_turn()
+            return method(*args, **kwargs)
+
+    def generate(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 2000,
+        temperature: float = 1.0,
+        **kwargs
+    ) -> str:
+        return self._call(
+            self.provider.generate,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+
+    def generate_with_tools(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: List[Dict[str, Any]],
+        max_tokens: int = 2000,
+        max_iterations: int = 8,
+        **kwargs
+    ) -> str:
+        return self._call(
+            self.provider.generate_with_tools,
+            messages=messages,
+            tools=tools,
+            max_tokens=max_tokens,
+            max_iterations=max_iterations,
+            **kwargs
+        )
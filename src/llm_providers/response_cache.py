@@ -0,0 +1,280 @@
+"""
+Response Cache - Content-addressed on-disk cache of LLM responses
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+from .base_provider import BaseLLMProvider
+from ..logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class ResponseCache:
+    """
+    Store LLM responses on disk, keyed by a hash of the request.
+
+    Each entry is a zlib-compressed JSON file named after the SHA-256 of
+    the provider, model, messages, max_tokens, temperature and any extra
+    parameters, so identical requests (e.g. a rerun after a notifier
+    failure) find the earlier response. Entries expire after ``ttl_hours``;
+    when the directory grows past ``max_size_mb`` the least recently used
+    entries are removed (a hit refreshes the file's modification time).
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache/llm",
+        ttl_hours: Optional[float] = 24,
+        max_size_mb: Optional[float] = 50,
+        bypass: bool = False,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            cache_dir: Directory holding one file per cached response
+            ttl_hours: Age after which an entry is ignored and removed
+                (None = never expires)
+            max_size_mb: Total size above which the least recently used
+                entries are evicted (None = unbounded)
+            bypass: Don't read from the cache (fresh responses are still
+                stored, so the next run can use them)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_hours * 3600 if ttl_hours else None
+        self.max_bytes = int(max_size_mb * 1024 * 1024) if max_size_mb else None
+        self.bypass = bypass
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+
+    @staticmethod
+    def make_key(
+        provider: str,
+        model: Optional[str],
+        messages: List[Dict[str, Any]],
+        max_tokens: int,
+        temperature: float,
+        **kwargs
+    ) -> str:
+        """
+        Compute the cache key of a request.
+
+        Args:
+            provider: Provider name
+            model: Model name
+            messages: Request messages
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+            **kwargs: Additional provider-specific parameters
+
+        Returns:
+            Hex SHA-256 digest of the canonical request
+        """
+        request = {
+            "provider": provider,
+            "model": model,
+            "messages": messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "params": kwargs,
+        }
+        canonical = json.dumps(
+            request, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        """Get the file path of a cache entry"""
+        return self.cache_dir / f"{key}.json.z"
+
+    def _count(self, stat: str) -> None:
+        with self._lock:
+            self.stats[stat] += 1
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Cached response text, or None on a miss (or in bypass mode)
+        """
+        if self.bypass:
+            self._count("misses")
+            return None
+
+        path = self._entry_path(key)
+        try:
+            entry = json.loads(zlib.decompress(path.read_bytes()))
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable LLM cache entry {path}: {str(e)}")
+            self._count("misses")
+            return None
+
+        if self.ttl_seconds and time.time() - entry.get("created_at", 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            self._count("misses")
+            return None
+
+        try:
+            # Mark as recently used for eviction
+            os.utime(path)
+        except OSError:
+            pass
+        self._count("hits")
+        return entry.get("response")
+
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response, then evict entries if the cache is too large.
+
+        Args:
+            key: Cache key from make_key
+            response: Response text
+        """
+        path = self._entry_path(key)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        try:
+            data = json.dumps(
+                {"created_at": time.time(), "response": response},
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+            tmp_path.write_bytes(zlib.compress(data.encode("utf-8")))
+            tmp_path.replace(path)
+        except Exception as e:
+            logger.warning(f"Failed to write LLM cache entry {path}: {str(e)}")
+            return
+        self._count("stores")
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove expired entries, then the least recently used past max_bytes"""
+        if not self.max_bytes and not self.ttl_seconds:
+            return
+        with self._lock:
+            now = time.time()
+            entries = []
+            for path in self.cache_dir.glob("*.json.z"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                # A file not modified within the TTL can't hold a fresh entry
+                if self.ttl_seconds and now - stat.st_mtime > self.ttl_seconds:
+                    path.unlink(missing_ok=True)
+                    self.stats["evictions"] += 1
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+            if not self.max_bytes:
+                return
+            total = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                self.stats["evictions"] += 1
+
+    def summary(self) -> str:
+        """Get a one-line summary of cache hits"""
+        stats = self.stats
+        return (
+            f"LLM response cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['stores']} stored, {stats['evictions']} evicted"
+            + (" (bypassed)" if self.bypass else "")
+        )
+
+
+class CachingProvider(BaseLLMProvider):
+    """
+    Wrap a provider so that repeated identical ``generate`` calls are
+    answered from a ResponseCache instead of the API.
+
+    Tool-calling requests are not cached: their answers depend on what the
+    tools return at call time.
+    """
+
+    def __init__(self, provider: BaseLLMProvider, cache: ResponseCache):
+        """
+        Initialize the wrapper.
+
+        Args:
+            provider: Provider to wrap
+            cache: Response cache to use
+        """
+        super().__init__(api_key=provider.api_key, model=provider.model)
+        self.provider = provider
+        # Report the wrapped provider's token counts
+        self.usage = provider.usage
+        self.cache = cache
+
+    @property
+    def provider_name(self) -> str:
+        return self.provider.provider_name
+
+    @property
+    def default_model(self) -> str:
+        return self.provider.default_model
+
+    def generate(
+        self,
+        messages: List[Dict[str, str]],
+        max_tokens: int = 2000,
+        temperature: float = 1.0,
+        **kwargs
+    ) -> str:
+        key = ResponseCache.make_key(
+            self.provider_name,
+            self.model or self.default_model,
+            messages,
+            max_tokens,
+            temperature,
+            **kwargs
+        )
+        response = self.cache.get(key)
+        if response is not None:
+            logger.info(f"Using cached LLM response ({len(response)} characters)")
+            return response
+
+        response = self.provider.generate(
+            messages=messages, max_tokens=max_tokens, temperature=temperature, **kwargs
+        )
+        if response:
+            self.cache.put(key, response)
+        return response
+
+    def generate_with_tools(
+        self,
+        messages: List[Dict[str, Any]],
+        tools: List[Dict[str, Any]],
+        max_tokens: int = 2000,
+        max_iterations: int = 8,
+        **kwargs
+    ) -> str:
+        return self.provider.generate_with_tools(
+            messages=messages,
+            tools=tools,
+            max_tokens=max_tokens,
+            max_iterations=max_iterations,
+            **kwargs
+        )
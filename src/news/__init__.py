@@ -1,14 +1,39 @@
 """
 News Module - News fetching, generation, and web search functionality
 """
-from .generator import NewsGenerator
+from .generator import NewsGenerator, SharedSelection
 from .fetcher import NewsFetcher
+from .models import NewsItem
+from .planner import RunPlanner, FeedPool
+from .stream import FetchQuorum, NewsStream
+from .sharded import ShardedFetcher
+from .feed_cache import FeedCache
+from .feed_health import FeedHealthTracker
+from .feed_registry import FeedRegistry, FeedSpec
+from .parsers import FeedParser, get_feed_parser
+from .host_scheduler import HostScheduler
+from .item_store import ItemStore
 from .web_search import WebSearchTool, get_search_tool_definition
 
 
 __all__ = [
     'NewsGenerator',
+    'SharedSelection',
     'NewsFetcher',
+    'NewsItem',
+    'RunPlanner',
+    'FeedPool',
+    'FetchQuorum',
+    'NewsStream',
+    'ShardedFetcher',
+    'FeedCache',
+    'FeedHealthTracker',
+    'FeedRegistry',
+    'FeedSpec',
+    'FeedParser',
+    'get_feed_parser',
+    'HostScheduler',
+    'ItemStore',
     'WebSearchTool',
     'get_search_tool_definition',
 ]
@@ -0,0 +1,252 @@
+"""
+Near-duplicate detection - Cluster the same story reported by several sources
+"""
+
+import hashlib
+import re
+from typing import Dict, List, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from ..logger import setup_logger
+from .models import NewsItem
+
+
+logger = setup_logger(__name__)
+
+# Query parameters that only track the referrer and never change the page
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "igshid",
+    "ref", "ref_src", "cmpid", "ocid", "ito", "at_medium", "at_campaign",
+    "spm",
+}
+
+SIMHASH_BITS = 64
+# The fingerprint is split into this many bands for candidate lookup; two
+# fingerprints within (bands - 1) bits of each other always share a band
+SIMHASH_BANDS = 4
+
+# Bit counting adds fingerprints as packed 16-bit lanes (one lane per bit),
+# looked up one byte at a time, instead of looping over all 64 bits
+_LANE_BITS = 16
+_LANE_MASK = (1 << _LANE_BITS) - 1
+_BYTE_LANES = [
+    [
+        sum(1 << ((position * 8 + bit) * _LANE_BITS) for bit in range(8) if value >> bit & 1)
+        for value in range(256)
+    ]
+    for position in range(SIMHASH_BITS // 8)
+]
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+_CJK_RE = re.compile(r"[぀-ヿ㐀-鿿가-힯]")
+# Google News titles end with " - Publisher"
+_TITLE_SUFFIX_RE = re.compile(r"\s+[-|–—]\s+[^-|–—]{2,40}$")
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so different links to the same article compare equal.
+
+    Lowercases the scheme and host, drops 'www.'/'m.' prefixes, fragments,
+    tracking parameters (utm_* and friends) and trailing slashes, and sorts
+    the remaining query parameters.
+
+    Args:
+        url: Article URL
+
+    Returns:
+        Canonical URL (empty string for an empty URL)
+    """
+    if not url:
+        return ""
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url.strip()
+
+    host = parts.netloc.lower()
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit(("https", host, path, urlencode(query), ""))
+
+
+def _features(text: str) -> List[str]:
+    """Split text into shingles: word bigrams, or character bigrams for CJK"""
+    features = []
+    words = []
+    for token in _TOKEN_RE.findall(text.lower()):
+        if _CJK_RE.search(token):
+            features.extend(token[i:i + 2] for i in range(max(1, len(token) - 1)))
+        else:
+            words.append(token)
+    features.extend(f"{a} {b}" for a, b in zip(words, words[1:]))
+    if len(words) == 1:
+        features.append(words[0])
+    return features
+
+
+def simhash(text: str) -> int:
+    """
+    Compute the 64-bit SimHash fingerprint of a text.
+
+    Args:
+        text: Input text
+
+    Returns:
+        Fingerprint; similar texts differ in few bits
+    """
+    features = _features(text)[:_LANE_MASK]
+    lanes = 0
+    for feature in features:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        for position, byte in enumerate(digest):
+            lanes += _BYTE_LANES[position][byte]
+
+    # A bit is set when more than half of the features have it set
+    fingerprint = 0
+    for bit in range(SIMHASH_BITS):
+        if 2 * (lanes >> (bit * _LANE_BITS) & _LANE_MASK) > len(features):
+            fingerprint |= 1 << bit
+    return fingerprint
+
+
+def _fingerprint_text(item: NewsItem) -> str:
+    """Get the text an item is fingerprinted on"""
+    title = _TITLE_SUFFIX_RE.sub("", item.title)
+    return f"{title} {item.description[:300]}"
+
+
+class _UnionFind:
+    """Disjoint sets over item indexes"""
+
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, index: int) -> int:
+        while self.parent[index] != index:
+            self.parent[index] = self.parent[self.parent[index]]
+            index = self.parent[index]
+        return index
+
+    def union(self, a: int, b: int) -> None:
+        root_a, root_b = self.find(a), self.find(b)
+        if root_a != root_b:
+            # Keep the earliest item as root so clusters stay in feed order
+            self.parent[max(root_a, root_b)] = min(root_a, root_b)
+
+
+def cluster_items(items: List[NewsItem], max_distance: int = 3) -> List[List[int]]:
+    """
+    Group near-duplicate items.
+
+    Items are linked when their canonical URLs match or their SimHash
+    fingerprints are within ``max_distance`` bits. Candidate pairs come from
+    banded fingerprint buckets holding one entry per distinct fingerprint;
+    each item is compared with the members of its four buckets, so the cost
+    is linear while buckets stay small and grows with their size otherwise.
+    Fingerprinting dominates at typical feed volumes.
+
+    Args:
+        items: News items
+        max_distance: Maximum Hamming distance between near-duplicates
+            (at most SIMHASH_BANDS - 1 to be found reliably)
+
+    Returns:
+        Clusters as lists of item indexes, ordered by first member
+    """
+    union_find = _UnionFind(len(items))
+    band_bits = SIMHASH_BITS // SIMHASH_BANDS
+    band_mask = (1 << band_bits) - 1
+
+    by_url: Dict[str, int] = {}
+    by_fingerprint: Dict[int, int] = {}
+    buckets: Dict[Tuple[int, int], List[int]] = {}
+    fingerprints = []
+
+    for index, item in enumerate(items):
+        url = canonicalize_url(item.link)
+        if url:
+            if url in by_url:
+                union_find.union(by_url[url], index)
+            else:
+                by_url[url] = index
+
+        fingerprint = simhash(_fingerprint_text(item))
+        fingerprints.append(fingerprint)
+        # Identical copies join the first one directly and stay out of the
+        # buckets, so a widely syndicated story doesn't grow them
+        if fingerprint in by_fingerprint:
+            union_find.union(by_fingerprint[fingerprint], index)
+            continue
+        by_fingerprint[fingerprint] = index
+        for band in range(SIMHASH_BANDS):
+            key = (band, fingerprint >> (band * band_bits) & band_mask)
+            for other in buckets.setdefault(key, []):
+                if bin(fingerprint ^ fingerprints[other]).count("1") <= max_distance:
+                    union_find.union(other, index)
+            buckets[key].append(index)
+
+    clusters: Dict[int, List[int]] = {}
+    for index in range(len(items)):
+        clusters.setdefault(union_find.find(index), []).append(index)
+    return sorted(clusters.values(), key=lambda members: members[0])
+
+
+def deduplicate_news(
+    news_data: Dict[str, List[NewsItem]], max_distance: int = 3
+) -> Dict[str, List[NewsItem]]:
+    """
+    Collapse near-duplicate stories across all sections of fetched news.
+
+    Each cluster keeps one representative (the member with the longest
+    description, earliest on ties) in its original section and position.
+    The representative records the other sources in ``also_reported_by``
+    and the cluster size in ``cluster_size``.
+
+    Args:
+        news_data: Dictionary with 'international' and 'domestic' news lists
+        max_distance: Maximum SimHash Hamming distance between near-duplicates
+
+    Returns:
+        New dictionary with the same sections and duplicates removed
+    """
+    entries = [
+        (section, item)
+        for section, section_items in news_data.items()
+        for item in section_items
+    ]
+    items = [item for _, item in entries]
+    clusters = cluster_items(items, max_distance=max_distance)
+
+    keep = set()
+    for members in clusters:
+        best = max(members, key=lambda i: (len(items[i].description), -i))
+        representative = items[best]
+        merged_sources = []
+        for index in members:
+            source = items[index].source
+            if index != best and source and source != representative.source:
+                if source not in merged_sources:
+                    merged_sources.append(source)
+        representative.also_reported_by = tuple(merged_sources)
+        representative.cluster_size = len(members)
+        keep.add(best)
+
+    deduplicated = {section: [] for section in news_data}
+    for index, (section, item) in enumerate(entries):
+        if index in keep:
+            deduplicated[section].append(item)
+
+    removed = len(items) - len(keep)
+    if removed:
+        logger.info(
+            f"Deduplication: {len(items)} items -> {len(keep)} "
+            f"({removed} near-duplicates merged)"
+        )
+    return deduplicated
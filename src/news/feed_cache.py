@@ -0,0 +1,224 @@
+"""
+Feed cache - On-disk HTTP conditional-GET cache and last-good feed snapshots
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from ..logger import setup_logger
+from .models import NewsItem
+
+
+logger = setup_logger(__name__)
+
+
+class FeedCache:
+    """
+    Store feed validators (ETag/Last-Modified) and the last good parsed
+    items by URL.
+
+    Each entry is a gzipped JSON snapshot. Besides conditional GETs, the
+    snapshot is the fallback content when a feed can't be fetched.
+    """
+
+    def __init__(self, cache_dir: str = ".cache/feeds"):
+        """
+        Initialize the feed cache.
+
+        Args:
+            cache_dir: Directory holding one cache entry per feed URL
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "bytes_downloaded": 0,
+            "bytes_saved": 0,
+            "stale_served": 0,
+        }
+
+    def _entry_path(self, feed_url: str) -> Path:
+        """Get the file path of a feed's cache entry"""
+        digest = hashlib.sha256(feed_url.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{digest}.json.gz"
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        """Atomically write a cache entry"""
+        path = self._entry_path(entry["url"])
+        # One tmp file per writer: a hedged request, its original and
+        # background revalidation may store the same URL at once (also
+        # from sharded worker processes)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            data = json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
+            tmp_path.write_bytes(gzip.compress(data.encode("utf-8")))
+            tmp_path.replace(path)
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            logger.warning(f"Failed to write feed cache entry for {entry['url']}: {str(e)}")
+
+    def load(self, feed_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the cache entry for a feed.
+
+        Args:
+            feed_url: Feed URL
+
+        Returns:
+            Cache entry dict, or None if the feed isn't cached
+        """
+        path = self._entry_path(feed_url)
+        if not path.exists():
+            return None
+        try:
+            entry = json.loads(gzip.decompress(path.read_bytes()))
+            return entry if entry.get("url") == feed_url else None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feed cache entry {path}: {str(e)}")
+            return None
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Build conditional request headers from a cache entry.
+
+        Args:
+            entry: Cache entry (or None)
+
+        Returns:
+            Headers with If-None-Match / If-Modified-Since when available
+        """
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(
+        self,
+        feed_url: str,
+        response_headers: Dict[str, str],
+        size: int,
+        items: List[NewsItem],
+        max_items: int,
+    ) -> None:
+        """
+        Store a freshly downloaded feed as its last-good snapshot.
+
+        Args:
+            feed_url: Feed URL
+            response_headers: HTTP response headers
+            size: Size of the downloaded body in bytes
+            items: Parsed news items
+            max_items: max_items the feed was parsed with
+        """
+        if not items and self.load(feed_url):
+            # Keep the last good content rather than an empty download
+            return
+
+        now = datetime.now().isoformat()
+        self._write(
+            {
+                "url": feed_url,
+                "etag": response_headers.get("ETag"),
+                "last_modified": response_headers.get("Last-Modified"),
+                "fetched_at": now,
+                "checked_at": now,
+                "size": size,
+                "max_items": max_items,
+                "items": [item.to_dict() for item in items],
+            }
+        )
+
+    @staticmethod
+    def age_seconds(entry: Dict[str, Any]) -> float:
+        """
+        Get how long ago a snapshot was last confirmed current.
+
+        Args:
+            entry: Cache entry
+
+        Returns:
+            Seconds since the last download or 304 revalidation
+        """
+        checked_at = entry.get("checked_at") or entry["fetched_at"]
+        return (datetime.now() - datetime.fromisoformat(checked_at)).total_seconds()
+
+    def stale_items(
+        self, feed_url: str, max_items: int, max_age_hours: float
+    ) -> Optional[Tuple[List[NewsItem], float]]:
+        """
+        Get a feed's last-good items to serve when it can't be fetched.
+
+        Args:
+            feed_url: Feed URL
+            max_items: Maximum number of items to return
+            max_age_hours: Only serve snapshots confirmed within this many hours
+
+        Returns:
+            Tuple of (items, snapshot age in seconds), or None if there is
+            no snapshot or it is too old
+        """
+        entry = self.load(feed_url)
+        if not entry or not entry.get("items"):
+            return None
+        age = self.age_seconds(entry)
+        if age > max_age_hours * 3600:
+            return None
+        with self._lock:
+            self.stats["stale_served"] += 1
+        return [NewsItem.from_dict(item) for item in entry["items"][:max_items]], age
+
+    def record_hit(self, entry: Dict[str, Any]) -> None:
+        """
+        Record a 304 Not Modified response served from the cache, which
+        also confirms the snapshot is current.
+
+        Args:
+            entry: Cache entry that was served
+        """
+        with self._lock:
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += entry.get("size", 0)
+        self._write({**entry, "checked_at": datetime.now().isoformat()})
+
+    def record_download(self, size: int) -> None:
+        """
+        Record a full download (cache miss).
+
+        Args:
+            size: Size of the downloaded body in bytes
+        """
+        with self._lock:
+            self.stats["misses"] += 1
+            self.stats["bytes_downloaded"] += size
+
+    def merge_stats(self, stats: Dict[str, int]) -> None:
+        """
+        Add counters collected elsewhere, e.g. in a worker process.
+
+        Args:
+            stats: Counter deltas keyed like ``self.stats``
+        """
+        with self._lock:
+            for key, value in stats.items():
+                self.stats[key] = self.stats.get(key, 0) + value
+
+    def summary(self) -> str:
+        """Get a one-line summary of cache hits and bandwidth"""
+        stats = self.stats
+        return (
+            f"Feed cache: {stats['hits']} hits, {stats['misses']} misses, "
+            f"{stats['bytes_downloaded'] / 1024:.1f} KB downloaded, "
+            f"{stats['bytes_saved'] / 1024:.1f} KB saved, "
+            f"{stats['stale_served']} stale fallbacks"
+        )
@@ -0,0 +1,351 @@
+"""
+Feed health tracker - Per-feed success rate, latency and circuit breaking
+"""
+
+import argparse
+import json
+import math
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from ..logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+def percentile(values: List[float], percent: float) -> Optional[float]:
+    """Get the nearest-rank percentile of a list of values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(percent / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class FeedHealthTracker:
+    """
+    Persisted health record per feed URL.
+
+    Drives adaptive per-feed timeouts (a multiple of the observed p95
+    latency) and a circuit breaker: after ``failure_threshold`` consecutive
+    failures a feed is skipped, then re-probed on an exponential backoff
+    schedule until it succeeds again.
+    """
+
+    def __init__(
+        self,
+        path: str = ".cache/feed_health.json",
+        failure_threshold: int = 3,
+        backoff_minutes: float = 30,
+        max_backoff_hours: float = 24,
+        min_timeout: float = 3.0,
+        latency_window: int = 50,
+        read_only: bool = False,
+    ):
+        """
+        Initialize the tracker and load existing records.
+
+        Args:
+            path: JSON file holding the health records
+            failure_threshold: Consecutive failures before the circuit opens
+            backoff_minutes: First re-probe delay once the circuit is open
+            max_backoff_hours: Upper bound for the re-probe delay
+            min_timeout: Lower bound for adaptive timeouts in seconds
+            latency_window: Number of recent latencies kept per feed
+            read_only: Never write the file (for worker processes whose
+                records are merged by the parent)
+        """
+        self.path = Path(path)
+        self.failure_threshold = max(1, failure_threshold)
+        self.backoff_seconds = backoff_minutes * 60
+        self.max_backoff_seconds = max_backoff_hours * 3600
+        self.min_timeout = min_timeout
+        self.latency_window = latency_window
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self.records: Dict[str, Dict[str, Any]] = self._load()
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load health records from disk"""
+        if not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable feed health file {self.path}: {str(e)}")
+            return {}
+
+    def save(self) -> None:
+        """Persist health records to disk"""
+        if self.read_only:
+            return
+        with self._lock:
+            data = json.dumps(self.records, ensure_ascii=False, indent=1)
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            tmp_path.write_text(data, encoding="utf-8")
+            tmp_path.replace(self.path)
+        except Exception as e:
+            logger.warning(f"Failed to save feed health to {self.path}: {str(e)}")
+
+    def _record(self, feed_url: str) -> Dict[str, Any]:
+        """Get (or create) the record of a feed; caller holds the lock"""
+        record = self.records.get(feed_url)
+        if record is None:
+            record = {
+                "name": "",
+                "successes": 0,
+                "failures": 0,
+                "consecutive_failures": 0,
+                "latencies": [],
+                "last_success": None,
+                "last_failure": None,
+                "last_error": "",
+                "open_until": 0,
+            }
+            self.records[feed_url] = record
+        return record
+
+    def records_for(self, feed_urls: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get copies of the records of some feeds.
+
+        Args:
+            feed_urls: Feed URLs
+
+        Returns:
+            Mapping of feed URL to record, for feeds that have one
+        """
+        with self._lock:
+            return {
+                url: json.loads(json.dumps(self.records[url]))
+                for url in feed_urls
+                if url in self.records
+            }
+
+    def merge_records(self, records: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Replace the records of some feeds, e.g. with those updated in a
+        worker process.
+
+        Args:
+            records: Mapping of feed URL to record
+        """
+        with self._lock:
+            self.records.update(records)
+
+    def set_name(self, feed_url: str, name: str) -> None:
+        """Attach a source name to a feed for reporting"""
+        with self._lock:
+            self._record(feed_url)["name"] = name
+
+    def allow_request(self, feed_url: str) -> bool:
+        """
+        Check whether a feed should be requested now.
+
+        Args:
+            feed_url: Feed URL
+
+        Returns:
+            False while the feed's circuit is open, True otherwise
+            (including the re-probe once the backoff has elapsed)
+        """
+        with self._lock:
+            record = self.records.get(feed_url)
+            return record is None or time.time() >= record.get("open_until", 0)
+
+    def timeout_for(self, feed_url: str, default: float) -> float:
+        """
+        Get the adaptive timeout for a feed.
+
+        Args:
+            feed_url: Feed URL
+            default: Configured timeout, also the upper bound
+
+        Returns:
+            Three times the feed's p95 latency, clamped to
+            [min_timeout, default]; ``default`` until enough samples exist
+        """
+        with self._lock:
+            record = self.records.get(feed_url)
+            latencies = list(record["latencies"]) if record else []
+        if len(latencies) < 5:
+            return default
+        return min(default, max(self.min_timeout, 3 * percentile(latencies, 95)))
+
+    def latency_percentile(
+        self, feed_url: str, percent: float, min_samples: int = 1
+    ) -> Optional[float]:
+        """Get a latency percentile of a feed, or None with fewer than min_samples"""
+        with self._lock:
+            record = self.records.get(feed_url)
+            latencies = list(record["latencies"]) if record else []
+        if len(latencies) < max(1, min_samples):
+            return None
+        return percentile(latencies, percent)
+
+    def record_success(self, feed_url: str, latency: float) -> None:
+        """
+        Record a successful fetch.
+
+        Args:
+            feed_url: Feed URL
+            latency: Fetch time in seconds
+        """
+        with self._lock:
+            record = self._record(feed_url)
+            record["successes"] += 1
+            record["consecutive_failures"] = 0
+            record["open_until"] = 0
+            record["last_success"] = time.time()
+            record["latencies"] = (record["latencies"] + [round(latency, 3)])[
+                -self.latency_window:
+            ]
+
+    def record_failure(self, feed_url: str, latency: float, error: str) -> None:
+        """
+        Record a failed fetch and open the circuit if needed.
+
+        Args:
+            feed_url: Feed URL
+            latency: Time spent before the failure in seconds
+            error: Error description
+        """
+        with self._lock:
+            record = self._record(feed_url)
+            record["failures"] += 1
+            record["consecutive_failures"] += 1
+            record["last_failure"] = time.time()
+            record["last_error"] = error[:200]
+
+            excess = record["consecutive_failures"] - self.failure_threshold
+            if excess >= 0:
+                backoff = min(
+                    self.backoff_seconds * (2 ** excess), self.max_backoff_seconds
+                )
+                record["open_until"] = time.time() + backoff
+                logger.warning(
+                    f"Circuit open for {record['name'] or feed_url} after "
+                    f"{record['consecutive_failures']} consecutive failures; "
+                    f"next probe in {backoff / 60:.0f} min"
+                )
+
+    def record_hedge(self, feed_url: str, won: bool) -> None:
+        """
+        Record a hedged (duplicate) request sent for a slow fetch.
+
+        Args:
+            feed_url: Feed URL
+            won: Whether the hedged request answered before the original
+        """
+        with self._lock:
+            record = self._record(feed_url)
+            record["hedges"] = record.get("hedges", 0) + 1
+            if won:
+                record["hedge_wins"] = record.get("hedge_wins", 0) + 1
+
+    def summary(self, feed_url: str) -> Dict[str, Any]:
+        """
+        Get the derived health metrics of a feed.
+
+        Args:
+            feed_url: Feed URL
+
+        Returns:
+            Dict with name, url, success_rate, p50, p95, last_good,
+            consecutive_failures, circuit_open, last_error, hedges and
+            hedge_wins
+        """
+        with self._lock:
+            record = dict(self._record(feed_url))
+        attempts = record["successes"] + record["failures"]
+        return {
+            "name": record["name"],
+            "url": feed_url,
+            "attempts": attempts,
+            "success_rate": record["successes"] / attempts if attempts else 1.0,
+            "p50": percentile(record["latencies"], 50),
+            "p95": percentile(record["latencies"], 95),
+            "last_good": record["last_success"],
+            "consecutive_failures": record["consecutive_failures"],
+            "circuit_open": time.time() < record.get("open_until", 0),
+            "last_error": record["last_error"],
+            "hedges": record.get("hedges", 0),
+            "hedge_wins": record.get("hedge_wins", 0),
+        }
+
+    def worst_offenders(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the least healthy feeds.
+
+        Args:
+            limit: Maximum number of feeds to return
+
+        Returns:
+            Feed summaries ordered by consecutive failures, success rate,
+            then p95 latency
+        """
+        with self._lock:
+            urls = list(self.records)
+        summaries = [self.summary(url) for url in urls]
+        summaries.sort(
+            key=lambda s: (
+                -s["consecutive_failures"],
+                s["success_rate"],
+                -(s["p95"] or 0),
+            )
+        )
+        return summaries[:limit]
+
+    def format_report(self, limit: int = 10) -> str:
+        """
+        Format the worst offenders as a text table.
+
+        Args:
+            limit: Maximum number of feeds to list
+
+        Returns:
+            Report text
+        """
+        rows = self.worst_offenders(limit)
+        if not rows:
+            return f"No feed health records in {self.path}"
+
+        lines = [
+            f"{'Feed':<32} {'OK%':>5} {'p50':>6} {'p95':>6} {'Hedge':>7} {'Fails':>5}  "
+            f"{'Last good':<16}  Status",
+            "-" * 98,
+        ]
+        for row in rows:
+            last_good = (
+                datetime.fromtimestamp(row["last_good"]).strftime("%Y-%m-%d %H:%M")
+                if row["last_good"]
+                else "never"
+            )
+            status = "OPEN" if row["circuit_open"] else "ok"
+            if row["last_error"] and row["consecutive_failures"]:
+                status += f" ({row['last_error'][:40]})"
+            p50 = f"{row['p50']:.2f}" if row["p50"] is not None else "-"
+            p95 = f"{row['p95']:.2f}" if row["p95"] is not None else "-"
+            # Hedged requests sent / won
+            hedges = f"{row['hedges']}/{row['hedge_wins']}" if row["hedges"] else "-"
+            lines.append(
+                f"{(row['name'] or row['url'])[:32]:<32} {row['success_rate'] * 100:>5.0f} "
+                f"{p50:>6} {p95:>6} {hedges:>7} {row['consecutive_failures']:>5}  "
+                f"{last_good:<16}  {status}"
+            )
+        return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Report the least healthy RSS feeds")
+    parser.add_argument("--path", default=".cache/feed_health.json", help="Feed health file")
+    parser.add_argument("--limit", type=int, default=15, help="Number of feeds to list")
+    args = parser.parse_args()
+
+    print(FeedHealthTracker(path=args.path).format_report(args.limit))
@@ -0,0 +1,176 @@
+"""
+Feed registry - Data-driven list of RSS feeds with per-feed settings
+"""
+
+import threading
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+import yaml
+from ..logger import setup_logger
+from .parsers import FEED_PARSERS
+
+
+logger = setup_logger(__name__)
+
+# Registry shipped with the bot
+DEFAULT_REGISTRY_PATH = Path(__file__).with_name("feeds.yaml")
+
+# Language whose feeds are international sources used for every digest
+INTERNATIONAL_LANGUAGE = "en"
+
+
+@dataclass(frozen=True, slots=True)
+class FeedSpec:
+    """A feed and its settings, as listed in the registry"""
+
+    name: str
+    url: str
+    language: str
+    category: str = ""
+    # Pre-ranker score multiplier for the feed's items
+    weight: float = 1.0
+    # Request timeout in seconds, None for the fetcher's default
+    timeout: Optional[float] = None
+    # Maximum items read from the feed, None for the run's default
+    max_items: Optional[int] = None
+    # Feed parser backend, None for the fetcher's default
+    parser: Optional[str] = None
+    enabled: bool = True
+
+
+class FeedRegistry:
+    """
+    Feeds grouped by language and indexed by category and URL.
+
+    The registry file is read on first use, and a language's feed specs are
+    built (and validated) the first time that language is asked for, so an
+    English-only run never touches the other languages' entries.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize the registry.
+
+        Args:
+            path: YAML (or JSON) registry file mapping language codes to
+                lists of feeds. If None, the bundled feeds.yaml is used
+        """
+        self.path = Path(path) if path else DEFAULT_REGISTRY_PATH
+        self._lock = threading.Lock()
+        self._raw: Optional[Dict[str, List[Dict[str, Any]]]] = None
+        self._by_language: Dict[str, List[FeedSpec]] = {}
+        self._by_url: Dict[str, FeedSpec] = {}
+
+    def _load(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Read the registry file once; caller holds the lock"""
+        if self._raw is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = yaml.safe_load(f) or {}
+            except FileNotFoundError:
+                raise ValueError(f"Feed registry not found: {self.path}") from None
+            if not isinstance(data, dict):
+                raise ValueError(
+                    f"Feed registry {self.path} must map language codes to feed lists"
+                )
+            self._raw = {str(language): entries or [] for language, entries in data.items()}
+        return self._raw
+
+    def _build(self, language: str, entries: List[Dict[str, Any]]) -> List[FeedSpec]:
+        """Turn a language's raw entries into feed specs"""
+        known = {f.name for f in fields(FeedSpec)}
+        specs = []
+        for entry in entries:
+            if not isinstance(entry, dict) or not entry.get("name") or not entry.get("url"):
+                raise ValueError(
+                    f"Invalid feed entry for '{language}' in {self.path}: {entry!r} "
+                    f"(name and url are required)"
+                )
+            unknown = set(entry) - known
+            if unknown:
+                logger.warning(
+                    f"Ignoring unknown keys {sorted(unknown)} of feed {entry['name']}"
+                )
+            if entry.get("parser") and entry["parser"] not in FEED_PARSERS:
+                raise ValueError(
+                    f"Unknown parser '{entry['parser']}' for feed {entry['name']} in "
+                    f"{self.path} (expected one of {', '.join(FEED_PARSERS)})"
+                )
+            values = {key: value for key, value in entry.items() if key in known}
+            values["language"] = language
+            specs.append(FeedSpec(**values))
+        return specs
+
+    def feeds_for(self, language: str, include_disabled: bool = False) -> List[FeedSpec]:
+        """
+        Get the feeds listed under a language.
+
+        Args:
+            language: Language code ('en' for the international feeds)
+            include_disabled: Also return feeds with enabled: false
+
+        Returns:
+            Feed specs in registry order (empty if the language has none)
+        """
+        with self._lock:
+            specs = self._by_language.get(language)
+            if specs is None:
+                specs = self._build(language, self._load().get(language, []))
+                self._by_language[language] = specs
+                for spec in specs:
+                    self._by_url.setdefault(spec.url, spec)
+        if include_disabled:
+            return list(specs)
+        return [spec for spec in specs if spec.enabled]
+
+    def feed_map(self, language: str) -> Dict[str, str]:
+        """
+        Get the enabled feeds of a language as a name to URL mapping.
+
+        Args:
+            language: Language code
+
+        Returns:
+            Mapping of source name to feed URL
+        """
+        return {spec.name: spec.url for spec in self.feeds_for(language)}
+
+    def by_category(self, category: str, languages: Optional[List[str]] = None) -> List[FeedSpec]:
+        """
+        Get the enabled feeds of a category.
+
+        Args:
+            category: Category name
+            languages: Languages to search (None = every language in the registry)
+
+        Returns:
+            Matching feed specs
+        """
+        if languages is None:
+            languages = self.languages
+        return [
+            spec
+            for language in languages
+            for spec in self.feeds_for(language)
+            if spec.category == category
+        ]
+
+    def spec_for_url(self, feed_url: str) -> Optional[FeedSpec]:
+        """
+        Look up a feed by URL among the languages loaded so far.
+
+        Args:
+            feed_url: Feed URL
+
+        Returns:
+            The feed's spec, or None for feeds outside the loaded languages
+        """
+        with self._lock:
+            return self._by_url.get(feed_url)
+
+    @property
+    def languages(self) -> List[str]:
+        """Language codes listed in the registry"""
+        with self._lock:
+            return list(self._load())
@@ -2,309 +2,782 @@
 News fetcher module - Fetches real-time news from various sources
 """
 
-import requests
-from typing import List, Dict, Optional
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from itertools import zip_longest
+from typing import TYPE_CHECKING, Any, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
-import xml.etree.ElementTree as ET
 from ..logger import setup_logger
+from ..http_client import HttpClient, get_default_http_client
+from .feed_cache import FeedCache
+from .feed_health import FeedHealthTracker, percentile
+from .feed_registry import INTERNATIONAL_LANGUAGE, FeedRegistry
+from .host_scheduler import HostScheduler, HostThrottledError, parse_retry_after
+from .item_store import ItemStore
+from .models import NewsItem
+from .parsers import FeedParseError, FeedParser, get_feed_parser
+from .text import clean_text, truncate_text
+from .timestamps import annotate_timestamps
+
+if TYPE_CHECKING:
+    from .planner import FeedPool
+    from .sharded import ShardedFetcher
 
 
 logger = setup_logger(__name__)
 
+# Size of the chunks read from a streamed feed response
+FEED_CHUNK_SIZE = 16 * 1024
+
+# Latency samples a feed needs before its requests are hedged
+HEDGE_MIN_SAMPLES = 5
+
 
 class NewsFetcher:
     """Fetch real-time news from RSS feeds and news APIs"""
 
-    def __init__(self):
-        """Initialize the news fetcher"""
-        # RSS feed sources for general news (reliable sources only)
-        self.rss_feeds = {
-            # Politics/World News
-            "BBC World": "http://feeds.bbci.co.uk/news/world/rss.xml",
-            "BBC Top Stories": "http://feeds.bbci.co.uk/news/rss.xml?edition=int",
-            "BBC US & Canada": "http://feeds.bbci.co.uk/news/world/us_and_canada/rss.xml",
-            # Technology News
-            "TechCrunch": "https://techcrunch.com/feed/",
-            "The Verge": "https://www.theverge.com/rss/index.xml",
-            "Ars Technica": "https://feeds.arstechnica.com/arstechnica/index",
-            "Wired": "https://www.wired.com/feed/rss",
-            # Science & Research
-            "MIT Technology Review": "https://www.technologyreview.com/feed/",
-            "Nature News": "https://www.nature.com/news/rss.xml",
-            "Science Magazine": "https://www.science.org/rss/news_current.xml",
-            "Google AI Blog": "https://blog.google/technology/ai/rss/",
-            "OpenAI Blog": "https://openai.com/blog/rss/",
-            "Microsoft AI Blog": "https://blogs.microsoft.com/ai/feed/",
-            "GeekWire (AI专题)": "https://www.geekwire.com/ai/feed/",
-            "AI Hub": "https://aihub.org/feed/",
-            "Simon Willison": "https://simonwillison.net/atom/everything/",
-        }
+    def __init__(
+        self,
+        max_workers: int = 10,
+        max_per_host: int = 4,
+        feed_cache: Optional[FeedCache] = None,
+        max_feed_bytes: int = 5 * 1024 * 1024,
+        http_client: Optional[HttpClient] = None,
+        timeout: float = 10,
+        feed_health: Optional[FeedHealthTracker] = None,
+        item_store: Optional[ItemStore] = None,
+        max_description_chars: Optional[int] = 1000,
+        host_scheduler: Optional[HostScheduler] = None,
+        max_retry_wait: float = 30,
+        throttle_cooldown: float = 120,
+        max_stale_hours: Optional[float] = None,
+        revalidate_in_background: bool = True,
+        hedge_requests: bool = False,
+        hedge_percentile: float = 90,
+        max_hedge_ratio: float = 0.1,
+        min_hedge_delay: float = 0.5,
+        feed_registry: Optional[FeedRegistry] = None,
+        sharded_fetcher: Optional["ShardedFetcher"] = None,
+        parser: str = "etree",
+    ):
+        """
+        Initialize the news fetcher.
 
-        # Chinese news sources (zh)
-        self.chinese_feeds = {
-            # State Media
-            "中国新闻网-要闻导读": "https://www.chinanews.com.cn/rss/importnews.xml",
-            "中国新闻网-财经新闻": "https://www.chinanews.com.cn/rss/finance.xml",
-            # Financial Media
-            "财新网": "https://www.caixin.com/rss/newest.xml",
-            # Tech Media
-            "36Kr (36氪)": "https://36kr.com/feed",
-            "iFeng Tech (凤凰科技)": "https://tech.ifeng.com/rss/index.xml",
-            "工商時報 (科技脈動)": "https://www.ctee.com.tw/rss_web/category/v-technology",
-            "Paul Graham": "http://www.paulgraham.com/rss.xml",
-        }
+        Args:
+            max_workers: Maximum number of feeds fetched concurrently
+            max_per_host: Maximum concurrent requests to a single host (used
+                when no host scheduler is given)
+            feed_cache: Optional conditional-GET cache for feed responses
+            max_feed_bytes: Stop reading a feed body after this many bytes
+            http_client: Shared HTTP client. If None, the default client is used
+            timeout: Request timeout in seconds (upper bound for adaptive timeouts)
+            feed_health: Optional health tracker for adaptive timeouts and
+                circuit breaking
+            item_store: Optional persistent store that fetched items are
+                upserted into
+            max_description_chars: Truncate cleaned descriptions at a sentence
+                boundary near this length (None = keep full descriptions)
+            host_scheduler: Per-host politeness limits (in-flight requests,
+                rate and Retry-After cooldowns). If None, only ``max_per_host``
+                in-flight requests per host are enforced
+            max_retry_wait: Retry a throttled feed once if its host asks to
+                wait at most this many seconds
+            throttle_cooldown: Pause for a throttling host that sends no
+                Retry-After, in seconds
+            max_stale_hours: When a feed can't be fetched, serve its last-good
+                snapshot from the feed cache if it is at most this old
+                (None = never serve stale content)
+            revalidate_in_background: After serving a stale snapshot because
+                a request failed, retry the feed on a background thread with
+                the full timeout to refresh the snapshot
+            hedge_requests: Send a second request for a feed that hasn't
+                answered by its ``hedge_percentile`` latency and use whichever
+                answers first (needs ``feed_health`` for latency history)
+            hedge_percentile: Latency percentile after which a request is hedged
+            max_hedge_ratio: Maximum share of requests that may be hedged
+            min_hedge_delay: Never hedge a request earlier than this many seconds
+            feed_registry: Feeds to fetch per language. If None, the bundled
+                registry is used
+            sharded_fetcher: Process pool that large feed batches (at least
+                its ``min_feeds``) are split across instead of fetching them
+                on this process's threads
+            parser: Default feed parser backend ('etree', 'lxml' or
+                'feedparser'); a feed's registry entry may pick another
+        """
+        self.max_description_chars = max_description_chars
+        self.item_store = item_store
+        self.timeout = timeout
+        self.feed_health = feed_health
+        self.http = http_client or get_default_http_client()
+        self.max_feed_bytes = max_feed_bytes
+        self.feed_cache = feed_cache
+        self.max_workers = max(1, max_workers)
+        self.max_per_host = max(1, max_per_host)
+        self.host_scheduler = host_scheduler or HostScheduler(
+            max_in_flight=self.max_per_host
+        )
+        self.max_retry_wait = max_retry_wait
+        self.throttle_cooldown = throttle_cooldown
+        self.max_stale_hours = max_stale_hours
+        self.revalidate_in_background = revalidate_in_background
+        self._revalidator: Optional[ThreadPoolExecutor] = None
+        self._revalidating: Dict[str, Future] = {}
+        self._revalidating_lock = threading.Lock()
+        self.hedge_requests = hedge_requests
+        self.hedge_percentile = hedge_percentile
+        self.max_hedge_ratio = max_hedge_ratio
+        self.min_hedge_delay = min_hedge_delay
+        self._hedger: Optional[ThreadPoolExecutor] = None
+        self._hedge_lock = threading.Lock()
+        self._hedge_stats = {"requests": 0, "hedged": 0, "won": 0}
+        # Per request: start time, latency, and latency of the original
+        # request alone (what the fetch would have taken without hedging)
+        self._hedge_samples: List[Dict[str, Any]] = []
+
+        # Feed lists and per-feed settings (see feeds.yaml)
+        self.feed_registry = feed_registry or FeedRegistry()
+        self.sharded_fetcher = sharded_fetcher
+        self.parser = get_feed_parser(parser)
+
+    @classmethod
+    def from_config(
+        cls, config, http_client: Optional[HttpClient] = None, **overrides
+    ) -> "NewsFetcher":
+        """
+        Build a fetcher from configuration.
 
-        # Japanese AI news sources (ja)
-        self.japanese_feeds = {
-            # Tech News Outlets
-            "ITmedia AI+": "https://rss.itmedia.co.jp/rss/2.0/aiplus.xml",
-            "Nikkei xTECH": "https://xtech.nikkei.com/rss/index.rdf",
-            "ASCII.jp AI": "https://ascii.jp/elem/000/004/000/4000000/index-2.xml",
-            "Impress Watch": "https://www.watch.impress.co.jp/data/rss/1.0/ipw/feed.rdf",
-            # Google News (fallback)
-            "Google News AI (JP)": "https://news.google.com/rss/search?q=人工知能+AI&hl=ja&gl=JP&ceid=JP:ja",
-            "Google News Tech (JP)": "https://news.google.com/rss/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtcG9HZ0pEVGlnQVAB?hl=ja&gl=JP&ceid=JP:ja",
-        }
+        Args:
+            config: Config instance
+            http_client: Shared HTTP client. If None, the default client is used
+            **overrides: Constructor arguments that replace the configured
+                ones (components passed here are not built)
 
-        # French AI news sources (fr)
-        self.french_feeds = {
-            # Tech News Outlets
-            "L'Usine Digitale": "https://www.usine-digitale.fr/rss/intelligence-artificielle.xml",
-            "01net": "https://www.01net.com/rss/actualites/",
-            "Frandroid": "https://www.frandroid.com/feed",
-            "BFM Tech": "https://www.bfmtv.com/rss/tech/",
-            # Google News (fallback)
-            "Google News AI (FR)": "https://news.google.com/rss/search?q=intelligence+artificielle&hl=fr&gl=FR&ceid=FR:fr",
-            "Google News Tech (FR)": "https://news.google.com/rss/topics/CAAqJggKIiBDQkFTRWdvSUwyMHZNRGRqTVhZU0FtcG9HZ0pEVGlnQVAB?hl=fr&gl=FR&ceid=FR:fr",
-        }
+        Returns:
+            NewsFetcher instance
+        """
+        options = dict(
+            max_workers=config.fetch_max_workers,
+            max_per_host=config.fetch_max_per_host,
+            max_retry_wait=config.fetch_max_retry_wait,
+            throttle_cooldown=config.fetch_throttle_cooldown,
+            max_stale_hours=config.feed_max_stale_hours,
+            revalidate_in_background=config.feed_revalidate_in_background,
+            hedge_requests=config.fetch_hedge_requests,
+            hedge_percentile=config.fetch_hedge_percentile,
+            max_hedge_ratio=config.fetch_max_hedge_ratio,
+            min_hedge_delay=config.fetch_min_hedge_delay,
+            max_feed_bytes=config.fetch_max_feed_bytes,
+            max_description_chars=config.fetch_max_description_chars,
+            parser=config.fetch_parser,
+            http_client=http_client,
+            timeout=config.fetch_timeout,
+        )
+        if "host_scheduler" not in overrides:
+            options["host_scheduler"] = HostScheduler(
+                max_in_flight=config.fetch_max_per_host,
+                host_limits=config.fetch_host_limits,
+            )
+        if "feed_registry" not in overrides:
+            options["feed_registry"] = FeedRegistry(config.feed_registry_path)
+        if "feed_cache" not in overrides:
+            options["feed_cache"] = (
+                FeedCache(config.feed_cache_dir) if config.feed_cache_enabled else None
+            )
+        if "feed_health" not in overrides:
+            options["feed_health"] = (
+                FeedHealthTracker(
+                    path=config.feed_health_path,
+                    failure_threshold=config.feed_health_failure_threshold,
+                    backoff_minutes=config.feed_health_backoff_minutes,
+                )
+                if config.feed_health_enabled
+                else None
+            )
+        if "item_store" not in overrides:
+            options["item_store"] = (
+                ItemStore(config.item_store_path) if config.item_store_enabled else None
+            )
+        options.update(overrides)
+        return cls(**options)
 
-        # Spanish AI news sources (es)
-        self.spanish_feeds = {
-            # Tech News Outlets
-            "Xataka": "https://www.xataka.com/tag/inteligencia-artificial/rss2.xml",
-            "El País Tecnología": "https://feeds.elpais.com/mrss-s/pages/ep/site/elpais.com/section/tecnologia/portada",
-            "Hipertextual": "https://hipertextual.com/feed",
-            "Genbeta": "https://www.genbeta.com/tag/inteligencia-artificial/rss2.xml",
-            # Google News
-            "Google News AI (ES)": "https://news.google.com/rss/search?q=inteligencia+artificial&hl=es&gl=ES&ceid=ES:es",
-        }
+    @property
+    def rss_feeds(self) -> Dict[str, str]:
+        """International feeds used for every language (source name to URL)"""
+        return self.feed_registry.feed_map(INTERNATIONAL_LANGUAGE)
 
-        # German AI news sources (de)
-        self.german_feeds = {
-            # Tech News Outlets
-            "Heise Online": "https://www.heise.de/rss/heise-atom.xml",
-            "t3n Digital Pioneers": "https://t3n.de/tag/kuenstliche-intelligenz/feed/",
-            "Golem.de": "https://rss.golem.de/rss.php?feed=RSS2.0",
-            "Computerwoche": "https://www.computerwoche.de/rss/feed/computerwoche-alle",
-            # Google News
-            "Google News AI (DE)": "https://news.google.com/rss/search?q=künstliche+intelligenz&hl=de&gl=DE&ceid=DE:de",
-        }
+    def fetch_rss_feed(
+        self, feed_url: str, max_items: int = 10
+    ) -> List[NewsItem]:
+        """
+        Fetch news items from an RSS feed.
 
-        # Korean AI news sources (ko)
-        self.korean_feeds = {
-            # Tech News Outlets
-            "Chosun Biz Tech": "https://biz.chosun.com/rss/tech.xml",
-            "ZDNet Korea": "https://zdnet.co.kr/rss/",
-            "ETNews": "https://rss.etnews.com/Section901.xml",
-            "Korean AI News": "https://www.aitimes.kr/rss/allArticle.xml",
-            # Google News
-            "Google News AI (KR)": "https://news.google.com/rss/search?q=인공지능&hl=ko&gl=KR&ceid=KR:ko",
-        }
+        With a health tracker, feeds whose circuit is open are skipped and
+        each request uses the feed's adaptive timeout. Requests wait for a
+        slot from the host scheduler; a throttled request is retried once
+        when the host's Retry-After is short enough. Slow requests may be
+        hedged (see hedge_requests). A feed that is skipped or fails falls
+        back to its last-good snapshot (see max_stale_hours).
 
-        # Portuguese AI news sources (pt)
-        self.portuguese_feeds = {
-            # Tech News Outlets
-            "TecMundo": "https://www.tecmundo.com.br/rss",
-            "Olhar Digital": "https://olhardigital.com.br/feed/",
-            "Canaltech": "https://canaltech.com.br/rss/",
-            "Exame": "https://exame.com/feed/tecnologia/",
-            # Google News
-            "Google News AI (BR)": "https://news.google.com/rss/search?q=inteligência+artificial&hl=pt-BR&gl=BR&ceid=BR:pt-419",
-        }
+        Args:
+            feed_url: URL of the RSS feed
+            max_items: Maximum number of items to fetch (a lower max_items in
+                the feed's registry entry takes precedence)
 
-        # Italian AI news sources (it)
-        self.italian_feeds = {
-            # Tech News Outlets
-            "Il Sole 24 Ore Tech": "https://www.ilsole24ore.com/rss/tecnologia.xml",
-            "Punto Informatico": "https://www.punto-informatico.it/feed/",
-            "Tom's Hardware IT": "https://www.tomshw.it/feed",
-            "Wired Italia": "https://www.wired.it/feed/rss",
-            # Google News
-            "Google News AI (IT)": "https://news.google.com/rss/search?q=intelligenza+artificiale&hl=it&gl=IT&ceid=IT:it",
-        }
+        Returns:
+            List of news items with title, link, description, and published date
+        """
+        timeout = self.timeout
+        spec = self.feed_registry.spec_for_url(feed_url)
+        if spec is not None:
+            if spec.timeout:
+                timeout = min(timeout, spec.timeout)
+            if spec.max_items:
+                max_items = min(max_items, spec.max_items)
+        if self.feed_health is not None:
+            if not self.feed_health.allow_request(feed_url):
+                logger.warning(
+                    f"Skipping RSS feed {feed_url}: circuit open after repeated failures"
+                )
+                return self._serve_stale(feed_url, max_items)
+            timeout = self.feed_health.timeout_for(feed_url, timeout)
+
+        start = time.monotonic()
+        for attempt in (1, 2):
+            requested = False
+            try:
+                with self.host_scheduler.slot(feed_url, max_cooldown=self.max_retry_wait):
+                    requested = True
+                    start = time.monotonic()
+                    items = self._download_hedged(feed_url, max_items, timeout)
+            except HostThrottledError as e:
+                if not requested:
+                    # The host paused us earlier in the run; not the feed's fault
+                    logger.warning(f"Skipping RSS feed {feed_url}: {str(e)}")
+                    return self._serve_stale(feed_url, max_items)
+                self.host_scheduler.defer(feed_url, e.retry_after)
+                if attempt == 1 and e.retry_after <= self.max_retry_wait:
+                    logger.warning(
+                        f"{str(e)}; retrying {feed_url} in {e.retry_after:.0f}s"
+                    )
+                    continue
+                error = e
+            except Exception as e:
+                error = e
+            else:
+                if self.feed_health is not None:
+                    self.feed_health.record_success(feed_url, time.monotonic() - start)
+                return items
+            break
+
+        logger.error(f"Failed to fetch RSS feed {feed_url}: {str(error)}")
+        if self.feed_health is not None:
+            self.feed_health.record_failure(
+                feed_url, time.monotonic() - start, str(error)
+            )
+        items = self._serve_stale(feed_url, max_items)
+        if items and not isinstance(error, HostThrottledError):
+            self._revalidate(feed_url, max_items)
+        return items
+
+    def _download_hedged(
+        self, feed_url: str, max_items: int, timeout: float
+    ) -> List[NewsItem]:
+        """
+        Download a feed, hedging the request if it is unusually slow.
 
-        # Russian AI news sources (ru)
-        self.russian_feeds = {
-            # Tech News Outlets
-            "Habr": "https://habr.com/ru/rss/all/",
-            "CNews": "https://www.cnews.ru/inc/rss/news.xml",
-            "Roem.ru": "https://roem.ru/feed/",
-            "VC.ru": "https://vc.ru/rss/all",
-            # Google News
-            "Google News AI (RU)": "https://news.google.com/rss/search?q=искусственный+интеллект&hl=ru&gl=RU&ceid=RU:ru",
-        }
+        The request runs on a helper thread. If it hasn't answered by the
+        feed's ``hedge_percentile`` latency, and the hedge budget and the
+        host's limits allow it, a duplicate request is sent and the first
+        successful answer wins. The slower request finishes in the background.
 
-        # Dutch AI news sources (nl)
-        self.dutch_feeds = {
-            # Tech News Outlets
-            "Tweakers": "https://feeds.feedburner.com/tweakers/mixed",
-            "Computable": "https://www.computable.nl/rss.xml",
-            "Dutch IT Channel": "https://dutchitchannel.nl/feed/",
-            # Google News
-            "Google News AI (NL)": "https://news.google.com/rss/search?q=kunstmatige+intelligentie&hl=nl&gl=NL&ceid=NL:nl",
-        }
+        Args:
+            feed_url: URL of the RSS feed
+            max_items: Maximum number of items to fetch
+            timeout: Request timeout in seconds
 
-        # Arabic AI news sources (ar)
-        self.arabic_feeds = {
-            # Tech News Outlets
-            "Arageek": "https://www.arageek.com/feed",
-            "Tech Wd": "https://www.tech-wd.com/feed/",
-            # Google News
-            "Google News AI (AR)": "https://news.google.com/rss/search?q=الذكاء+الاصطناعي&hl=ar&gl=SA&ceid=SA:ar",
-        }
+        Returns:
+            List of news items
+        """
+        if not self.hedge_requests:
+            return self._download_feed(feed_url, max_items, timeout)
+
+        start = time.monotonic()
+        sample = {"start": start, "latency": None, "unhedged": None}
+        with self._hedge_lock:
+            self._hedge_stats["requests"] += 1
+            self._hedge_samples.append(sample)
+            if self._hedger is None:
+                self._hedger = ThreadPoolExecutor(
+                    max_workers=2 * self.max_workers, thread_name_prefix="feed-hedge"
+                )
+
+        hedge_after = self._hedge_delay(feed_url, timeout)
+        try:
+            if hedge_after is None:
+                items = self._download_feed(feed_url, max_items, timeout)
+                sample["unhedged"] = time.monotonic() - start
+                return items
+
+            original = self._hedger.submit(self._download_feed, feed_url, max_items, timeout)
+            original.add_done_callback(
+                lambda _: sample.update(unhedged=time.monotonic() - start)
+            )
+            done, _ = wait([original], timeout=hedge_after)
+            if done or not self._claim_hedge(feed_url):
+                return original.result()
 
-        # Hindi AI news sources (hi)
-        self.hindi_feeds = {
-            # Tech News Outlets
-            "Jagran Josh Tech": "https://www.jagranjosh.com/rss/tech.xml",
-            "NDTV Gadgets": "https://feeds.feedburner.com/ndtvgadgets-latest",
-            # Google News
-            "Google News AI (HI)": "https://news.google.com/rss/search?q=कृत्रिम+बुद्धिमत्ता&hl=hi&gl=IN&ceid=IN:hi",
-        }
+            logger.info(
+                f"No response from {feed_url} after {hedge_after:.1f}s "
+                f"(p{self.hedge_percentile:g}); sending a hedged request"
+            )
+            hedge = self._hedger.submit(self._send_hedge, feed_url, max_items, timeout)
+            winner = original
+            for future in as_completed([original, hedge]):
+                if future.exception() is None:
+                    winner = future
+                    break
+            self._record_hedge(feed_url, won=winner is hedge)
+            # Raises the original request's error if both failed
+            return winner.result()
+        finally:
+            sample["latency"] = time.monotonic() - start
+
+    def _hedge_delay(self, feed_url: str, timeout: float) -> Optional[float]:
+        """Get the delay after which a request is hedged, or None to never hedge it"""
+        if self.feed_health is None:
+            return None
+        delay = self.feed_health.latency_percentile(
+            feed_url, self.hedge_percentile, min_samples=HEDGE_MIN_SAMPLES
+        )
+        if delay is None:
+            return None
+        delay = max(delay, self.min_hedge_delay)
+        return delay if delay < timeout else None
+
+    def _claim_hedge(self, feed_url: str) -> bool:
+        """Take one hedge from the budget if the host can take another request now"""
+        if not self.host_scheduler.has_capacity(feed_url):
+            return False
+        with self._hedge_lock:
+            stats = self._hedge_stats
+            if stats["hedged"] + 1 > self.max_hedge_ratio * stats["requests"]:
+                return False
+            stats["hedged"] += 1
+            return True
+
+    def _send_hedge(
+        self, feed_url: str, max_items: int, timeout: float
+    ) -> List[NewsItem]:
+        """Send a hedged request within the host's limits"""
+        try:
+            with self.host_scheduler.slot(feed_url, max_cooldown=0):
+                return self._download_feed(feed_url, max_items, timeout)
+        except HostThrottledError as e:
+            self.host_scheduler.defer(feed_url, e.retry_after)
+            raise
+
+    def _record_hedge(self, feed_url: str, won: bool) -> None:
+        """Count a hedged request in the run and per-feed statistics"""
+        if won:
+            with self._hedge_lock:
+                self._hedge_stats["won"] += 1
+        if self.feed_health is not None:
+            self.feed_health.record_hedge(feed_url, won)
+
+    def hedge_summary(self) -> str:
+        """Get a one-line summary of hedging and its effect on tail latency"""
+        now = time.monotonic()
+        with self._hedge_lock:
+            stats = dict(self._hedge_stats)
+            samples = [dict(sample) for sample in self._hedge_samples]
+        latencies = [s["latency"] for s in samples if s["latency"] is not None]
+        if not latencies:
+            return "Hedging: no requests"
+        # Originals still running after a hedge won took at least this long
+        unhedged = [
+            s["unhedged"] if s["unhedged"] is not None else now - s["start"]
+            for s in samples
+            if s["latency"] is not None
+        ]
+        return (
+            f"Hedging: {stats['hedged']} of {stats['requests']} requests hedged, "
+            f"{stats['won']} won; p99 feed latency {percentile(latencies, 99):.2f}s "
+            f"(~{percentile(unhedged, 99):.2f}s without hedging)"
+        )
 
-    def fetch_rss_feed(
-        self, feed_url: str, max_items: int = 10
-    ) -> List[Dict[str, str]]:
+    def _serve_stale(self, feed_url: str, max_items: int) -> List[NewsItem]:
+        """Get a feed's last-good items if stale serving is enabled and fresh enough"""
+        if self.feed_cache is None or not self.max_stale_hours:
+            return []
+        stale = self.feed_cache.stale_items(feed_url, max_items, self.max_stale_hours)
+        if stale is None:
+            return []
+        items, age = stale
+        logger.warning(
+            f"Serving {len(items)} last-good items for {feed_url} "
+            f"(snapshot {age / 3600:.1f}h old)"
+        )
+        return items
+
+    def _revalidate(self, feed_url: str, max_items: int) -> None:
+        """Retry a failed feed on a background thread to refresh its snapshot"""
+        if not self.revalidate_in_background:
+            return
+        with self._revalidating_lock:
+            running = self._revalidating.get(feed_url)
+            if running is not None and not running.done():
+                return
+            if self._revalidator is None:
+                self._revalidator = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="feed-revalidate"
+                )
+            self._revalidating[feed_url] = self._revalidator.submit(
+                self._revalidate_feed, feed_url, max_items
+            )
+
+    def _revalidate_feed(self, feed_url: str, max_items: int) -> None:
+        """Download a feed with the full timeout; the cache keeps the result"""
+        start = time.monotonic()
+        try:
+            # Give up rather than queue behind a paused host
+            with self.host_scheduler.slot(feed_url, max_cooldown=0):
+                start = time.monotonic()
+                items = self._download_feed(feed_url, max_items, self.timeout)
+        except Exception as e:
+            logger.info(f"Background revalidation of {feed_url} failed: {str(e)}")
+            return
+        if self.feed_health is not None:
+            self.feed_health.record_success(feed_url, time.monotonic() - start)
+        logger.info(f"Background revalidation refreshed {feed_url} ({len(items)} items)")
+
+    def wait_for_revalidation(self, timeout: Optional[float] = None) -> None:
         """
-        Fetch news items from an RSS feed.
+        Wait for background revalidations to finish and persist their results.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+        """
+        with self._revalidating_lock:
+            pending = list(self._revalidating.values())
+            self._revalidating.clear()
+        if pending:
+            wait(pending, timeout=timeout)
+            if self.feed_health is not None:
+                self.feed_health.save()
+
+    def _download_feed(
+        self, feed_url: str, max_items: int, timeout: float
+    ) -> List[NewsItem]:
+        """
+        Download and parse a feed, raising on any failure.
+
+        The response body is streamed into the feed's parser backend; the
+        streaming backends stop reading once ``max_items`` items are complete.
 
         Args:
             feed_url: URL of the RSS feed
             max_items: Maximum number of items to fetch
+            timeout: Request timeout in seconds
 
         Returns:
-            List of news items with title, link, description, and published date
+            List of news items
         """
-        try:
-            logger.info(f"Fetching RSS feed: {feed_url}")
+        logger.info(f"Fetching RSS feed: {feed_url}")
 
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        }
 
-            response = requests.get(feed_url, headers=headers, timeout=10)
+        # Revalidate against the cached copy when it holds enough items
+        cache_entry = None
+        if self.feed_cache is not None:
+            cache_entry = self.feed_cache.load(feed_url)
+            if cache_entry and cache_entry.get("max_items", 0) >= max_items:
+                headers.update(FeedCache.conditional_headers(cache_entry))
+            else:
+                cache_entry = None
+
+        with self.http.get(
+            feed_url, headers=headers, timeout=timeout, stream=True
+        ) as response:
+            if response.status_code == 304 and cache_entry is not None:
+                self.feed_cache.record_hit(cache_entry)
+                items = [
+                    NewsItem.from_dict(item) for item in cache_entry["items"][:max_items]
+                ]
+                logger.info(f"Feed not modified, using {len(items)} cached items")
+                return items
+
+            if response.status_code in (429, 503):
+                raise HostThrottledError(
+                    f"HTTP {response.status_code} from {response.url}",
+                    parse_retry_after(
+                        response.headers.get("Retry-After"), self.throttle_cooldown
+                    ),
+                )
             response.raise_for_status()
 
-            # Parse XML
-            root = ET.fromstring(response.content)
-
-            items = []
-            # Handle both RSS 2.0 and Atom formats
-            if root.tag == "rss":
-                news_items = root.findall(".//item")[:max_items]
-                for item in news_items:
-                    title = item.find("title")
-                    link = item.find("link")
-                    description = item.find("description")
-                    pub_date = item.find("pubDate")
-
-                    items.append(
-                        {
-                            "title": title.text if title is not None else "",
-                            "link": link.text if link is not None else "",
-                            "description": self._clean_html(
-                                description.text if description is not None else ""
-                            ),
-                            "published": pub_date.text if pub_date is not None else "",
-                        }
-                    )
-            else:
-                # Atom format
-                namespace = {"atom": "http://www.w3.org/2005/Atom"}
-                entries = root.findall(".//atom:entry", namespace)[:max_items]
-                for entry in entries:
-                    title = entry.find("atom:title", namespace)
-                    link = entry.find("atom:link", namespace)
-                    summary = entry.find("atom:summary", namespace)
-                    updated = entry.find("atom:updated", namespace)
-
-                    items.append(
-                        {
-                            "title": title.text if title is not None else "",
-                            "link": link.get("href", "") if link is not None else "",
-                            "description": self._clean_html(
-                                summary.text if summary is not None else ""
-                            ),
-                            "published": updated.text if updated is not None else "",
-                        }
-                    )
+            # Rate-limited hosts (Google News) answer with a CAPTCHA page that
+            # would otherwise count as an empty feed. Some feeds are served
+            # as text/html, so only an HTML page that isn't a feed counts
+            is_html = "html" in response.headers.get("Content-Type", "").lower()
+            try:
+                entries, bytes_read = self._parser_for(feed_url).parse(
+                    response.iter_content(chunk_size=FEED_CHUNK_SIZE),
+                    max_items,
+                    self.max_feed_bytes,
+                )
+            except FeedParseError:
+                if not is_html:
+                    raise
+                entries = []
+            items = [self._make_item(entry) for entry in entries]
+            if is_html and not items:
+                raise HostThrottledError(
+                    f"HTML page instead of a feed from {response.url}",
+                    self.throttle_cooldown,
+                )
+            response_headers = response.headers
+
+        if self.feed_cache is not None:
+            self.feed_cache.record_download(bytes_read)
+            self.feed_cache.store(
+                feed_url, response_headers, bytes_read, items, max_items
+            )
+
+        logger.info(
+            f"Fetched {len(items)} items from RSS feed ({bytes_read / 1024:.1f} KB read)"
+        )
+        return items
+
+    def _parser_for(self, feed_url: str) -> FeedParser:
+        """Get the parser backend of a feed (its registry entry may override the default)"""
+        spec = self.feed_registry.spec_for_url(feed_url)
+        if spec is not None and spec.parser:
+            return get_feed_parser(spec.parser)
+        return self.parser
+
+    def _make_item(self, entry: Dict[str, str]) -> NewsItem:
+        """Build a news item from a parsed feed entry, cleaning its text"""
+        return NewsItem(
+            title=clean_text(entry["title"]),
+            link=entry["link"],
+            description=clean_text(entry["description"], self.max_description_chars),
+            published=entry["published"],
+        )
 
-            logger.info(f"Fetched {len(items)} items from RSS feed")
-            return items
+    def fetch_feeds(
+        self, feeds: Dict[str, str], max_items: int = 10
+    ) -> Dict[str, List[NewsItem]]:
+        """
+        Fetch several RSS feeds concurrently.
 
-        except Exception as e:
-            logger.error(f"Failed to fetch RSS feed {feed_url}: {str(e)}")
-            return []
+        Feeds run on a thread pool of ``max_workers`` threads. The host
+        scheduler spaces out requests to each host, so the whole batch takes
+        about as long as the slowest feed or the most throttled host.
 
-    def _clean_html(self, text: str) -> str:
-        """Remove HTML tags from text"""
-        import re
+        Args:
+            feeds: Mapping of source name to feed URL
+            max_items: Maximum number of items to fetch per feed
 
-        clean = re.compile("<.*?>")
-        return re.sub(clean, "", text).strip()
+        Returns:
+            Mapping of source name to its items, in the same order as ``feeds``.
+            Items keep their feed order and carry 'source' and a parsed UTC
+            'published_at' (None when the date couldn't be parsed).
+        """
+        results = dict(self.iter_feeds(feeds, max_items))
+        return {source_name: results[source_name] for source_name in feeds}
+
+    def iter_feeds(
+        self, feeds: Dict[str, str], max_items: int = 10
+    ) -> Iterator[Tuple[str, List[NewsItem]]]:
+        """
+        Fetch several RSS feeds concurrently, yielding each as it completes.
+
+        Args:
+            feeds: Mapping of source name to feed URL
+            max_items: Maximum number of items to fetch per feed
+
+        Yields:
+            (source name, items) pairs in completion order, with items as
+            described in fetch_feeds. Failed feeds yield an empty list
+        """
+        if not feeds:
+            return
+
+        if self.sharded_fetcher is not None and len(feeds) >= self.sharded_fetcher.min_feeds:
+            yield from self.sharded_fetcher.iter_feeds(
+                feeds, max_items, feed_health=self.feed_health, feed_cache=self.feed_cache
+            )
+            return
+
+        start = time.monotonic()
+        workers = min(self.max_workers, len(feeds))
+
+        if self.feed_health is not None:
+            for source_name, feed_url in feeds.items():
+                self.feed_health.set_name(feed_url, source_name)
+
+        # Interleave hosts so workers waiting on a throttled host don't hold
+        # up feeds from other hosts queued behind them
+        by_host: Dict[str, List[str]] = {}
+        for source_name, feed_url in feeds.items():
+            by_host.setdefault(HostScheduler.host_of(feed_url), []).append(source_name)
+        submit_order = [
+            source_name
+            for group in zip_longest(*by_host.values())
+            for source_name in group
+            if source_name is not None
+        ]
+
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="feed-fetch"
+        ) as executor:
+            futures = {
+                executor.submit(
+                    self.fetch_rss_feed, feeds[source_name], max_items
+                ): source_name
+                for source_name in submit_order
+            }
+
+            for future in as_completed(futures):
+                source_name = futures[future]
+                try:
+                    items = future.result()
+                except Exception as e:
+                    logger.error(f"Failed to fetch {source_name}: {str(e)}")
+                    items = []
+                spec = self.feed_registry.spec_for_url(feeds[source_name])
+                for item in items:
+                    item.source = source_name
+                    if spec is not None:
+                        item.category = spec.category
+                annotate_timestamps(items)
+                yield source_name, items
+
+        if self.feed_health is not None:
+            self.feed_health.save()
+        if self.hedge_requests:
+            logger.info(self.hedge_summary())
+
+        logger.info(
+            f"Fetched {len(feeds)} feeds in {time.monotonic() - start:.1f}s "
+            f"({workers} workers); {self.host_scheduler.summary()}"
+        )
+
+    def get_domestic_feeds(self, language: str) -> Dict[str, str]:
+        """
+        Get the domestic feeds for a language.
+
+        Args:
+            language: Language code
+
+        Returns:
+            Mapping of source name to feed URL (empty if none configured)
+        """
+        if language == INTERNATIONAL_LANGUAGE:
+            return {}
+        return self.feed_registry.feed_map(language)
+
+    def source_weights(self, language: str) -> Dict[str, float]:
+        """
+        Get the pre-ranker weights set in the registry for a language's feeds.
+
+        Args:
+            language: Language code
+
+        Returns:
+            Mapping of source name to weight, for feeds not weighted 1.0
+        """
+        specs = self.feed_registry.feeds_for(INTERNATIONAL_LANGUAGE)
+        if language != INTERNATIONAL_LANGUAGE:
+            specs += self.feed_registry.feeds_for(language)
+        return {spec.name: spec.weight for spec in specs if spec.weight != 1.0}
 
     def fetch_recent_news(
-        self, language: str = "en", max_items_per_source: int = 5
-    ) -> Dict[str, List[Dict[str, str]]]:
+        self,
+        language: str = "en",
+        max_items_per_source: int = 5,
+        news_pool: Optional["FeedPool"] = None,
+        include_international: bool = True,
+    ) -> Dict[str, List[NewsItem]]:
         """
         Fetch recent AI news from all configured sources.
 
         Args:
             language: Language code for the response
             max_items_per_source: Maximum items to fetch per source
+            news_pool: Feeds already fetched for this run (see RunPlanner).
+                If given, items are read from the pool instead of the network
+            include_international: Also fetch the international feeds (off
+                when they were already selected from for every language)
 
         Returns:
             Dictionary with 'international' and 'domestic' news lists
         """
         logger.info("Fetching recent news from all sources...")
 
-        all_news = {"international": [], "domestic": []}
-
-        # Fetch international news
-        for source_name, feed_url in self.rss_feeds.items():
-            items = self.fetch_rss_feed(feed_url, max_items_per_source)
-            for item in items:
-                item["source"] = source_name
-                all_news["international"].append(item)
-
-        # Fetch domestic news based on language
-        language_feeds_map = {
-            "zh": self.chinese_feeds,
-            "ja": self.japanese_feeds,
-            "fr": self.french_feeds,
-            "es": self.spanish_feeds,
-            "de": self.german_feeds,
-            "ko": self.korean_feeds,
-            "pt": self.portuguese_feeds,
-            "it": self.italian_feeds,
-            "ru": self.russian_feeds,
-            "nl": self.dutch_feeds,
-            "ar": self.arabic_feeds,
-            "hi": self.hindi_feeds,
-        }
-
-        feeds = language_feeds_map.get(language)
-        if not feeds:
+        # Domestic news based on language
+        feeds = self.get_domestic_feeds(language)
+        if not feeds and language != INTERNATIONAL_LANGUAGE:
             logger.warning(
                 f"No domestic feeds configured for language: {language}, using international only"
             )
-            return all_news
 
-        for source_name, feed_url in feeds.items():
-            items = self.fetch_rss_feed(feed_url, max_items_per_source)
-            for item in items:
-                item["source"] = source_name
-                all_news["domestic"].append(item)
+        all_feeds = {**(self.rss_feeds if include_international else {}), **feeds}
+        if news_pool is not None:
+            # Feeds already fetched for this run are served from the shared
+            # pool; anything outside the run plan is fetched now
+            missing = {
+                source_name: feed_url
+                for source_name, feed_url in all_feeds.items()
+                if feed_url not in news_pool
+            }
+            results = self.fetch_feeds(missing, max_items=max_items_per_source)
+            for source_name, feed_url in all_feeds.items():
+                if feed_url in news_pool:
+                    results[source_name] = news_pool.items_for(feed_url, source_name)
+        else:
+            # Fetch international and domestic feeds together in one batch
+            results = self.fetch_feeds(all_feeds, max_items=max_items_per_source)
+
+        return self.group_news(language, results)
+
+    def group_news(
+        self, language: str, results: Dict[str, List[NewsItem]]
+    ) -> Dict[str, List[NewsItem]]:
+        """
+        Sort fetched feeds into international and domestic news for a language.
+
+        Items are tagged with their language and upserted into the item store.
+
+        Args:
+            language: Language code of the domestic feeds
+            results: Mapping of source name to items (feeds may be missing)
+
+        Returns:
+            Dictionary with 'international' and 'domestic' news lists, in
+            configured feed order
+        """
+        all_news = {"international": [], "domestic": []}
+        feeds = self.get_domestic_feeds(language)
+
+        for source_name in self.rss_feeds:
+            all_news["international"].extend(results.get(source_name, []))
+
+        for source_name in feeds:
+            all_news["domestic"].extend(results.get(source_name, []))
+
+        for item in all_news["international"]:
+            item.language = "en"
+        for item in all_news["domestic"]:
+            item.language = language
+
+        if self.item_store is not None:
+            new_count = self.item_store.upsert_items(all_news["international"], "en")
+            new_count += self.item_store.upsert_items(all_news["domestic"], language)
+            logger.info(f"Item store: {new_count} items not seen before")
 
         logger.info(
             f"Fetched {len(all_news['international'])} international news items "
@@ -314,7 +787,7 @@ class NewsFetcher:
         return all_news
 
     def format_news_for_summary(
-        self, news_data: Dict[str, List[Dict[str, str]]]
+        self, news_data: Dict[str, List[NewsItem]]
     ) -> str:
         """
         Format fetched news into a text suitable for AI summarization.
@@ -330,25 +803,25 @@ class NewsFetcher:
         if news_data["international"]:
             formatted += "## International News\n\n"
             for i, item in enumerate(news_data["international"], 1):
-                formatted += f"### {i}. {item['title']}\n"
-                formatted += f"**Source:** {item['source']}\n"
-                if item["description"]:
-                    formatted += f"**Description:** {item['description'][:300]}...\n"
-                formatted += f"**Link:** {item['link']}\n"
-                if item["published"]:
-                    formatted += f"**Published:** {item['published']}\n"
+                formatted += f"### {i}. {item.title}\n"
+                formatted += f"**Source:** {item.source}\n"
+                if item.description:
+                    formatted += f"**Description:** {truncate_text(item.description, 300)}\n"
+                formatted += f"**Link:** {item.link}\n"
+                if item.published:
+                    formatted += f"**Published:** {item.published}\n"
                 formatted += "\n"
 
         if news_data["domestic"]:
             formatted += "## Domestic News\n\n"
             for i, item in enumerate(news_data["domestic"], 1):
-                formatted += f"### {i}. {item['title']}\n"
-                formatted += f"**Source:** {item['source']}\n"
-                if item["description"]:
-                    formatted += f"**Description:** {item['description'][:300]}...\n"
-                formatted += f"**Link:** {item['link']}\n"
-                if item["published"]:
-                    formatted += f"**Published:** {item['published']}\n"
+                formatted += f"### {i}. {item.title}\n"
+                formatted += f"**Source:** {item.source}\n"
+                if item.description:
+                    formatted += f"**Description:** {truncate_text(item.description, 300)}\n"
+                formatted += f"**Link:** {item.link}\n"
+                if item.published:
+                    formatted += f"**Published:** {item.published}\n"
                 formatted += "\n"
 
         return formatted
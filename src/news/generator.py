@@ -2,18 +2,44 @@
 News Generator using configurable LLM providers
 """
 
-from typing import List, Optional, Dict
+from dataclasses import dataclass
+from typing import List, Optional, Dict, Tuple
 import json
 import re
+import time
 from ..logger import setup_logger
 from ..config import LANGUAGE_NAMES
+from ..http_client import HttpClient
 from .web_search import WebSearchTool, get_search_tool_definition
+from .feed_registry import INTERNATIONAL_LANGUAGE
 from .fetcher import NewsFetcher
-from ..llm_providers import get_llm_provider
+from .planner import FeedPool
+from .stream import FetchQuorum, NewsStream
+from .models import NewsItem
+from .dedup import deduplicate_news
+from .timestamps import apply_recency_window
+from .ranker import RelevanceRanker, estimate_tokens
+from .text import truncate_text
+from ..llm_providers import BaseLLMProvider, ResponseCache, get_llm_provider
 
 
 logger = setup_logger(__name__)
 
+DIGEST_FOOTER = "\n\n---\n\n*Generated by [AI News Bot](https://github.com/giftedunicorn/ai-news-bot) - Your AI-powered news assistant*"
+
+# URLs in a digest, as markdown link targets or bare
+URL_PATTERN = re.compile(r"https?://[^\s<>()\[\]\"']+(?:\([^\s<>()]*\)[^\s<>()\[\]\"']*)*")
+
+
+@dataclass
+class SharedSelection:
+    """International items picked by one Stage 1 for every language"""
+
+    # Selected ID -> item, in selection order
+    items: Dict[str, NewsItem]
+    # Number of candidates Stage 1 chose from
+    total_items: int
+
 
 class NewsGenerator:
     """Generate news digest using configurable LLM providers"""
@@ -24,6 +50,12 @@ class NewsGenerator:
         api_key: Optional[str] = None,
         model: Optional[str] = None,
         enable_web_search: bool = False,
+        news_fetcher: Optional[NewsFetcher] = None,
+        http_client: Optional[HttpClient] = None,
+        max_concurrent_requests: Optional[int] = None,
+        requests_per_minute: Optional[float] = None,
+        response_cache: Optional[ResponseCache] = None,
+        prompt_caching: bool = True,
     ):
         """
         Initialize the NewsGenerator.
@@ -33,49 +65,75 @@ class NewsGenerator:
             api_key: API key for the provider. If None, will read from environment
             model: Model name to use. If None, uses provider's default model
             enable_web_search: Whether to enable web search tool for fetching current news
+            news_fetcher: NewsFetcher to use. If None, a default one is created
+            http_client: Shared HTTP client for web search and the default fetcher
+            max_concurrent_requests: Maximum LLM calls in flight across
+                threads (None = unlimited)
+            requests_per_minute: Maximum LLM calls started per minute
+                (None = unlimited)
+            response_cache: On-disk cache of LLM responses (None = no cache)
+            prompt_caching: Mark the stable start of the Stage 2 prompt for
+                the provider's prompt cache
 
         Raises:
             ValueError: If provider is not recognized or API key is not provided
         """
         # Initialize LLM provider
         self.provider = get_llm_provider(
-            provider_name=provider_name, api_key=api_key, model=model
+            provider_name=provider_name,
+            api_key=api_key,
+            model=model,
+            max_concurrent_requests=max_concurrent_requests,
+            requests_per_minute=requests_per_minute,
+            response_cache=response_cache,
         )
 
+        self.prompt_caching = prompt_caching
         self.enable_web_search = enable_web_search
-        self.search_tool = WebSearchTool() if enable_web_search else None
-        self.news_fetcher = NewsFetcher()
+        self.search_tool = (
+            WebSearchTool(http_client=http_client) if enable_web_search else None
+        )
+        self.news_fetcher = news_fetcher or NewsFetcher(http_client=http_client)
+        # Per language: candidates, selected items and prompt token counts
+        # of the last digest (see generate_news_digest_from_sources and
+        # translate_digest)
+        self.digest_stats: Dict[str, Dict[str, int]] = {}
         logger.info(
             f"NewsGenerator initialized with {self.provider.provider_name} "
             f"(model: {self.provider.model}, web_search: {enable_web_search})"
         )
 
-    def _format_news_with_ids(self, news_data: Dict) -> tuple:
+    def _format_news_with_ids(self, news_data: Dict, id_prefix: str = "") -> tuple:
         """
         Format news with unique IDs for selection stage.
 
         Args:
             news_data: Dictionary with 'international' and 'domestic' news lists
+            id_prefix: Prefix for the IDs (keeps follow-up IDs distinct)
 
         Returns:
             Tuple of (formatted_text, news_items_dict)
         """
         formatted = "# Recent News Items for Selection\n\n"
-        news_items = {}  # id -> full news item
+        news_items: Dict[str, NewsItem] = {}  # id -> full news item
         item_id = 1
 
         if news_data["international"]:
             formatted += "## International News\n\n"
             for item in news_data["international"]:
-                news_id = f"INT-{item_id}"
+                news_id = f"{id_prefix}INT-{item_id}"
                 news_items[news_id] = item
 
-                formatted += f"### [{news_id}] {item['title']}\n"
-                formatted += f"**Source:** {item['source']}\n"
-                if item["description"]:
-                    formatted += f"**Description:** {item['description'][:400]}...\n"
-                if item["published"]:
-                    formatted += f"**Published:** {item['published']}\n"
+                formatted += f"### [{news_id}] {item.title}\n"
+                formatted += f"**Source:** {item.source}\n"
+                if item.also_reported_by:
+                    formatted += f"**Also reported by:** {', '.join(item.also_reported_by)}\n"
+                if item.description:
+                    formatted += f"**Description:** {truncate_text(item.description, 400)}\n"
+                if item.published_at:
+                    formatted += f"**Published:** {item.published_at:%Y-%m-%d %H:%M} UTC\n"
+                elif item.published:
+                    formatted += f"**Published:** {item.published}\n"
                 formatted += "\n"
                 item_id += 1
 
@@ -83,20 +141,601 @@ class NewsGenerator:
             formatted += "## Domestic News\n\n"
             item_id = 1
             for item in news_data["domestic"]:
-                news_id = f"DOM-{item_id}"
+                news_id = f"{id_prefix}DOM-{item_id}"
                 news_items[news_id] = item
 
-                formatted += f"### [{news_id}] {item['title']}\n"
-                formatted += f"**Source:** {item['source']}\n"
-                if item["description"]:
-                    formatted += f"**Description:** {item['description'][:400]}...\n"
-                if item["published"]:
-                    formatted += f"**Published:** {item['published']}\n"
+                formatted += f"### [{news_id}] {item.title}\n"
+                formatted += f"**Source:** {item.source}\n"
+                if item.also_reported_by:
+                    formatted += f"**Also reported by:** {', '.join(item.also_reported_by)}\n"
+                if item.description:
+                    formatted += f"**Description:** {truncate_text(item.description, 400)}\n"
+                if item.published_at:
+                    formatted += f"**Published:** {item.published_at:%Y-%m-%d %H:%M} UTC\n"
+                elif item.published:
+                    formatted += f"**Published:** {item.published}\n"
                 formatted += "\n"
                 item_id += 1
 
         return formatted, news_items
 
+    def _prepare_candidates(
+        self,
+        news_data: Dict[str, List[NewsItem]],
+        language: str,
+        only_new_items: bool,
+        max_age_hours: Optional[float],
+        sort_by_freshness: bool,
+        dedup_max_distance: Optional[int],
+        required: bool = True,
+        incremental_languages: Optional[List[str]] = None,
+    ) -> Dict[str, List[NewsItem]]:
+        """
+        Filter fetched news down to the candidates for selection.
+
+        Keeps only new items (in incremental mode) and recent items, orders
+        them newest first and merges near-duplicate stories.
+
+        Args:
+            news_data: Dictionary with 'international' and 'domestic' news lists
+            language: Language code of the digest
+            only_new_items: Only keep items first seen since the last digest
+            max_age_hours: Drop items published longer ago than this
+            sort_by_freshness: Order candidates newest first
+            dedup_max_distance: SimHash distance for merging near-duplicates,
+                or None to disable deduplication
+            required: Raise if no candidates are left
+            incremental_languages: Keep items that are new for any of these
+                languages (default: just ``language``)
+
+        Returns:
+            Dictionary with the candidate 'international' and 'domestic' lists
+
+        Raises:
+            Exception: If required and a filter leaves no candidates
+        """
+        item_store = self.news_fetcher.item_store
+        if only_new_items and item_store is not None:
+            languages = incremental_languages or [language]
+            fetched_count = len(news_data["international"]) + len(news_data["domestic"])
+            new_items = set()
+            for digest_language in languages:
+                for items in news_data.values():
+                    new_items.update(map(id, item_store.filter_new(items, digest_language)))
+            news_data = {
+                section: [item for item in items if id(item) in new_items]
+                for section, items in news_data.items()
+            }
+            new_count = len(news_data["international"]) + len(news_data["domestic"])
+            digest_names = "/".join(lang.upper() for lang in languages)
+            logger.info(
+                f"Incremental mode: {new_count} of {fetched_count} items are new "
+                f"since the last {digest_names} digest"
+            )
+            if not new_count and required:
+                error_msg = f"No new news items since the last {digest_names} digest."
+                logger.error(error_msg)
+                raise Exception(error_msg)
+
+        # Keep recent items, newest first
+        news_data = apply_recency_window(
+            news_data,
+            max_age_hours=max_age_hours,
+            sort_by_freshness=sort_by_freshness,
+        )
+        if not news_data["international"] and not news_data["domestic"] and required:
+            error_msg = f"No news items published in the last {max_age_hours} hours."
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+        # Merge the same story reported by several sources
+        if dedup_max_distance is not None:
+            news_data = deduplicate_news(news_data, max_distance=dedup_max_distance)
+        return news_data
+
+    def _prerank(
+        self,
+        news_data: Dict[str, List[NewsItem]],
+        language: str,
+        max_candidates: Optional[int],
+        topics: Optional[List[str]],
+        source_weights: Optional[Dict[str, float]],
+    ) -> Dict[str, List[NewsItem]]:
+        """
+        Keep only the locally best-ranked candidates for selection.
+
+        Args:
+            news_data: Candidate 'international' and 'domestic' news
+            language: Language code of the domestic feeds
+            max_candidates: Keep at most this many items (None = keep all)
+            topics: Topics to score relevance against (defaults to the
+                configured news topics)
+            source_weights: Score multiplier per source name (overrides the
+                weights in the feed registry)
+
+        Returns:
+            Dictionary with the kept 'international' and 'domestic' lists
+        """
+        candidate_count = len(news_data["international"]) + len(news_data["domestic"])
+        if max_candidates is None or candidate_count <= max_candidates:
+            return news_data
+
+        if topics is None:
+            from ..config import Config
+
+            topics = Config().news_topics
+        full_tokens = estimate_tokens(self._format_news_with_ids(news_data)[0])
+        start = time.perf_counter()
+        # Weights from config.yaml override those in the feed registry
+        weights = {
+            **self.news_fetcher.source_weights(language),
+            **(source_weights or {}),
+        }
+        ranker = RelevanceRanker(topics, source_weights=weights)
+        news_data = ranker.select(news_data, max_candidates)
+        rank_ms = (time.perf_counter() - start) * 1000
+        formatted_news, news_items = self._format_news_with_ids(news_data)
+        ranked_tokens = estimate_tokens(formatted_news)
+        logger.info(
+            f"Pre-ranker: kept {len(news_items)} of {candidate_count} "
+            f"candidates in {rank_ms:.0f}ms; Stage 1 input ~{full_tokens} -> "
+            f"~{ranked_tokens} tokens ({1 - ranked_tokens / max(1, full_tokens):.0%} saved)"
+        )
+        return news_data
+
+    def _select_additional_items(
+        self,
+        candidate_data: Dict[str, List[NewsItem]],
+        selected_items: List[NewsItem],
+        max_items: int,
+        template: str,
+        id_prefix: str = "",
+        language: str = "en",
+    ) -> Dict[str, NewsItem]:
+        """
+        Run a small selection that adds items to an existing selection.
+
+        Used for feeds that missed Stage 1 and for the per-language
+        domestic pass of a shared selection.
+
+        Args:
+            candidate_data: Candidate 'international' and 'domestic' news
+            selected_items: Items already selected
+            max_items: Maximum number of items to add
+            template: Prompt template with {formatted_news}, {total_items},
+                {max_items}, {selected_titles} (and optionally {language_name})
+            id_prefix: Prefix for the candidates' IDs
+            language: Language code of the digest
+
+        Returns:
+            Mapping of ID to item for the items to add to the digest
+        """
+        formatted_news, candidates = self._format_news_with_ids(
+            candidate_data, id_prefix=id_prefix
+        )
+        if not candidates or max_items <= 0:
+            return {}
+
+        selected_titles = "\n".join(f"- {item.title}" for item in selected_items)
+        prompt = template.format(
+            formatted_news=formatted_news,
+            total_items=len(candidates),
+            max_items=max_items,
+            selected_titles=selected_titles,
+            language_name=LANGUAGE_NAMES.get(language.lower(), language.upper()),
+        )
+        response = self.provider.generate(
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=500,
+        )
+
+        json_match = re.search(r"\[[\s\S]*?\]", response)
+        try:
+            added_ids = json.loads(json_match.group(0)) if json_match else []
+        except json.JSONDecodeError:
+            added_ids = []
+        if not json_match:
+            logger.warning("Could not parse JSON from additional selection, adding no items")
+        added_ids = [news_id for news_id in added_ids if news_id in candidates][:max_items]
+        return {news_id: candidates[news_id] for news_id in added_ids}
+
+    def _select_items(
+        self,
+        language: str,
+        max_items_per_source: int,
+        stage1_template: Optional[str],
+        news_pool: Optional[FeedPool],
+        dedup_max_distance: Optional[int],
+        only_new_items: bool,
+        max_age_hours: Optional[float],
+        sort_by_freshness: bool,
+        max_candidates: Optional[int],
+        topics: Optional[List[str]],
+        source_weights: Optional[Dict[str, float]],
+        quorum: Optional[FetchQuorum],
+        late_items: str,
+        max_late_items: int,
+        followup_template: Optional[str],
+        incremental_languages: Optional[List[str]] = None,
+    ) -> Tuple[Dict[str, NewsItem], List[str], int]:
+        """
+        Fetch a language's news and run Stage 1 over it.
+
+        Arguments are those of generate_news_digest_from_sources, plus:
+
+        Args:
+            incremental_languages: In incremental mode, keep items that are
+                new for any of these languages (default: just ``language``)
+
+        Returns:
+            Tuple of (ID to item mapping of the candidates, selected IDs,
+            number of candidates)
+        """
+        # Fetch real-time news
+        logger.info("Fetching real-time news from sources...")
+        stream = None
+        if quorum is not None:
+            stream = NewsStream(
+                self.news_fetcher,
+                language=language,
+                max_items_per_source=max_items_per_source,
+                news_pool=news_pool,
+            )
+            news_data = stream.take(quorum)
+        else:
+            news_data = self.news_fetcher.fetch_recent_news(
+                language=language,
+                max_items_per_source=max_items_per_source,
+                news_pool=news_pool,
+            )
+
+        if not news_data["international"] and not news_data["domestic"]:
+            error_msg = "No news items fetched from RSS sources. Please check your network connection or RSS feed availability."
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+        news_data = self._prepare_candidates(
+            news_data,
+            language,
+            only_new_items=only_new_items,
+            max_age_hours=max_age_hours,
+            sort_by_freshness=sort_by_freshness,
+            dedup_max_distance=dedup_max_distance,
+            incremental_languages=incremental_languages,
+        )
+
+        # Only send the locally best-ranked candidates to Stage 1
+        news_data = self._prerank(news_data, language, max_candidates, topics, source_weights)
+
+        # Format news with unique IDs for selection
+        formatted_news, news_items = self._format_news_with_ids(news_data)
+        total_items = len(news_items)
+
+        logger.info(
+            f"Starting two-stage prompt chaining with {total_items} news items"
+        )
+
+        # ============================================================
+        # STAGE 1: Selection - Analyze and select 15-20 best items
+        # ============================================================
+        logger.info(f"Stage 1: Analyzing and selecting high-quality news items...")
+
+        # Use provided template or load from config
+        if stage1_template is None:
+            from ..config import Config
+
+            config = Config()
+            stage1_template = config.stage1_prompt_template
+
+        # Format Stage 1 prompt with placeholders
+        selection_prompt = stage1_template.format(
+            formatted_news=formatted_news, total_items=total_items
+        )
+
+        messages = [{"role": "user", "content": selection_prompt}]
+        selection_response = self.provider.generate(
+            messages=messages,
+            max_tokens=4000,  # give enough tokens for selection
+        )
+
+        # Parse selected IDs
+        json_match = re.search(r"\[[\s\S]*?\]", selection_response)
+        if not json_match:
+            logger.warning(
+                "Could not parse JSON from selection response, using fallback"
+            )
+            # Fallback: select first 18 items
+            selected_ids = list(news_items.keys())[:18]
+        else:
+            try:
+                selected_ids = json.loads(json_match.group(0))
+                # Validate IDs
+                selected_ids = [id for id in selected_ids if id in news_items]
+
+                # Ensure we have 15-20 items
+                if len(selected_ids) < 15:
+                    logger.warning(
+                        f"Only {len(selected_ids)} items selected, adding more"
+                    )
+                    remaining = [
+                        id for id in news_items.keys() if id not in selected_ids
+                    ]
+                    selected_ids.extend(remaining[: 18 - len(selected_ids)])
+                elif len(selected_ids) > 20:
+                    logger.warning(
+                        f"{len(selected_ids)} items selected, trimming to 20"
+                    )
+                    selected_ids = selected_ids[:20]
+
+            except json.JSONDecodeError:
+                logger.warning("JSON parse error, using fallback selection")
+                selected_ids = list(news_items.keys())[:18]
+
+        logger.info(f"Stage 1 completed: Selected {len(selected_ids)} news items")
+        logger.debug(f"Selected IDs: {selected_ids}")
+
+        # Feeds that missed the quorum get a small follow-up selection
+        if stream is not None and stream.pending and late_items == "merge":
+            late_data = self._prepare_candidates(
+                stream.take_rest(timeout=self.news_fetcher.timeout),
+                language,
+                only_new_items=only_new_items,
+                max_age_hours=max_age_hours,
+                sort_by_freshness=sort_by_freshness,
+                dedup_max_distance=dedup_max_distance,
+                required=False,
+                incremental_languages=incremental_languages,
+            )
+            if followup_template is None:
+                from ..config import Config
+
+                followup_template = Config().stage1_followup_prompt_template
+            added = self._select_additional_items(
+                late_data,
+                [news_items[news_id] for news_id in selected_ids],
+                max_late_items,
+                followup_template,
+                id_prefix="LATE-",
+                language=language,
+            )
+            logger.info(
+                f"Follow-up selection: added {len(added)} of "
+                f"{len(late_data['international']) + len(late_data['domestic'])} late items"
+            )
+            news_items.update(added)
+            selected_ids.extend(added)
+            total_items += len(late_data["international"]) + len(late_data["domestic"])
+        elif stream is not None and stream.pending:
+            logger.info(
+                f"Dropping {len(stream.pending)} feeds that missed the quorum"
+            )
+
+        return news_items, selected_ids, total_items
+
+    def select_shared_items(
+        self,
+        languages: List[str],
+        max_items_per_source: int = 5,
+        stage1_template: Optional[str] = None,
+        news_pool: Optional[FeedPool] = None,
+        dedup_max_distance: Optional[int] = 3,
+        only_new_items: bool = False,
+        max_age_hours: Optional[float] = None,
+        sort_by_freshness: bool = True,
+        max_candidates: Optional[int] = None,
+        topics: Optional[List[str]] = None,
+        source_weights: Optional[Dict[str, float]] = None,
+        quorum: Optional[FetchQuorum] = None,
+        late_items: str = "merge",
+        max_late_items: int = 3,
+        followup_template: Optional[str] = None,
+    ) -> "SharedSelection":
+        """
+        Run Stage 1 once over the international news shared by all languages.
+
+        The result is passed to generate_news_digest_from_sources for each
+        language, which then only selects among that language's domestic
+        news. In incremental mode an item is a candidate if it is new for
+        any of the languages; each language later drops the picks it has
+        already covered.
+
+        Args:
+            languages: Language codes of the digests that will use the selection
+            (other arguments as for generate_news_digest_from_sources)
+
+        Returns:
+            SharedSelection with the selected international items
+
+        Raises:
+            Exception: If fetching or selection fails
+        """
+        logger.info(
+            f"Shared Stage 1: selecting international news once for "
+            f"{', '.join(lang.upper() for lang in languages)}"
+        )
+        news_items, selected_ids, total_items = self._select_items(
+            INTERNATIONAL_LANGUAGE,
+            max_items_per_source,
+            stage1_template,
+            news_pool,
+            dedup_max_distance,
+            only_new_items,
+            max_age_hours,
+            sort_by_freshness,
+            max_candidates,
+            topics,
+            source_weights,
+            quorum,
+            late_items,
+            max_late_items,
+            followup_template,
+            incremental_languages=languages,
+        )
+        return SharedSelection(
+            items={news_id: news_items[news_id] for news_id in selected_ids},
+            total_items=total_items,
+        )
+
+    def _extend_shared_selection(
+        self,
+        shared_selection: "SharedSelection",
+        language: str,
+        max_items_per_source: int,
+        news_pool: Optional[FeedPool],
+        dedup_max_distance: Optional[int],
+        only_new_items: bool,
+        max_age_hours: Optional[float],
+        sort_by_freshness: bool,
+        max_candidates: Optional[int],
+        topics: Optional[List[str]],
+        source_weights: Optional[Dict[str, float]],
+        max_domestic_items: int,
+        domestic_template: Optional[str],
+    ) -> Tuple[Dict[str, NewsItem], List[str], int]:
+        """
+        Add a language's domestic picks to the shared international selection.
+
+        Returns:
+            Tuple of (ID to item mapping, selected IDs, number of candidates)
+        """
+        selected = dict(shared_selection.items)
+        item_store = self.news_fetcher.item_store
+        if only_new_items and item_store is not None:
+            new_items = {id(item) for item in item_store.filter_new(list(selected.values()), language)}
+            selected = {
+                news_id: item for news_id, item in selected.items() if id(item) in new_items
+            }
+            if len(selected) < len(shared_selection.items):
+                logger.info(
+                    f"Skipping {len(shared_selection.items) - len(selected)} shared items "
+                    f"already in the last {language.upper()} digest"
+                )
+
+        domestic_data = self.news_fetcher.fetch_recent_news(
+            language=language,
+            max_items_per_source=max_items_per_source,
+            news_pool=news_pool,
+            include_international=False,
+        )
+        domestic_data = self._prepare_candidates(
+            domestic_data,
+            language,
+            only_new_items=only_new_items,
+            max_age_hours=max_age_hours,
+            sort_by_freshness=sort_by_freshness,
+            dedup_max_distance=dedup_max_distance,
+            required=False,
+        )
+        domestic_data = self._prerank(
+            domestic_data, language, max_candidates, topics, source_weights
+        )
+        domestic_count = len(domestic_data["domestic"])
+
+        if domestic_template is None:
+            from ..config import Config
+
+            domestic_template = Config().stage1_domestic_prompt_template
+        added = self._select_additional_items(
+            domestic_data,
+            list(selected.values()),
+            max_domestic_items,
+            domestic_template,
+            language=language,
+        )
+        logger.info(
+            f"Domestic selection ({language.upper()}): added {len(added)} of "
+            f"{domestic_count} domestic items to {len(selected)} shared items"
+        )
+        if not selected and not added:
+            error_msg = f"No news items selected for the {language.upper()} digest."
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+        selected.update(added)
+        return selected, list(selected), shared_selection.total_items + domestic_count
+
+    @staticmethod
+    def _format_selected(news_items: Dict[str, NewsItem], ids: List[str]) -> str:
+        """Format selected items for the Stage 2 prompt"""
+        formatted = ""
+        for news_id in ids:
+            item = news_items[news_id]
+            formatted += f"### [{news_id}] {item.title}\n"
+            formatted += f"**Source:** {item.source}\n"
+            if item.description:
+                formatted += f"**Content:** {item.description}\n"
+            formatted += f"**Link:** {item.link}\n"
+            if item.published_at:
+                formatted += f"**Published:** {item.published_at:%Y-%m-%d %H:%M} UTC\n"
+            elif item.published:
+                formatted += f"**Published:** {item.published}\n"
+            formatted += "\n"
+        return formatted
+
+    def _stage2_messages(
+        self,
+        stage2_template: str,
+        news_items: Dict[str, NewsItem],
+        shared_ids: List[str],
+        other_ids: List[str],
+        language: str,
+    ) -> List[Dict]:
+        """
+        Build the Stage 2 messages in a prompt-cache friendly order.
+
+        The prompt is split into text blocks: the template text before
+        {selected_news} (if it doesn't use {count}), then the items shared
+        by all languages, then this language's own items, the rest of the
+        template and the language instruction. The first two blocks are
+        the same in every language's call and are marked with
+        cache_control; providers without explicit caching get the blocks
+        joined into one string with the same stable prefix.
+
+        Args:
+            stage2_template: Stage 2 prompt template
+            news_items: Selected items by ID
+            shared_ids: IDs of the items every language covers, in order
+            other_ids: IDs of this language's other items, in order
+            language: Language code for the response
+
+        Returns:
+            Messages for the provider
+        """
+        count = len(shared_ids) + len(other_ids)
+        header = "# Selected High-Quality News Items\n\n"
+        shared_news = self._format_selected(news_items, shared_ids)
+        other_news = self._format_selected(news_items, other_ids)
+
+        # Add language instruction if not English
+        language_instruction = ""
+        if language and language.lower() != "en":
+            language_name = LANGUAGE_NAMES.get(language.lower(), language.upper())
+            language_instruction = (
+                f"\n\nIMPORTANT: Please respond entirely in {language_name}."
+            )
+
+        prefix, marker, suffix = stage2_template.partition("{selected_news}")
+        if not self.prompt_caching or not marker or "{count}" in prefix:
+            prompt = stage2_template.format(
+                count=count, selected_news=header + shared_news + other_news
+            )
+            return [{"role": "user", "content": prompt + language_instruction}]
+
+        stable_blocks = [prefix.format(count=count) + header]
+        if shared_news:
+            stable_blocks.append(shared_news)
+        blocks = [
+            {"type": "text", "text": text, "cache_control": {"type": "ephemeral"}}
+            for text in stable_blocks
+        ]
+        blocks.append(
+            {
+                "type": "text",
+                "text": other_news + suffix.format(count=count) + language_instruction,
+            }
+        )
+        return [{"role": "user", "content": blocks}]
+
     def generate_news_digest_from_sources(
         self,
         max_tokens: int = 8000,
@@ -104,6 +743,21 @@ class NewsGenerator:
         max_items_per_source: int = 5,
         stage1_template: Optional[str] = None,
         stage2_template: Optional[str] = None,
+        news_pool: Optional[FeedPool] = None,
+        dedup_max_distance: Optional[int] = 3,
+        only_new_items: bool = False,
+        max_age_hours: Optional[float] = None,
+        sort_by_freshness: bool = True,
+        max_candidates: Optional[int] = None,
+        topics: Optional[List[str]] = None,
+        source_weights: Optional[Dict[str, float]] = None,
+        quorum: Optional[FetchQuorum] = None,
+        late_items: str = "merge",
+        max_late_items: int = 3,
+        followup_template: Optional[str] = None,
+        shared_selection: Optional["SharedSelection"] = None,
+        max_domestic_items: int = 5,
+        domestic_template: Optional[str] = None,
     ) -> str:
         """
         Fetch real-time news and generate a digest using two-stage prompt chaining:
@@ -116,6 +770,33 @@ class NewsGenerator:
             max_items_per_source: Maximum items to fetch per source
             stage1_template: Optional Stage 1 prompt template (from config)
             stage2_template: Optional Stage 2 prompt template (from config)
+            news_pool: Feeds already fetched for this run (see RunPlanner)
+            dedup_max_distance: SimHash distance for merging near-duplicate
+                stories before Stage 1, or None to disable deduplication
+            only_new_items: Only consider items first seen since the last
+                delivered digest for this language (needs an item store)
+            max_age_hours: Drop items published longer ago than this
+            sort_by_freshness: Order candidates newest first before Stage 1
+            max_candidates: Send at most this many locally pre-ranked items
+                to Stage 1, or None to send every item
+            topics: Topics the pre-ranker scores relevance against
+                (defaults to the configured news topics)
+            source_weights: Pre-ranker score multiplier per source name
+                (overrides the weights in the feed registry)
+            quorum: Start Stage 1 once this quorum of feeds is in instead of
+                waiting for every feed, or None to wait for all
+            late_items: What to do with feeds that arrive after the quorum:
+                'merge' runs a small follow-up selection over them after
+                Stage 1, 'drop' ignores them
+            max_late_items: Maximum number of late items the follow-up
+                selection may add
+            followup_template: Optional follow-up selection prompt template
+            shared_selection: International items already selected for all
+                languages (see select_shared_items). If given, Stage 1 is
+                replaced by a small pass over this language's domestic news
+            max_domestic_items: Maximum number of domestic items the
+                domestic pass of a shared selection may add
+            domestic_template: Optional domestic pass prompt template
 
         Returns:
             Generated news digest as string
@@ -124,102 +805,46 @@ class NewsGenerator:
             Exception: If fetching or generation fails
         """
         try:
-            # Fetch real-time news
-            logger.info("Fetching real-time news from sources...")
-            news_data = self.news_fetcher.fetch_recent_news(
-                language=language, max_items_per_source=max_items_per_source
-            )
-
-            if not news_data["international"] and not news_data["domestic"]:
-                error_msg = "No news items fetched from RSS sources. Please check your network connection or RSS feed availability."
-                logger.error(error_msg)
-                raise Exception(error_msg)
-
-            # Format news with unique IDs for selection
-            formatted_news, news_items = self._format_news_with_ids(news_data)
-            total_items = len(news_items)
-
-            logger.info(
-                f"Starting two-stage prompt chaining with {total_items} news items"
-            )
-
-            # ============================================================
-            # STAGE 1: Selection - Analyze and select 15-20 best items
-            # ============================================================
-            logger.info(f"Stage 1: Analyzing and selecting high-quality news items...")
-
-            # Use provided template or load from config
-            if stage1_template is None:
-                from ..config import Config
-
-                config = Config()
-                stage1_template = config.stage1_prompt_template
-
-            # Format Stage 1 prompt with placeholders
-            selection_prompt = stage1_template.format(
-                formatted_news=formatted_news, total_items=total_items
-            )
-
-            messages = [{"role": "user", "content": selection_prompt}]
-            selection_response = self.provider.generate(
-                messages=messages,
-                max_tokens=4000,  # give enough tokens for selection
-            )
-
-            # Parse selected IDs
-            json_match = re.search(r"\[[\s\S]*?\]", selection_response)
-            if not json_match:
-                logger.warning(
-                    "Could not parse JSON from selection response, using fallback"
+            if shared_selection is not None:
+                news_items, selected_ids, total_items = self._extend_shared_selection(
+                    shared_selection,
+                    language,
+                    max_items_per_source,
+                    news_pool,
+                    dedup_max_distance,
+                    only_new_items,
+                    max_age_hours,
+                    sort_by_freshness,
+                    max_candidates,
+                    topics,
+                    source_weights,
+                    max_domestic_items,
+                    domestic_template,
                 )
-                # Fallback: select first 18 items
-                selected_ids = list(news_items.keys())[:18]
             else:
-                try:
-                    selected_ids = json.loads(json_match.group(0))
-                    # Validate IDs
-                    selected_ids = [id for id in selected_ids if id in news_items]
-
-                    # Ensure we have 15-20 items
-                    if len(selected_ids) < 15:
-                        logger.warning(
-                            f"Only {len(selected_ids)} items selected, adding more"
-                        )
-                        remaining = [
-                            id for id in news_items.keys() if id not in selected_ids
-                        ]
-                        selected_ids.extend(remaining[: 18 - len(selected_ids)])
-                    elif len(selected_ids) > 20:
-                        logger.warning(
-                            f"{len(selected_ids)} items selected, trimming to 20"
-                        )
-                        selected_ids = selected_ids[:20]
-
-                except json.JSONDecodeError:
-                    logger.warning("JSON parse error, using fallback selection")
-                    selected_ids = list(news_items.keys())[:18]
-
-            logger.info(f"Stage 1 completed: Selected {len(selected_ids)} news items")
-            logger.debug(f"Selected IDs: {selected_ids}")
+                news_items, selected_ids, total_items = self._select_items(
+                    language,
+                    max_items_per_source,
+                    stage1_template,
+                    news_pool,
+                    dedup_max_distance,
+                    only_new_items,
+                    max_age_hours,
+                    sort_by_freshness,
+                    max_candidates,
+                    topics,
+                    source_weights,
+                    quorum,
+                    late_items,
+                    max_late_items,
+                    followup_template,
+                )
 
             # ============================================================
             # STAGE 2: Summarization - Create detailed summaries
             # ============================================================
             logger.info(f"Stage 2: Creating detailed summaries for selected items...")
 
-            # Format selected news for summarization
-            formatted_selected = "# Selected High-Quality News Items\n\n"
-            for news_id in selected_ids:
-                item = news_items[news_id]
-                formatted_selected += f"### [{news_id}] {item['title']}\n"
-                formatted_selected += f"**Source:** {item['source']}\n"
-                if item["description"]:
-                    formatted_selected += f"**Content:** {item['description']}\n"
-                formatted_selected += f"**Link:** {item['link']}\n"
-                if item["published"]:
-                    formatted_selected += f"**Published:** {item['published']}\n"
-                formatted_selected += "\n"
-
             # Use provided template or load from config
             if stage2_template is None:
                 from ..config import Config
@@ -227,27 +852,32 @@ class NewsGenerator:
                 config = Config()
                 stage2_template = config.stage2_prompt_template
 
-            # Format Stage 2 prompt with placeholders
-            summarization_prompt = stage2_template.format(
-                count=len(selected_ids), selected_news=formatted_selected
+            # Items shared by every language go first, so their part of the
+            # prompt is the same in each language's call
+            shared_ids = []
+            if shared_selection is not None:
+                shared_ids = [i for i in selected_ids if i in shared_selection.items]
+            messages = self._stage2_messages(
+                stage2_template,
+                news_items,
+                shared_ids,
+                [i for i in selected_ids if i not in shared_ids],
+                language,
             )
-
-            # Add language instruction if not English
-            if language and language.lower() != "en":
-                language_name = LANGUAGE_NAMES.get(language.lower(), language.upper())
-                summarization_prompt += (
-                    f"\n\nIMPORTANT: Please respond entirely in {language_name}."
-                )
+            summarization_prompt = BaseLLMProvider.flatten_messages(messages)[0]["content"]
 
             # Execute Stage 2: Generate detailed summaries
-            messages = [{"role": "user", "content": summarization_prompt}]
             response_text = self.provider.generate(
                 messages=messages, max_tokens=max_tokens
             )
 
             # Add footer with GitHub link
-            footer = "\n\n---\n\n*Generated by [AI News Bot](https://github.com/giftedunicorn/ai-news-bot) - Your AI-powered news assistant*"
-            response_text += footer
+            response_text += DIGEST_FOOTER
+            self.digest_stats[language] = {
+                "candidates": total_items,
+                "selected": len(selected_ids),
+                "stage2_prompt_tokens": estimate_tokens(summarization_prompt),
+            }
 
             logger.info("Stage 2 completed: News digest generated successfully")
             logger.info(
@@ -262,3 +892,101 @@ class NewsGenerator:
                 f"Failed to generate news digest from sources: {str(e)}", exc_info=True
             )
             raise
+
+    def translate_digest(
+        self,
+        digest: str,
+        language: str,
+        source_language: str = "en",
+        template: Optional[str] = None,
+        max_tokens: int = 8000,
+    ) -> str:
+        """
+        Translate a finished digest into another language.
+
+        URLs are replaced by placeholders before translation and restored
+        afterwards, so links survive unchanged; the prompt asks the model to
+        keep the markdown structure. Costs one prompt the size of the digest
+        instead of a Stage 2 prompt with every selected item's content.
+
+        Args:
+            digest: Digest generated by generate_news_digest_from_sources
+            language: Language code to translate into
+            source_language: Language code of the digest
+            template: Translation prompt template with {digest},
+                {language_name} and {source_language_name} (from config)
+            max_tokens: Maximum tokens in response
+
+        Returns:
+            Translated digest as string
+
+        Raises:
+            Exception: If translation fails
+        """
+        try:
+            body = digest[: -len(DIGEST_FOOTER)] if digest.endswith(DIGEST_FOOTER) else digest
+
+            # Protect links from being translated or mangled
+            urls: Dict[str, str] = {}
+
+            def protect(match: re.Match) -> str:
+                # Sentence punctuation after a bare URL isn't part of it
+                url = match.group(0).rstrip(".,;:!?")
+                if url not in urls:
+                    urls[url] = f"{{{{URL-{len(urls) + 1}}}}}"
+                return urls[url] + match.group(0)[len(url):]
+
+            protected = URL_PATTERN.sub(protect, body)
+
+            if template is None:
+                from ..config import Config
+
+                template = Config().translation_prompt_template
+            prompt = template.format(
+                digest=protected,
+                language_name=LANGUAGE_NAMES.get(language.lower(), language.upper()),
+                source_language_name=LANGUAGE_NAMES.get(
+                    source_language.lower(), source_language.upper()
+                ),
+            )
+
+            logger.info(
+                f"Translating the {source_language.upper()} digest into {language.upper()}..."
+            )
+            translated = self.provider.generate(
+                messages=[{"role": "user", "content": prompt}], max_tokens=max_tokens
+            )
+
+            missing = 0
+            for url, placeholder in urls.items():
+                if placeholder not in translated:
+                    missing += 1
+                translated = translated.replace(placeholder, url)
+            if missing:
+                logger.warning(
+                    f"{missing} of {len(urls)} links were lost in the {language.upper()} translation"
+                )
+
+            prompt_tokens = estimate_tokens(prompt)
+            source_stats = self.digest_stats.get(source_language, {})
+            stage2_tokens = source_stats.get("stage2_prompt_tokens", 0)
+            # A translation has no candidates of its own: it inherits the
+            # counts of the digest it was translated from
+            self.digest_stats[language] = {
+                "candidates": source_stats.get("candidates", 0),
+                "selected": source_stats.get("selected", 0),
+                "translation_prompt_tokens": prompt_tokens,
+                "tokens_saved": max(0, stage2_tokens - prompt_tokens),
+            }
+
+            logger.info(
+                f"Translation into {language.upper()} completed: prompt ~{prompt_tokens} "
+                f"tokens instead of ~{stage2_tokens} for a separate Stage 2"
+            )
+            return translated + DIGEST_FOOTER
+
+        except Exception as e:
+            logger.error(
+                f"Failed to translate digest into {language.upper()}: {str(e)}", exc_info=True
+            )
+            raise
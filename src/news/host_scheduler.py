@@ -0,0 +1,257 @@
+"""
+Host scheduler - Per-host politeness limits for concurrent feed fetching
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, Optional
+from urllib.parse import urlparse
+from ..logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+# Hosts shared by many feeds and known to throttle bursts with 429s or
+# CAPTCHA pages; config entries under news.fetch.hosts override these
+DEFAULT_HOST_LIMITS: Dict[str, Dict[str, float]] = {
+    "news.google.com": {"max_in_flight": 2, "requests_per_minute": 30, "burst": 4},
+}
+
+
+class HostThrottledError(Exception):
+    """A host asked us to slow down (429/503, or a CAPTCHA page instead of a feed)"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value: Optional[str], default: float) -> float:
+    """
+    Parse a Retry-After header.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+        default: Delay to use when the header is missing or invalid
+
+    Returns:
+        Delay in seconds (never negative)
+    """
+    if not value:
+        return default
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return default
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _HostState:
+    """Token bucket, in-flight count and cooldown of one host"""
+
+    def __init__(self, max_in_flight: int, rate: Optional[float], burst: float):
+        self.max_in_flight = max(1, max_in_flight)
+        # Tokens per second; None means no rate limit
+        self.rate = rate
+        self.burst = max(1.0, burst)
+        self.tokens = self.burst
+        self.refilled_at = time.monotonic()
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.waited = 0.0
+
+    def refill(self, now: float) -> None:
+        if self.rate is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.refilled_at) * self.rate)
+        self.refilled_at = now
+
+    def wait_time(self, now: float) -> Optional[float]:
+        """Seconds until a request may start, 0 if now, None if waiting on in-flight"""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.in_flight >= self.max_in_flight:
+            return None
+        if self.rate is not None and self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+        return 0.0
+
+
+class HostScheduler:
+    """
+    Gate outbound requests per host.
+
+    Each host gets a maximum number of in-flight requests, an optional token
+    bucket (sustained requests per minute plus a burst allowance) and a
+    cooldown set from Retry-After when the host throttles us. Requests to
+    other hosts are unaffected, so throughput across many hosts stays high.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 4,
+        requests_per_minute: Optional[float] = None,
+        burst: float = 4,
+        host_limits: Optional[Dict[str, Dict[str, Any]]] = None,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_in_flight: Default concurrent requests per host
+            requests_per_minute: Default sustained rate per host (None = unlimited)
+            burst: Default number of requests allowed back to back
+            host_limits: Per-host overrides of max_in_flight,
+                requests_per_minute and burst (merged over
+                DEFAULT_HOST_LIMITS); a host also matches its subdomains
+        """
+        self.max_in_flight = max(1, max_in_flight)
+        self.requests_per_minute = requests_per_minute
+        self.burst = burst
+        self.host_limits = {**DEFAULT_HOST_LIMITS, **(host_limits or {})}
+        self._lock = threading.Lock()
+        self._changed = threading.Condition(self._lock)
+        self._hosts: Dict[str, _HostState] = {}
+
+    def _limits_for(self, host: str) -> Dict[str, Any]:
+        """Find the configured limits of a host or its closest parent domain"""
+        parts = host.split(".")
+        # Never match on the top-level domain alone
+        for start in range(max(1, len(parts) - 1)):
+            limits = self.host_limits.get(".".join(parts[start:]))
+            if limits is not None:
+                return limits
+        return {}
+
+    def _state(self, host: str) -> _HostState:
+        """Get (or create) the state of a host; caller holds the lock"""
+        state = self._hosts.get(host)
+        if state is None:
+            limits = self._limits_for(host)
+            per_minute = limits.get("requests_per_minute", self.requests_per_minute)
+            state = _HostState(
+                max_in_flight=int(limits.get("max_in_flight", self.max_in_flight)),
+                rate=per_minute / 60 if per_minute else None,
+                burst=float(limits.get("burst", self.burst)),
+            )
+            self._hosts[host] = state
+        return state
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Get the lowercase host name of a URL"""
+        return urlparse(url).hostname or ""
+
+    @contextmanager
+    def slot(self, url: str, max_cooldown: Optional[float] = None) -> Iterator[None]:
+        """
+        Hold a request slot for the URL's host, waiting until its
+        in-flight limit, token bucket and cooldown allow a request.
+
+        Args:
+            url: Request URL
+            max_cooldown: Fail instead of waiting out a Retry-After cooldown
+                longer than this many seconds (None = always wait)
+
+        Raises:
+            HostThrottledError: If the host's cooldown exceeds max_cooldown
+        """
+        host = self.host_of(url)
+        requested_at = time.monotonic()
+        with self._changed:
+            state = self._state(host)
+            while True:
+                now = time.monotonic()
+                cooldown = state.blocked_until - now
+                if max_cooldown is not None and cooldown > max_cooldown:
+                    raise HostThrottledError(
+                        f"Host {host} is paused for another {cooldown:.0f}s", cooldown
+                    )
+                state.refill(now)
+                wait = state.wait_time(now)
+                if wait == 0:
+                    break
+                # Woken early when a request to the host finishes
+                self._changed.wait(timeout=wait)
+            state.in_flight += 1
+            if state.rate is not None:
+                state.tokens -= 1
+            state.requests += 1
+            state.waited += time.monotonic() - requested_at
+        try:
+            yield
+        finally:
+            with self._changed:
+                state.in_flight -= 1
+                self._changed.notify_all()
+
+    def has_capacity(self, url: str) -> bool:
+        """
+        Check whether a request to the URL's host could start without waiting.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            True if the host has a free slot, a token and no cooldown
+        """
+        with self._changed:
+            state = self._state(self.host_of(url))
+            now = time.monotonic()
+            state.refill(now)
+            return state.wait_time(now) == 0
+
+    def defer(self, url: str, seconds: float) -> None:
+        """
+        Hold off all requests to the URL's host for a while.
+
+        Args:
+            url: URL of the request that was throttled
+            seconds: Cooldown, usually from Retry-After
+        """
+        host = self.host_of(url)
+        with self._changed:
+            state = self._state(host)
+            state.throttled += 1
+            state.blocked_until = max(state.blocked_until, time.monotonic() + seconds)
+            self._changed.notify_all()
+        logger.warning(f"Host {host} is throttling requests; pausing it for {seconds:.0f}s")
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get per-host counters.
+
+        Returns:
+            Mapping of host to {'requests', 'throttled', 'waited'} where
+            'waited' is the total seconds requests queued for a slot
+        """
+        with self._lock:
+            return {
+                host: {
+                    "requests": state.requests,
+                    "throttled": state.throttled,
+                    "waited": round(state.waited, 2),
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def summary(self) -> str:
+        """Get a one-line summary of queueing and throttling"""
+        stats = self.stats()
+        throttled = {host: s["throttled"] for host, s in stats.items() if s["throttled"]}
+        busiest = max(stats.items(), key=lambda entry: entry[1]["waited"], default=None)
+        text = f"Host scheduler: {len(stats)} hosts"
+        if busiest and busiest[1]["waited"]:
+            text += f", longest queue {busiest[0]} ({busiest[1]['waited']:.1f}s waited)"
+        if throttled:
+            text += f", throttled by {', '.join(f'{h} x{n}' for h, n in throttled.items())}"
+        return text
@@ -0,0 +1,199 @@
+"""
+Item store - SQLite record of fetched items for incremental runs
+"""
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional
+from ..logger import setup_logger
+from .dedup import canonicalize_url
+from .models import NewsItem
+
+
+logger = setup_logger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    canonical_url TEXT PRIMARY KEY,
+    link TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    source TEXT NOT NULL,
+    language TEXT NOT NULL,
+    published TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL,
+    published_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_items_source ON items (source);
+CREATE INDEX IF NOT EXISTS idx_items_language ON items (language, first_seen);
+CREATE INDEX IF NOT EXISTS idx_items_published ON items (published_at);
+CREATE INDEX IF NOT EXISTS idx_items_first_seen ON items (first_seen);
+
+CREATE TABLE IF NOT EXISTS digests (
+    language TEXT NOT NULL,
+    completed_at REAL NOT NULL,
+    item_count INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_digests_language ON digests (language, completed_at);
+"""
+
+
+def item_key(item: NewsItem) -> str:
+    """
+    Get the store key of an item: its canonical URL, or source and title
+    for items without a link.
+
+    Args:
+        item: News item
+
+    Returns:
+        Store key
+    """
+    return canonicalize_url(item.link) or f"untitled:{item.source}:{item.title}"
+
+
+class ItemStore:
+    """Persistent item store indexed by canonical URL, source, language and time"""
+
+    def __init__(self, path: str = ".cache/items.db"):
+        """
+        Open (and create if needed) the item store.
+
+        Args:
+            path: SQLite database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    def upsert_items(self, items: List[NewsItem], language: str) -> int:
+        """
+        Insert new items and refresh the ones already stored.
+
+        ``first_seen`` is kept from the first insert; ``last_seen`` and the
+        item fields are updated.
+
+        Args:
+            items: News items
+            language: Language code of the feeds the items came from
+
+        Returns:
+            Number of items not seen before
+        """
+        if not items:
+            return 0
+
+        now = time.time()
+        rows = [
+            (
+                item_key(item),
+                item.link,
+                item.title,
+                item.description,
+                item.source,
+                language,
+                item.published,
+                now,
+                now,
+                item.published_at.timestamp() if item.published_at else None,
+            )
+            for item in items
+        ]
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            inserted = self._conn.total_changes - before
+            self._conn.executemany(
+                "UPDATE items SET link = ?, title = ?, description = ?, source = ?, "
+                "published = ?, published_at = ?, last_seen = ? WHERE canonical_url = ?",
+                [(r[1], r[2], r[3], r[4], r[6], r[9], now, r[0]) for r in rows],
+            )
+            self._conn.commit()
+        return inserted
+
+    def last_digest_time(self, language: str) -> Optional[float]:
+        """
+        Get when the last delivered digest for a language was recorded.
+
+        Args:
+            language: Language code
+
+        Returns:
+            Unix timestamp, or None if no digest was recorded yet
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(completed_at) FROM digests WHERE language = ?", (language,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def filter_new(
+        self, items: List[NewsItem], language: str
+    ) -> List[NewsItem]:
+        """
+        Keep only items first seen since the last digest for a language.
+
+        Items that aren't in the store yet count as new. Without a previous
+        digest every item is returned.
+
+        Args:
+            items: News items
+            language: Language code of the digest
+
+        Returns:
+            New items, in their original order
+        """
+        since = self.last_digest_time(language)
+        if since is None or not items:
+            return list(items)
+
+        keys = [item_key(item) for item in items]
+        first_seen = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                first_seen.update(
+                    self._conn.execute(
+                        f"SELECT canonical_url, first_seen FROM items "
+                        f"WHERE canonical_url IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+                )
+        return [
+            item
+            for item, key in zip(items, keys)
+            if first_seen.get(key, since + 1) > since
+        ]
+
+    def record_digest(self, language: str, item_count: int) -> None:
+        """
+        Record a digest that was delivered for a language.
+
+        Args:
+            language: Language code
+            item_count: Number of candidate items the digest was built from
+                (for a translated digest, those of the digest it was
+                translated from)
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO digests VALUES (?, ?, ?)",
+                (language, time.time(), item_count),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,59 @@
+"""
+News models - Typed records passed between the fetcher and the generator
+"""
+
+from dataclasses import asdict, dataclass, fields
+from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
+
+
+@dataclass(slots=True)
+class NewsItem:
+    """A single news item fetched from a feed"""
+
+    title: str = ""
+    link: str = ""
+    description: str = ""
+    # Raw date string as published by the feed
+    published: str = ""
+    source: str = ""
+    # Language code of the feed the item came from
+    language: str = ""
+    # Feed category (e.g. 'technology'), empty when the feed has none
+    category: str = ""
+    # Parsed publish time in UTC, None when the date couldn't be parsed
+    published_at: Optional[datetime] = None
+    # Other sources that reported the same story (set by deduplication)
+    also_reported_by: Tuple[str, ...] = ()
+    cluster_size: int = 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert to a JSON-serializable dict.
+
+        Returns:
+            Dict of all fields, with published_at as an ISO 8601 string
+        """
+        data = asdict(self)
+        data["published_at"] = self.published_at.isoformat() if self.published_at else None
+        data["also_reported_by"] = list(self.also_reported_by)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "NewsItem":
+        """
+        Build an item from a dict produced by to_dict (unknown keys are ignored).
+
+        Args:
+            data: Item dict
+
+        Returns:
+            NewsItem instance
+        """
+        known = {f.name for f in fields(cls)}
+        values = {key: value for key, value in data.items() if key in known}
+        if values.get("published_at"):
+            values["published_at"] = datetime.fromisoformat(values["published_at"])
+        if "also_reported_by" in values:
+            values["also_reported_by"] = tuple(values["also_reported_by"])
+        return cls(**values)
@@ -0,0 +1,363 @@
+"""
+Feed parsers - Interchangeable backends that extract entries from feed bodies
+"""
+
+import io
+import threading
+import xml.etree.ElementTree as ET
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from ..logger import setup_logger
+
+try:
+    import feedparser
+except ImportError:
+    feedparser = None
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:
+    lxml_etree = None
+
+
+logger = setup_logger(__name__)
+
+ATOM_NAMESPACE = "http://www.w3.org/2005/Atom"
+RSS1_NAMESPACE = "http://purl.org/rss/1.0/"
+RSS090_NAMESPACE = "http://my.netscape.com/rdf/simple/0.9/"
+RDF_NAMESPACE = "http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+DC_NAMESPACE = "http://purl.org/dc/elements/1.1/"
+CONTENT_NAMESPACE = "http://purl.org/rss/1.0/modules/content/"
+
+# Item elements of RSS 2.0/0.9x, RSS 1.0 (RDF), RSS 0.90 and Atom
+ITEM_TAGS = (
+    "item",
+    f"{{{RSS1_NAMESPACE}}}item",
+    f"{{{RSS090_NAMESPACE}}}item",
+    f"{{{ATOM_NAMESPACE}}}entry",
+)
+
+# Child elements tried in order for each field, across all formats
+TITLE_TAGS = (
+    "title",
+    f"{{{RSS1_NAMESPACE}}}title",
+    f"{{{RSS090_NAMESPACE}}}title",
+    f"{{{ATOM_NAMESPACE}}}title",
+    f"{{{DC_NAMESPACE}}}title",
+)
+LINK_TAGS = (
+    "link",
+    f"{{{RSS1_NAMESPACE}}}link",
+    f"{{{RSS090_NAMESPACE}}}link",
+)
+DESCRIPTION_TAGS = (
+    "description",
+    f"{{{RSS1_NAMESPACE}}}description",
+    f"{{{ATOM_NAMESPACE}}}summary",
+    f"{{{CONTENT_NAMESPACE}}}encoded",
+    f"{{{ATOM_NAMESPACE}}}content",
+    f"{{{DC_NAMESPACE}}}description",
+)
+PUBLISHED_TAGS = (
+    "pubDate",
+    f"{{{DC_NAMESPACE}}}date",
+    f"{{{ATOM_NAMESPACE}}}published",
+    f"{{{ATOM_NAMESPACE}}}updated",
+    f"{{{ATOM_NAMESPACE}}}issued",
+)
+ATOM_LINK_TAG = f"{{{ATOM_NAMESPACE}}}link"
+RDF_ABOUT = f"{{{RDF_NAMESPACE}}}about"
+
+
+class FeedParseError(Exception):
+    """A feed body isn't well-formed enough to extract entries from"""
+
+
+def _element_text(elem: Any) -> str:
+    """Text of an element, including inline (e.g. Atom XHTML) children"""
+    if len(elem):
+        return "".join(elem.itertext())
+    return elem.text or ""
+
+
+def extract_entry(elem: Any) -> Dict[str, str]:
+    """
+    Extract the raw fields of an item element of any supported format.
+
+    Works on ElementTree and lxml elements alike.
+
+    Args:
+        elem: <item> or <entry> element
+
+    Returns:
+        Dict with 'title', 'link', 'description' and 'published' (raw text;
+        empty strings for missing fields)
+    """
+    children: Dict[Any, Any] = {}
+    atom_links = []
+    for child in elem:
+        if child.tag == ATOM_LINK_TAG:
+            atom_links.append(child)
+        else:
+            children.setdefault(child.tag, child)
+
+    def first(tags: Tuple[str, ...]) -> str:
+        for tag in tags:
+            child = children.get(tag)
+            if child is not None:
+                text = _element_text(child).strip()
+                if text:
+                    return text
+        return ""
+
+    link = first(LINK_TAGS)
+    if not link and atom_links:
+        # Prefer the entry's own page over enclosures and related links
+        alternate = [l for l in atom_links if l.get("rel", "alternate") == "alternate"]
+        link = (alternate or atom_links)[0].get("href", "")
+    if not link:
+        guid = children.get("guid")
+        if guid is not None and guid.get("isPermaLink", "true") != "false":
+            link = (guid.text or "").strip()
+    if not link:
+        link = elem.get(RDF_ABOUT, "")
+
+    return {
+        "title": first(TITLE_TAGS),
+        "link": link,
+        "description": first(DESCRIPTION_TAGS),
+        "published": first(PUBLISHED_TAGS),
+    }
+
+
+class FeedParser(ABC):
+    """
+    Base class for feed parser backends.
+
+    A backend reads a feed body from an iterable of byte chunks and returns
+    the raw fields of its first entries; cleaning the text is left to the
+    fetcher. Backends are stateless, so one instance serves all threads.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def parse(
+        self, chunks: Iterable[bytes], max_items: int, max_bytes: int
+    ) -> Tuple[List[Dict[str, str]], int]:
+        """
+        Parse a feed body.
+
+        Args:
+            chunks: Iterable of raw body chunks
+            max_items: Maximum number of entries to extract
+            max_bytes: Stop reading the body after this many bytes
+
+        Returns:
+            Tuple of (entries as from extract_entry, number of bytes read)
+
+        Raises:
+            FeedParseError: If the body isn't a feed
+        """
+        pass
+
+
+class ElementTreeParser(FeedParser):
+    """
+    Streaming parser on the standard library's ElementTree.
+
+    The body is fed into an incremental parser that stops reading once
+    ``max_items`` entries are complete, so memory and parse time grow with
+    ``max_items`` rather than with the feed size. Each entry element is
+    released once extracted so the partial tree stays small.
+    """
+
+    name = "etree"
+
+    def _pull_parser(self) -> Any:
+        """Create the incremental parser"""
+        return ET.XMLPullParser(events=("end",))
+
+    def _parse_errors(self) -> Tuple[type, ...]:
+        """Exceptions the incremental parser raises on malformed input"""
+        return (ET.ParseError,)
+
+    def _release(self, elem: Any) -> None:
+        """Free an extracted entry element"""
+        elem.clear()
+
+    def parse(
+        self, chunks: Iterable[bytes], max_items: int, max_bytes: int
+    ) -> Tuple[List[Dict[str, str]], int]:
+        parser = self._pull_parser()
+        entries: List[Dict[str, str]] = []
+        bytes_read = 0
+
+        def drain_events() -> bool:
+            """Extract finished entries; return True once max_items are done"""
+            for _, elem in parser.read_events():
+                if elem.tag not in ITEM_TAGS:
+                    continue
+                entries.append(extract_entry(elem))
+                self._release(elem)
+                if len(entries) >= max_items:
+                    return True
+            return False
+
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                bytes_read += len(chunk)
+                parser.feed(chunk)
+                if drain_events():
+                    return entries, bytes_read
+                if bytes_read >= max_bytes:
+                    logger.warning(
+                        f"Feed exceeded {max_bytes // 1024} KB, "
+                        f"keeping the {len(entries)} items parsed so far"
+                    )
+                    return entries, bytes_read
+
+            parser.close()
+            drain_events()
+        except self._parse_errors() as e:
+            raise FeedParseError(str(e)) from e
+        return entries, bytes_read
+
+
+class LxmlParser(ElementTreeParser):
+    """
+    Streaming parser on lxml (optional dependency).
+
+    Same extraction as the ElementTree backend, but faster on large feeds,
+    and lxml's recovering parser also reads feeds with stray markup errors
+    (unescaped ampersands, broken entities) that ElementTree rejects.
+    """
+
+    name = "lxml"
+
+    def _pull_parser(self) -> Any:
+        return lxml_etree.XMLPullParser(
+            events=("end",),
+            tag=ITEM_TAGS,
+            recover=True,
+            resolve_entities=False,
+            no_network=True,
+        )
+
+    def _parse_errors(self) -> Tuple[type, ...]:
+        return (lxml_etree.LxmlError,)
+
+    def _release(self, elem: Any) -> None:
+        elem.clear()
+        # Also drop the emptied siblings that lxml keeps in the tree
+        parent = elem.getparent()
+        while parent is not None and elem.getprevious() is not None:
+            del parent[0]
+
+
+class FeedparserParser(FeedParser):
+    """
+    Parser on the feedparser library (optional dependency).
+
+    Not streaming: the body is read up to ``max_bytes`` first. feedparser
+    is the most lenient backend (it understands every RSS and Atom variant
+    and falls back to a loose parser on malformed XML) and the slowest.
+    """
+
+    name = "feedparser"
+
+    def parse(
+        self, chunks: Iterable[bytes], max_items: int, max_bytes: int
+    ) -> Tuple[List[Dict[str, str]], int]:
+        body = bytearray()
+        for chunk in chunks:
+            body += chunk
+            if len(body) >= max_bytes:
+                logger.warning(
+                    f"Feed exceeded {max_bytes // 1024} KB, parsing the first "
+                    f"{len(body) // 1024} KB only"
+                )
+                break
+
+        result = feedparser.parse(
+            io.BytesIO(bytes(body)), sanitize_html=False, resolve_relative_uris=False
+        )
+        if result.bozo and not result.entries:
+            raise FeedParseError(str(result.get("bozo_exception", "not a feed")))
+
+        entries = []
+        for entry in result.entries[:max_items]:
+            description = entry.get("summary", "")
+            if not description and entry.get("content"):
+                description = entry.content[0].get("value", "")
+            link = entry.get("link", "")
+            if not link and entry.get("id", "").startswith(("http://", "https://")):
+                link = entry.id
+            entries.append(
+                {
+                    "title": entry.get("title", ""),
+                    "link": link,
+                    "description": description,
+                    "published": entry.get("published") or entry.get("updated", ""),
+                }
+            )
+        return entries, len(body)
+
+
+# Backends by name, with the module each one needs (None = standard library)
+FEED_PARSERS: Dict[str, Tuple[type, Optional[Any]]] = {
+    "etree": (ElementTreeParser, ET),
+    "lxml": (LxmlParser, lxml_etree),
+    "feedparser": (FeedparserParser, feedparser),
+}
+
+DEFAULT_PARSER = "etree"
+
+_instances: Dict[str, FeedParser] = {}
+_instances_lock = threading.Lock()
+
+
+def available_parsers() -> List[str]:
+    """Get the names of the backends whose dependencies are installed"""
+    return [name for name, (_, module) in FEED_PARSERS.items() if module is not None]
+
+
+def get_feed_parser(name: Optional[str] = None) -> FeedParser:
+    """
+    Get a feed parser backend.
+
+    A backend whose library isn't installed falls back to the ElementTree
+    backend with a warning (once per backend).
+
+    Args:
+        name: Backend name ('etree', 'lxml' or 'feedparser'; None = 'etree')
+
+    Returns:
+        Shared FeedParser instance
+
+    Raises:
+        ValueError: If name is not recognized
+    """
+    name = (name or DEFAULT_PARSER).lower()
+    if name not in FEED_PARSERS:
+        raise ValueError(
+            f"Unknown feed parser: {name}. "
+            f"Available parsers: {', '.join(FEED_PARSERS.keys())}"
+        )
+    with _instances_lock:
+        parser = _instances.get(name)
+        if parser is None:
+            parser_class, module = FEED_PARSERS[name]
+            if module is None:
+                logger.warning(
+                    f"Feed parser '{name}' needs the {name} package, which is not "
+                    f"installed; using '{DEFAULT_PARSER}' instead"
+                )
+                parser = FEED_PARSERS[DEFAULT_PARSER][0]()
+            else:
+                parser = parser_class()
+            _instances[name] = parser
+        return parser
+
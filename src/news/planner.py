@@ -0,0 +1,223 @@
+"""
+Run planner - Fetches every feed needed by a run exactly once
+"""
+
+import threading
+import time
+from collections import Counter
+from dataclasses import replace
+from typing import Dict, List, Iterable, Optional, Set
+from urllib.parse import urlparse
+from ..logger import setup_logger
+from .feed_registry import INTERNATIONAL_LANGUAGE
+from .fetcher import NewsFetcher
+from .models import NewsItem
+
+
+logger = setup_logger(__name__)
+
+
+class FeedPool:
+    """
+    In-memory pool of feed items fetched once and shared by all languages.
+
+    A pool may be filled while it is in use: feeds still being fetched are
+    pending, and reading them waits until they arrive.
+    """
+
+    def __init__(
+        self,
+        items_by_url: Optional[Dict[str, List[NewsItem]]] = None,
+        pending: Iterable[str] = (),
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            items_by_url: Mapping of feed URL to its fetched items
+            pending: URLs of feeds that will be added later
+        """
+        self._items_by_url = dict(items_by_url or {})
+        self._pending = set(pending) - set(self._items_by_url)
+        self._changed = threading.Condition()
+
+    def __contains__(self, feed_url: str) -> bool:
+        with self._changed:
+            return feed_url in self._items_by_url or feed_url in self._pending
+
+    def __len__(self) -> int:
+        with self._changed:
+            return len(self._items_by_url)
+
+    @property
+    def item_count(self) -> int:
+        """Total number of items fetched into the pool so far"""
+        with self._changed:
+            return sum(len(items) for items in self._items_by_url.values())
+
+    @property
+    def pending_count(self) -> int:
+        """Number of feeds still being fetched"""
+        with self._changed:
+            return len(self._pending)
+
+    def add(self, feed_url: str, items: List[NewsItem]) -> None:
+        """
+        Add the items of a fetched feed and wake up readers waiting for it.
+
+        Args:
+            feed_url: Feed URL
+            items: Fetched items
+        """
+        with self._changed:
+            self._items_by_url[feed_url] = items
+            self._pending.discard(feed_url)
+            self._changed.notify_all()
+
+    def close(self) -> None:
+        """Give up on feeds still pending; they read as empty"""
+        with self._changed:
+            for feed_url in self._pending:
+                self._items_by_url.setdefault(feed_url, [])
+            self._pending.clear()
+            self._changed.notify_all()
+
+    def wait_any(self, feed_urls: Iterable[str], timeout: Optional[float] = None) -> Set[str]:
+        """
+        Wait until at least one of the given feeds is in the pool.
+
+        Args:
+            feed_urls: Feed URLs to wait for
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            The given URLs that are available now (empty on timeout)
+        """
+        feed_urls = set(feed_urls)
+        with self._changed:
+            self._changed.wait_for(
+                lambda: not feed_urls.isdisjoint(self._items_by_url), timeout=timeout
+            )
+            return feed_urls.intersection(self._items_by_url)
+
+    def items_for(self, feed_url: str, source_name: str) -> List[NewsItem]:
+        """
+        Get a language pipeline's view of a feed's items.
+
+        Items are copied so one pipeline can't mutate another's view. If the
+        feed is still pending, this waits until it arrives.
+
+        Args:
+            feed_url: Feed URL
+            source_name: Source name to attribute the items to
+
+        Returns:
+            List of news items in feed order
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: feed_url not in self._pending)
+            items = self._items_by_url.get(feed_url, [])
+        return [replace(item, source=source_name) for item in items]
+
+
+class RunPlanner:
+    """Plan and execute the feed fetches for a multi-language run"""
+
+    def __init__(self, fetcher: NewsFetcher):
+        """
+        Initialize the planner.
+
+        Args:
+            fetcher: NewsFetcher used to resolve and fetch feeds
+        """
+        self.fetcher = fetcher
+
+    def plan(self, languages: Iterable[str]) -> Dict[str, str]:
+        """
+        Compute the unique set of feeds needed by all languages.
+
+        Args:
+            languages: Language codes processed in this run
+
+        Returns:
+            Mapping of feed URL to the source name it was first configured
+            under, one entry per unique URL
+        """
+        feeds = {}
+        for language in [INTERNATIONAL_LANGUAGE, *languages]:
+            language_feeds = (
+                self.fetcher.rss_feeds
+                if language == INTERNATIONAL_LANGUAGE
+                else self.fetcher.get_domestic_feeds(language)
+            )
+            for source_name, feed_url in language_feeds.items():
+                feeds.setdefault(feed_url, source_name)
+        return feeds
+
+    def execute(
+        self,
+        languages: List[str],
+        max_items_per_source: int = 5,
+        background: bool = False,
+    ) -> FeedPool:
+        """
+        Fetch every planned feed once and return the shared pool.
+
+        Args:
+            languages: Language codes processed in this run
+            max_items_per_source: Maximum items to fetch per source
+            background: Return at once and fill the pool as feeds complete,
+                so pipelines can start before the slowest feeds finish
+
+        Returns:
+            FeedPool holding (or, in the background, receiving) the items of
+            every planned feed
+        """
+        feeds = self.plan(languages)
+
+        naive_fetches = len(languages) * len(self.fetcher.rss_feeds) + sum(
+            len(self.fetcher.get_domestic_feeds(language)) for language in languages
+        )
+        hosts = Counter(urlparse(url).netloc.lower() for url in feeds)
+        busiest = ", ".join(f"{host} x{count}" for host, count in hosts.most_common(3))
+        logger.info(
+            f"Run plan: {len(feeds)} unique feeds for {len(languages)} language(s) "
+            f"(instead of {naive_fetches} per-language fetches) across "
+            f"{len(hosts)} hosts; busiest: {busiest}"
+        )
+
+        # The fetcher keys feeds by source name; a name reused for another
+        # URL (e.g. by two languages) gets a suffix so every URL is fetched
+        urls_by_key = {}
+        for feed_url, source_name in feeds.items():
+            key = source_name
+            suffix = 2
+            while key in urls_by_key:
+                key = f"{source_name} ({suffix})"
+                suffix += 1
+            urls_by_key[key] = feed_url
+
+        if not background:
+            results = self.fetcher.fetch_feeds(urls_by_key, max_items=max_items_per_source)
+            return FeedPool({urls_by_key[key]: items for key, items in results.items()})
+
+        pool = FeedPool(pending=feeds)
+
+        def fill() -> None:
+            start = time.monotonic()
+            try:
+                for key, items in self.fetcher.iter_feeds(
+                    urls_by_key, max_items=max_items_per_source
+                ):
+                    pool.add(urls_by_key[key], items)
+            except Exception as e:
+                logger.error(f"Background feed fetch failed: {str(e)}", exc_info=True)
+            finally:
+                pool.close()
+            logger.info(
+                f"Run pool complete: {pool.item_count} items from {len(pool)} feeds "
+                f"in {time.monotonic() - start:.1f}s"
+            )
+
+        threading.Thread(target=fill, name="feed-pool", daemon=True).start()
+        return pool
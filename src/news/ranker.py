@@ -0,0 +1,208 @@
+"""
+Relevance pre-ranker - Shrink the Stage 1 candidate pool locally
+"""
+
+import math
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from ..logger import setup_logger
+from .models import NewsItem
+
+
+logger = setup_logger(__name__)
+
+# Weights of the score components (each component is in [0, 1])
+RELEVANCE_WEIGHT = 0.6
+FRESHNESS_WEIGHT = 0.25
+CLUSTER_WEIGHT = 0.15
+# Cluster size at which the cluster component saturates
+CLUSTER_SATURATION = 8
+# Freshness assumed for items without a parseable date
+UNDATED_FRESHNESS = 0.5
+
+_WORD_RE = re.compile(r"\w+", re.UNICODE)
+_CJK_RE = re.compile(r"[぀-ヿ㐀-鿿가-힯]")
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the "
+    "this to was were will with about after new says over into than".split()
+)
+
+
+def _terms(text: str) -> List[str]:
+    """Split text into index terms: words, or character bigrams for CJK"""
+    tokens = _WORD_RE.findall(text.lower())
+    if not _CJK_RE.search(text):
+        return [token for token in tokens if len(token) > 1 and token not in _STOPWORDS]
+
+    terms = []
+    for token in tokens:
+        if _CJK_RE.search(token):
+            terms.extend(token[i:i + 2] for i in range(max(1, len(token) - 1)))
+        elif len(token) > 1 and token not in _STOPWORDS:
+            terms.append(token)
+    return terms
+
+
+def _tfidf(counts: Counter, idf: Dict[str, float]) -> Dict[str, float]:
+    """Build an L2-normalized sparse TF-IDF vector from term counts"""
+    vector = {
+        term: (1 + math.log(count)) * idf.get(term, 0.0)
+        for term, count in counts.items()
+    }
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if not norm:
+        return {}
+    return {term: weight / norm for term, weight in vector.items()}
+
+
+def _topic_relevance(
+    counts: Counter, idf: Dict[str, float], topic_vectors: List[Dict[str, float]]
+) -> float:
+    """Cosine similarity of an item's term counts to its closest topic vector"""
+    squares = 0.0
+    weights = {}
+    for term, count in counts.items():
+        weight = idf[term] if count == 1 else (1 + math.log(count)) * idf[term]
+        squares += weight * weight
+        weights[term] = weight
+    best = max(
+        sum(topic_weight * weights.get(term, 0.0) for term, topic_weight in topic.items())
+        for topic in topic_vectors
+    )
+    return best / math.sqrt(squares) if squares else 0.0
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough LLM token count of a text (about 4 characters per token)"""
+    return len(text) // 4
+
+
+class RelevanceRanker:
+    """
+    Score news items against the configured topics.
+
+    The score combines TF-IDF cosine similarity to the closest topic,
+    freshness (exponential decay by age), the number of sources reporting
+    the story, and an optional per-source weight.
+    """
+
+    def __init__(
+        self,
+        topics: List[str],
+        source_weights: Optional[Dict[str, float]] = None,
+        half_life_hours: float = 24,
+    ):
+        """
+        Initialize the ranker.
+
+        Args:
+            topics: Topic descriptions to rank relevance against
+            source_weights: Score multiplier per source name (default 1.0)
+            half_life_hours: Age at which the freshness component halves
+        """
+        self.topic_terms = [Counter(_terms(topic)) for topic in topics]
+        self.source_weights = source_weights or {}
+        self.half_life_hours = half_life_hours
+
+    def score(
+        self, items: List[NewsItem], now: Optional[datetime] = None
+    ) -> List[float]:
+        """
+        Score items; IDF statistics come from the items themselves.
+
+        Args:
+            items: News items
+            now: Reference time for freshness (defaults to the current UTC time)
+
+        Returns:
+            Scores in item order, higher is more relevant
+        """
+        if not items:
+            return []
+        now = now or datetime.now(timezone.utc)
+
+        # Titles are counted twice: they carry most of the story's topic
+        item_terms = [
+            Counter(_terms(f"{item.title} {item.title} {item.description}"))
+            for item in items
+        ]
+        document_frequency = Counter()
+        for counts in item_terms:
+            document_frequency.update(counts.keys())
+        documents = len(items)
+        idf = {
+            term: math.log((1 + documents) / (1 + frequency)) + 1
+            for term, frequency in document_frequency.items()
+        }
+        # Topic terms absent from every item can't match anything
+        topic_vectors = [
+            vector for vector in (_tfidf(counts, idf) for counts in self.topic_terms) if vector
+        ]
+
+        decay = math.log(2) / (self.half_life_hours * 3600)
+        cluster_scale = math.log(CLUSTER_SATURATION)
+        scores = []
+        # Items sharing no term with any topic have zero relevance
+        topic_terms = set().union(*topic_vectors)
+        for item, counts in zip(items, item_terms):
+            relevance = 0.0
+            if not topic_terms.isdisjoint(counts):
+                relevance = _topic_relevance(counts, idf, topic_vectors)
+            if item.published_at is not None:
+                age = max(0.0, (now - item.published_at).total_seconds())
+                freshness = math.exp(-decay * age)
+            else:
+                freshness = UNDATED_FRESHNESS
+            cluster = min(1.0, math.log(max(1, item.cluster_size)) / cluster_scale)
+
+            scores.append(
+                (
+                    RELEVANCE_WEIGHT * relevance
+                    + FRESHNESS_WEIGHT * freshness
+                    + CLUSTER_WEIGHT * cluster
+                )
+                * self.source_weights.get(item.source, 1.0)
+            )
+        return scores
+
+    def select(
+        self,
+        news_data: Dict[str, List[NewsItem]],
+        max_candidates: int,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, List[NewsItem]]:
+        """
+        Keep the best ``max_candidates`` items across all sections.
+
+        The cap is split between sections in proportion to their size, so
+        domestic news isn't crowded out by the larger international pool.
+        Kept items stay in their original order.
+
+        Args:
+            news_data: Dictionary with 'international' and 'domestic' news lists
+            max_candidates: Maximum number of items to keep in total
+            now: Reference time for freshness
+
+        Returns:
+            New dictionary with the same sections
+        """
+        total = sum(len(items) for items in news_data.values())
+        if total <= max_candidates:
+            return {section: list(items) for section, items in news_data.items()}
+
+        all_items = [item for items in news_data.values() for item in items]
+        scores = iter(self.score(all_items, now=now))
+
+        selected = {}
+        remaining_cap = max_candidates
+        remaining_items = total
+        for section, items in news_data.items():
+            section_scores = [next(scores) for _ in items]
+            quota = round(remaining_cap * len(items) / remaining_items) if remaining_items else 0
+            remaining_cap -= quota
+            remaining_items -= len(items)
+            best = sorted(range(len(items)), key=lambda i: -section_scores[i])[:quota]
+            selected[section] = [items[i] for i in sorted(best)]
+        return selected
@@ -0,0 +1,238 @@
+"""
+Sharded fetcher - Split very large feed batches across worker processes
+"""
+
+import multiprocessing
+import os
+import time
+import zlib
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from ..logger import setup_logger
+from .feed_cache import FeedCache
+from .feed_health import FeedHealthTracker
+from .fetcher import NewsFetcher
+from .host_scheduler import HostScheduler
+from .models import NewsItem
+
+
+logger = setup_logger(__name__)
+
+# The fetcher of the current worker process, built once by _init_worker
+_worker_fetcher: Optional[NewsFetcher] = None
+
+
+def worker_fetcher_from_config(config_path: Optional[str] = None) -> NewsFetcher:
+    """
+    Build a worker process's fetcher from configuration.
+
+    Workers don't write the feed health file, open the item store or
+    revalidate in the background; the parent merges their results.
+
+    Args:
+        config_path: Path to config.yaml (None = default locations)
+
+    Returns:
+        NewsFetcher instance
+    """
+    from ..config import Config
+    from ..http_fixtures import create_http_client
+
+    config = Config(config_path)
+    return NewsFetcher.from_config(
+        config,
+        http_client=create_http_client(config),
+        feed_health=(
+            FeedHealthTracker(
+                path=config.feed_health_path,
+                failure_threshold=config.feed_health_failure_threshold,
+                backoff_minutes=config.feed_health_backoff_minutes,
+                read_only=True,
+            )
+            if config.feed_health_enabled
+            else None
+        ),
+        item_store=None,
+        revalidate_in_background=False,
+    )
+
+
+def _init_worker(factory: Callable[..., NewsFetcher], factory_args: Tuple) -> None:
+    """Build the worker process's fetcher"""
+    global _worker_fetcher
+    _worker_fetcher = factory(*factory_args)
+
+
+def _ready() -> bool:
+    """No-op task used to wait for worker start-up"""
+    return _worker_fetcher is not None
+
+
+def _fetch_shard(feeds: Dict[str, str], max_items: int) -> Dict[str, Any]:
+    """
+    Fetch one shard in a worker process.
+
+    Returns:
+        Dict with 'results' (source name, items) pairs, the shard's updated
+        'health' records and the 'cache_stats' counters of this shard
+    """
+    fetcher = _worker_fetcher
+    cache_before = dict(fetcher.feed_cache.stats) if fetcher.feed_cache is not None else {}
+
+    results = list(fetcher.iter_feeds(feeds, max_items))
+
+    health = {}
+    if fetcher.feed_health is not None:
+        health = fetcher.feed_health.records_for(list(feeds.values()))
+    cache_stats = {}
+    if fetcher.feed_cache is not None:
+        cache_stats = {
+            key: value - cache_before.get(key, 0)
+            for key, value in fetcher.feed_cache.stats.items()
+        }
+    return {"results": results, "health": health, "cache_stats": cache_stats}
+
+
+class ShardedFetcher:
+    """
+    Fetch feed batches on a pool of worker processes.
+
+    Parsing and text cleaning are CPU-bound, so past a few hundred feeds a
+    single process is limited by the GIL. Feeds are split into shards by
+    host (so each host's politeness limits are enforced by one process),
+    and each worker fetches its shard with its own thread pool. Only a few
+    shards are in flight per process, which bounds the parent's memory to
+    those shards' items plus what the caller keeps.
+    """
+
+    def __init__(
+        self,
+        processes: Optional[int] = None,
+        fetcher_factory: Callable[..., NewsFetcher] = worker_fetcher_from_config,
+        factory_args: Tuple = (),
+        shards_per_process: int = 4,
+        min_feeds: int = 200,
+    ):
+        """
+        Initialize the sharded fetcher (worker processes start on first use).
+
+        Args:
+            processes: Number of worker processes (None = CPU count)
+            fetcher_factory: Picklable top-level function that builds a
+                worker's NewsFetcher
+            factory_args: Arguments for fetcher_factory
+            shards_per_process: Shards per worker process; more shards
+                balance load better and keep each result smaller
+            min_feeds: Smallest batch worth sharding (NewsFetcher fetches
+                smaller batches itself)
+        """
+        self.processes = max(1, processes or os.cpu_count() or 1)
+        self.fetcher_factory = fetcher_factory
+        self.factory_args = factory_args
+        self.shards_per_process = max(1, shards_per_process)
+        self.min_feeds = min_feeds
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        """Start the worker processes"""
+        if self._executor is None:
+            # Fresh interpreters: forking a process with live threads and
+            # connection pools isn't safe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.fetcher_factory, self.factory_args),
+            )
+        return self._executor
+
+    def start(self) -> None:
+        """Start the worker processes now instead of on the first batch"""
+        pool = self._pool()
+        wait([pool.submit(_ready) for _ in range(self.processes)])
+
+    def shard(self, feeds: Dict[str, str]) -> List[Dict[str, str]]:
+        """
+        Split feeds into shards, keeping all feeds of a host together.
+
+        Args:
+            feeds: Mapping of source name to feed URL
+
+        Returns:
+            Non-empty shards, largest first
+        """
+        shard_count = self.processes * self.shards_per_process
+        shards: List[Dict[str, str]] = [{} for _ in range(shard_count)]
+        for source_name, feed_url in feeds.items():
+            host = HostScheduler.host_of(feed_url)
+            shards[zlib.crc32(host.encode("utf-8")) % shard_count][source_name] = feed_url
+        return sorted((shard for shard in shards if shard), key=len, reverse=True)
+
+    def iter_feeds(
+        self,
+        feeds: Dict[str, str],
+        max_items: int = 10,
+        feed_health: Optional[FeedHealthTracker] = None,
+        feed_cache: Optional[FeedCache] = None,
+    ) -> Iterator[Tuple[str, List[NewsItem]]]:
+        """
+        Fetch feeds across the worker processes, yielding each shard's
+        feeds as the shard completes.
+
+        Args:
+            feeds: Mapping of source name to feed URL
+            max_items: Maximum number of items to fetch per feed
+            feed_health: Tracker that the workers' health records are merged into
+            feed_cache: Cache whose counters the workers' counters are added to
+
+        Yields:
+            (source name, items) pairs, as from NewsFetcher.iter_feeds
+        """
+        start = time.monotonic()
+        shards = self.shard(feeds)
+        pending = iter(shards)
+        in_flight: Dict[Future, Dict[str, str]] = {}
+        max_in_flight = self.processes * 2
+        executor = self._pool()
+
+        def submit_next() -> None:
+            shard = next(pending, None)
+            if shard is not None:
+                in_flight[executor.submit(_fetch_shard, shard, max_items)] = shard
+
+        for _ in range(max_in_flight):
+            submit_next()
+
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                shard = in_flight.pop(future)
+                submit_next()
+                try:
+                    shard_result = future.result()
+                except Exception as e:
+                    logger.error(
+                        f"Feed shard of {len(shard)} feeds failed: {str(e)}"
+                    )
+                    for source_name in shard:
+                        yield source_name, []
+                    continue
+
+                if feed_health is not None:
+                    feed_health.merge_records(shard_result["health"])
+                if feed_cache is not None:
+                    feed_cache.merge_stats(shard_result["cache_stats"])
+                yield from shard_result["results"]
+
+        if feed_health is not None:
+            feed_health.save()
+        logger.info(
+            f"Fetched {len(feeds)} feeds in {time.monotonic() - start:.1f}s "
+            f"across {self.processes} processes ({len(shards)} shards)"
+        )
+
+    def close(self) -> None:
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
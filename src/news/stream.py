@@ -0,0 +1,206 @@
+"""
+News stream - Hand fetched feeds to selection as soon as a quorum is in
+"""
+
+import math
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from ..logger import setup_logger
+from .fetcher import NewsFetcher
+from .models import NewsItem
+from .planner import FeedPool
+
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class FetchQuorum:
+    """
+    When enough feeds have answered to start Stage 1.
+
+    The quorum is met once ``min_fraction`` of the feeds are in, once
+    ``min_items`` items are in, or ``deadline_seconds`` after fetching
+    started, whichever comes first.
+    """
+
+    min_fraction: float = 0.8
+    min_items: Optional[int] = None
+    deadline_seconds: Optional[float] = None
+
+    def is_met(self, feeds_done: int, feeds_total: int, item_count: int, elapsed: float) -> bool:
+        """
+        Check the quorum.
+
+        Args:
+            feeds_done: Feeds that answered (or failed)
+            feeds_total: Feeds requested
+            item_count: Items received so far
+            elapsed: Seconds since fetching started
+
+        Returns:
+            True if selection can start
+        """
+        if feeds_done >= feeds_total or feeds_done >= math.ceil(self.min_fraction * feeds_total):
+            return True
+        if self.min_items is not None and item_count >= self.min_items:
+            return True
+        return self.deadline_seconds is not None and elapsed >= self.deadline_seconds
+
+    def remaining(self, elapsed: float) -> Optional[float]:
+        """Seconds left until the deadline (None = no deadline)"""
+        if self.deadline_seconds is None:
+            return None
+        return max(0.0, self.deadline_seconds - elapsed)
+
+
+class NewsStream:
+    """
+    The feeds of one language, delivered as each completes.
+
+    Feeds come from a shared FeedPool when given (which may still be
+    filling) and are fetched directly otherwise. ``take`` returns what has
+    arrived once a quorum is met; ``take_rest`` returns feeds that arrived
+    after that.
+    """
+
+    def __init__(
+        self,
+        fetcher: NewsFetcher,
+        language: str = "en",
+        max_items_per_source: int = 5,
+        news_pool: Optional[FeedPool] = None,
+    ):
+        """
+        Start delivering feeds.
+
+        Args:
+            fetcher: NewsFetcher that resolves and fetches the feeds
+            language: Language code of the domestic feeds
+            max_items_per_source: Maximum items to fetch per source
+            news_pool: Feeds already fetched (or being fetched) for this run
+        """
+        self.fetcher = fetcher
+        self.language = language
+        self.feeds = {**fetcher.rss_feeds, **fetcher.get_domestic_feeds(language)}
+        self.started_at = time.monotonic()
+        self._arrivals: "queue.Queue[Tuple[str, List[NewsItem]]]" = queue.Queue()
+        self._results: Dict[str, List[NewsItem]] = {}
+        self._delivered: set = set()
+
+        pooled = {}
+        missing = {}
+        for source_name, feed_url in self.feeds.items():
+            if news_pool is not None and feed_url in news_pool:
+                pooled.setdefault(feed_url, []).append(source_name)
+            else:
+                missing[source_name] = feed_url
+
+        if pooled:
+            threading.Thread(
+                target=self._read_pool, args=(news_pool, pooled), daemon=True
+            ).start()
+        if missing:
+            threading.Thread(
+                target=self._fetch, args=(missing, max_items_per_source), daemon=True
+            ).start()
+
+    def _read_pool(self, news_pool: FeedPool, pooled: Dict[str, List[str]]) -> None:
+        """Pass pool feeds on as they become available"""
+        remaining = set(pooled)
+        while remaining:
+            for feed_url in news_pool.wait_any(remaining):
+                remaining.discard(feed_url)
+                for source_name in pooled[feed_url]:
+                    self._arrivals.put((source_name, news_pool.items_for(feed_url, source_name)))
+
+    def _fetch(self, feeds: Dict[str, str], max_items: int) -> None:
+        """Fetch feeds missing from the pool and pass them on as they complete"""
+        done = set()
+        try:
+            for source_name, items in self.fetcher.iter_feeds(feeds, max_items):
+                self._arrivals.put((source_name, items))
+                done.add(source_name)
+        except Exception as e:
+            logger.error(f"Streaming feed fetch failed: {str(e)}", exc_info=True)
+            for source_name in feeds:
+                if source_name not in done:
+                    self._arrivals.put((source_name, []))
+
+    def _receive(self, timeout: Optional[float]) -> bool:
+        """Wait for the next feed; return False on timeout"""
+        try:
+            source_name, items = self._arrivals.get(timeout=timeout)
+        except queue.Empty:
+            return False
+        self._results[source_name] = items
+        return True
+
+    def _collect(self) -> Dict[str, List[NewsItem]]:
+        """Group the feeds received but not yet handed out"""
+        fresh = {
+            source_name: items
+            for source_name, items in self._results.items()
+            if source_name not in self._delivered
+        }
+        self._delivered.update(fresh)
+        return self.fetcher.group_news(self.language, fresh)
+
+    @property
+    def pending(self) -> List[str]:
+        """Source names of feeds that haven't arrived yet"""
+        return [source_name for source_name in self.feeds if source_name not in self._results]
+
+    def take(self, quorum: FetchQuorum) -> Dict[str, List[NewsItem]]:
+        """
+        Wait for the quorum and return the feeds received so far.
+
+        Args:
+            quorum: When to stop waiting
+
+        Returns:
+            Dictionary with 'international' and 'domestic' news lists
+        """
+        while True:
+            elapsed = time.monotonic() - self.started_at
+            item_count = sum(len(items) for items in self._results.values())
+            if quorum.is_met(len(self._results), len(self.feeds), item_count, elapsed):
+                break
+            if not self._receive(quorum.remaining(elapsed)):
+                break
+
+        # Take whatever else has already arrived without waiting
+        while self._receive(timeout=0):
+            pass
+
+        elapsed = time.monotonic() - self.started_at
+        pending = self.pending
+        if pending:
+            logger.info(
+                f"Quorum reached after {elapsed:.1f}s with {len(self._results)} of "
+                f"{len(self.feeds)} feeds; still waiting on: {', '.join(pending)}"
+            )
+        return self._collect()
+
+    def take_rest(self, timeout: Optional[float] = None) -> Dict[str, List[NewsItem]]:
+        """
+        Wait for the remaining feeds and return those not handed out yet.
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            Dictionary with 'international' and 'domestic' news lists
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.pending:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._receive(remaining):
+                logger.warning(
+                    f"Dropping feeds that didn't arrive in time: {', '.join(self.pending)}"
+                )
+                break
+        return self._collect()
@@ -0,0 +1,142 @@
+"""
+Text normalization - Turn feed HTML snippets into compact plain text
+"""
+
+import re
+from functools import lru_cache
+from html import unescape
+from typing import Optional
+
+
+# Block-level tags separate words; inline tags (<a>, <b>, ...) don't
+_BLOCK_TAGS = frozenset(
+    "p br div li ul ol h1 h2 h3 h4 h5 h6 tr td th table blockquote figure "
+    "figcaption section article header footer hr img pre script style".split()
+)
+
+# A gap is a run of whitespace, tags, comments, <script>/<style> blocks and
+# non-breaking spaces; it collapses to one space (or nothing between inline
+# tags). Only "<" followed by a letter, "/", "!" or "?" opens a tag, so
+# comparisons in text ("price < 10") are kept. A comment cut off at the end
+# of the text still counts; an unclosed "<" only does when what follows is a
+# tag name with attributes up to the end (a description cut mid-tag, e.g.
+# '<a href="https://...'), otherwise it is text ("CPI<Target for ...").
+_SKIP = r"<!--.*?(?:-->|$)|<(?i:script|style)\b.*?(?:</(?i:script|style)\s*>|$)"
+_CUT_TAG = (
+    r"/?[A-Za-z][\w:-]*"
+    r"""(?:\s+[\w:.-]+\s*=\s*(?:"[^"]*"?|'[^']*'?|[^\s<>"']*))+"""
+    r"(?:\s+[\w:.-]*)?$"
+)
+_TAG = rf"<(?=[A-Za-z/!?])(?!!\[CDATA\[)(?:[^<>]*>|{_CUT_TAG})"
+_GAP = rf"(?:\s|{_SKIP}|{_TAG}|&nbsp;|&#160;|&#xa0;)*"
+_NBSP = ("&nbsp;", "&#160;", "&#xa0;")
+_CDATA_MARKERS = ("<![CDATA[", "]]>")
+
+# One alternation handles every construct in a single left-to-right pass.
+# Every branch starts with a literal character, which lets the regex engine
+# jump straight to candidate positions instead of trying each branch at
+# every character of plain text.
+_NORMALIZE_RE = re.compile(
+    "|".join(
+        [
+            # CDATA markers left over from double-wrapped feeds
+            r"<!\[CDATA\[",
+            r"\]\]>",
+            # Gaps, by their first character
+            *(rf"{start}{_GAP}" for start in _SKIP.split("|")),
+            rf"{_TAG}{_GAP}",
+            *(rf"{nbsp}{_GAP}" for nbsp in _NBSP),
+            # A lone space between words is left alone
+            rf" (?=[\s<&]){_GAP}",
+            *(rf"{space}{_GAP}" for space in ("\t", "\n", "\r", "\f", "\v", "\xa0", "\u3000")),
+            # Character entities
+            r"&(?:#[0-9]{1,7}|#[xX][0-9a-fA-F]{1,6}|[A-Za-z][A-Za-z0-9]{1,31});",
+        ]
+    ),
+    re.DOTALL,
+)
+_TAG_NAME_RE = re.compile(r"</?\s*([A-Za-z][A-Za-z0-9]*)")
+_WHITESPACE_RE = re.compile(r"\s")
+
+# Sentence ends, including CJK full-width punctuation
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)|[。！？]")
+
+
+@lru_cache(maxsize=4096)
+def _replacement(run: str) -> str:
+    """Get the substitute of one match of _NORMALIZE_RE (runs repeat a lot)"""
+    if run[0] == "&" and run[-1] == ";" and not run.startswith(_NBSP):
+        return unescape(run)
+    if run in _CDATA_MARKERS:
+        return ""
+    if "&" in run or "<!" in run or _WHITESPACE_RE.search(run):
+        return " "
+    for tag in _TAG_NAME_RE.findall(run):
+        if tag.lower() in _BLOCK_TAGS:
+            return " "
+    return ""
+
+
+def _replace(match: "re.Match[str]") -> str:
+    """Substitute one match of _NORMALIZE_RE"""
+    return _replacement(match.group())
+
+
+def truncate_text(text: str, max_chars: int, ellipsis: str = "…") -> str:
+    """
+    Shorten text to at most ``max_chars``, preferring a sentence boundary.
+
+    Cuts after the last sentence end in the second half of the limit, else
+    at the last space, else mid-word; an ellipsis marks cuts that aren't at
+    a sentence end.
+
+    Args:
+        text: Plain text
+        max_chars: Maximum length of the result
+        ellipsis: Appended when the cut isn't at a sentence end
+
+    Returns:
+        Text unchanged if short enough, otherwise its truncated form
+    """
+    if len(text) <= max_chars:
+        return text
+
+    window = text[: max_chars + 1]
+    sentence_end = -1
+    for match in _SENTENCE_END_RE.finditer(window):
+        sentence_end = match.end()
+    if sentence_end >= max_chars // 2:
+        return window[:sentence_end]
+
+    cut = max_chars - len(ellipsis)
+    space = window.rfind(" ", 0, cut + 1)
+    if space >= max_chars // 2:
+        cut = space
+    return window[:cut].rstrip() + ellipsis
+
+
+def clean_text(text: Optional[str], max_chars: Optional[int] = None) -> str:
+    """
+    Normalize a feed snippet to plain text.
+
+    Strips tags, comments and scripts, decodes entities (&amp;, &#8217;, ...)
+    and collapses whitespace in one pass, then optionally truncates at a
+    sentence boundary.
+
+    Args:
+        text: Raw title or description, possibly containing HTML
+        max_chars: Truncate the result to this many characters (None = keep all)
+
+    Returns:
+        Plain text
+    """
+    if not text:
+        return ""
+    if max_chars is not None:
+        # Markup and entities make the raw text longer than the result, so
+        # a generous prefix is enough and bounds the work on huge bodies
+        text = text[: max_chars * 8]
+    cleaned = _NORMALIZE_RE.sub(_replace, text).strip()
+    if max_chars is not None:
+        cleaned = truncate_text(cleaned, max_chars)
+    return cleaned
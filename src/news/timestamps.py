@@ -0,0 +1,142 @@
+"""
+Publish timestamps - Parse feed dates and filter items by recency
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+from ..logger import setup_logger
+from .models import NewsItem
+
+
+logger = setup_logger(__name__)
+
+
+def _parse_rfc822(value: str) -> datetime:
+    """Parse an RSS pubDate (RFC 822), e.g. 'Mon, 13 Oct 2025 08:00:00 GMT'"""
+    return parsedate_to_datetime(value)
+
+
+def _parse_iso8601(value: str) -> datetime:
+    """Parse an Atom/RSS 1.0 date (ISO 8601), e.g. '2025-10-13T08:00:00Z'"""
+    return datetime.fromisoformat(value)
+
+
+def _parse_compact(value: str) -> datetime:
+    """Parse a date without time zone, e.g. '2025-10-13 08:00:00'"""
+    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
+
+
+TIMESTAMP_PARSERS: List[Callable[[str], datetime]] = [
+    _parse_rfc822,
+    _parse_iso8601,
+    _parse_compact,
+]
+
+
+def _to_utc(value: datetime) -> datetime:
+    """Normalize a datetime to UTC, treating naive values as UTC"""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@lru_cache(maxsize=8192)
+def _parse_with(parser_index: int, value: str) -> Optional[datetime]:
+    """Parse a value with one parser; None if it doesn't match"""
+    try:
+        return _to_utc(TIMESTAMP_PARSERS[parser_index](value))
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+def parse_timestamps(values: List[str]) -> List[Optional[datetime]]:
+    """
+    Parse a batch of raw feed dates into UTC datetimes.
+
+    A feed uses one date format for all its items, so the parser that
+    matched the previous value is tried first and the others only on a
+    miss. Results are cached per (parser, value).
+
+    Args:
+        values: Raw date strings (usually all items of one feed)
+
+    Returns:
+        Parsed UTC datetimes, None where a value couldn't be parsed
+    """
+    results = []
+    preferred = 0
+    for raw in values:
+        value = (raw or "").strip()
+        parsed = None
+        if value:
+            order = [preferred] + [i for i in range(len(TIMESTAMP_PARSERS)) if i != preferred]
+            for parser_index in order:
+                parsed = _parse_with(parser_index, value)
+                if parsed is not None:
+                    preferred = parser_index
+                    break
+        results.append(parsed)
+    return results
+
+
+def annotate_timestamps(items: List[NewsItem]) -> None:
+    """
+    Set the parsed ``published_at`` UTC datetime of each item in place.
+
+    Args:
+        items: Items of one feed, with raw ``published`` strings
+    """
+    for item, published_at in zip(
+        items, parse_timestamps([item.published for item in items])
+    ):
+        item.published_at = published_at
+
+
+def apply_recency_window(
+    news_data: Dict[str, List[NewsItem]],
+    max_age_hours: Optional[float] = None,
+    sort_by_freshness: bool = True,
+    now: Optional[datetime] = None,
+) -> Dict[str, List[NewsItem]]:
+    """
+    Drop stale items and order each section newest first.
+
+    Items without a parseable date are kept and placed after dated items.
+
+    Args:
+        news_data: Dictionary with 'international' and 'domestic' news lists
+        max_age_hours: Drop items published longer ago than this (None keeps all)
+        sort_by_freshness: Sort each section by publish time, newest first
+        now: Reference time (defaults to the current UTC time)
+
+    Returns:
+        New dictionary with the same sections
+    """
+    now = now or datetime.now(timezone.utc)
+    cutoff = now - timedelta(hours=max_age_hours) if max_age_hours else None
+
+    filtered = {}
+    dropped = 0
+    for section, items in news_data.items():
+        kept = [
+            item
+            for item in items
+            if cutoff is None
+            or item.published_at is None
+            or item.published_at >= cutoff
+        ]
+        dropped += len(items) - len(kept)
+        if sort_by_freshness:
+            # Stable sort keeps feed order among equal and undated items
+            kept.sort(
+                key=lambda item: item.published_at
+                or datetime.min.replace(tzinfo=timezone.utc),
+                reverse=True,
+            )
+        filtered[section] = kept
+
+    if dropped:
+        logger.info(f"Recency window: dropped {dropped} items older than {max_age_hours}h")
+    return filtered
@@ -2,9 +2,9 @@
 Web Search Tool for fetching real-time news
 """
 import os
-import requests
 from typing import List, Dict, Optional
 from ..logger import setup_logger
+from ..http_client import HttpClient, get_default_http_client
 
 
 logger = setup_logger(__name__)
@@ -13,8 +13,14 @@ logger = setup_logger(__name__)
 class WebSearchTool:
     """Tool for searching the web to fetch current AI news"""
 
-    def __init__(self):
-        """Initialize the web search tool"""
+    def __init__(self, http_client: Optional[HttpClient] = None):
+        """
+        Initialize the web search tool.
+
+        Args:
+            http_client: Shared HTTP client. If None, the default client is used
+        """
+        self.http = http_client or get_default_http_client()
         # Using DuckDuckGo's API as a free alternative
         # Could also integrate with Google Custom Search, Brave Search, etc.
         self.search_api_url = "https://api.duckduckgo.com/"
@@ -42,7 +48,7 @@ class WebSearchTool:
                 't': 'ai-news-bot'
             }
 
-            response = requests.get(self.search_api_url, params=params, timeout=10)
+            response = self.http.get(self.search_api_url, params=params, timeout=10)
             response.raise_for_status()
 
             data = response.json()
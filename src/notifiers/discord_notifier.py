@@ -6,6 +6,7 @@ import requests
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from ..logger import setup_logger
+from ..http_client import HttpClient, get_default_http_client
 
 
 logger = setup_logger(__name__)
@@ -19,7 +20,8 @@ class DiscordNotifier:
         webhook_url: Optional[str] = None,
         username: Optional[str] = None,
         avatar_url: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        http_client: Optional[HttpClient] = None
     ):
         """
         Initialize DiscordNotifier.
@@ -29,11 +31,13 @@ class DiscordNotifier:
             username: Optional bot username override
             avatar_url: Optional bot avatar URL
             timeout: Request timeout in seconds
+            http_client: Shared HTTP client. If None, the default client is used
         """
         self.webhook_url = webhook_url or os.getenv("DISCORD_WEBHOOK_URL")
         self.username = username or os.getenv("DISCORD_USERNAME", "AI News Bot")
         self.avatar_url = avatar_url or os.getenv("DISCORD_AVATAR_URL")
         self.timeout = timeout
+        self.http = http_client or get_default_http_client()
 
         if not self.webhook_url:
             logger.warning("Discord webhook URL not configured")
@@ -111,7 +115,7 @@ class DiscordNotifier:
 
             logger.info(f"Sending Discord message with {len(embeds)} embed(s)")
 
-            response = requests.post(
+            response = self.http.post(
                 self.webhook_url,
                 json=payload,
                 timeout=self.timeout,
@@ -6,6 +6,7 @@ import requests
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 from ..logger import setup_logger
+from ..http_client import HttpClient, get_default_http_client
 
 
 logger = setup_logger(__name__)
@@ -19,7 +20,8 @@ class SlackNotifier:
         webhook_url: Optional[str] = None,
         channel: Optional[str] = None,
         username: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        http_client: Optional[HttpClient] = None
     ):
         """
         Initialize SlackNotifier.
@@ -29,11 +31,13 @@ class SlackNotifier:
             channel: Optional channel override (e.g., '#general' or '@username')
             username: Optional bot username override
             timeout: Request timeout in seconds
+            http_client: Shared HTTP client. If None, the default client is used
         """
         self.webhook_url = webhook_url or os.getenv("SLACK_WEBHOOK_URL")
         self.channel = channel or os.getenv("SLACK_CHANNEL")
         self.username = username or os.getenv("SLACK_USERNAME", "AI News Bot")
         self.timeout = timeout
+        self.http = http_client or get_default_http_client()
 
         if not self.webhook_url:
             logger.warning("Slack webhook URL not configured")
@@ -125,7 +129,7 @@ class SlackNotifier:
             logger.info(f"Sending Slack message to {self.channel or 'default channel'}")
 
             # Send to Slack
-            response = requests.post(
+            response = self.http.post(
                 self.webhook_url,
                 json=payload,
                 timeout=self.timeout,
@@ -6,6 +6,7 @@ import requests
 from typing import Optional
 from datetime import datetime
 from ..logger import setup_logger
+from ..http_client import HttpClient, get_default_http_client
 
 
 logger = setup_logger(__name__)
@@ -18,7 +19,8 @@ class TelegramNotifier:
         self,
         bot_token: Optional[str] = None,
         chat_id: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        http_client: Optional[HttpClient] = None
     ):
         """
         Initialize TelegramNotifier.
@@ -27,10 +29,12 @@ class TelegramNotifier:
             bot_token: Telegram Bot API token
             chat_id: Telegram chat ID (can be user ID, group ID, or channel ID)
             timeout: Request timeout in seconds
+            http_client: Shared HTTP client. If None, the default client is used
         """
         self.bot_token = bot_token or os.getenv("TELEGRAM_BOT_TOKEN")
         self.chat_id = chat_id or os.getenv("TELEGRAM_CHAT_ID")
         self.timeout = timeout
+        self.http = http_client or get_default_http_client()
 
         if self.bot_token:
             self.api_url = f"https://api.telegram.org/bot{self.bot_token}"
@@ -125,7 +129,7 @@ class TelegramNotifier:
                 "disable_web_page_preview": True
             }
 
-            response = requests.post(
+            response = self.http.post(
                 f"{self.api_url}/sendMessage",
                 json=payload,
                 timeout=self.timeout
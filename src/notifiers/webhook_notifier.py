@@ -6,6 +6,7 @@ import requests
 from typing import Optional, Dict, Any
 from datetime import datetime
 from ..logger import setup_logger
+from ..http_client import HttpClient, get_default_http_client
 
 
 logger = setup_logger(__name__)
@@ -17,7 +18,8 @@ class WebhookNotifier:
     def __init__(
         self,
         webhook_url: Optional[str] = None,
-        timeout: int = 30
+        timeout: int = 30,
+        http_client: Optional[HttpClient] = None
     ):
         """
         Initialize WebhookNotifier.
@@ -25,9 +27,11 @@ class WebhookNotifier:
         Args:
             webhook_url: Webhook URL to send notifications to
             timeout: Request timeout in seconds
+            http_client: Shared HTTP client. If None, the default client is used
         """
         self.webhook_url = webhook_url or os.getenv("WEBHOOK_URL")
         self.timeout = timeout
+        self.http = http_client or get_default_http_client()
 
         if not self.webhook_url:
             logger.warning("Webhook URL not configured")
@@ -86,7 +90,7 @@ class WebhookNotifier:
             logger.debug(f"Payload keys: {list(payload.keys())}")
 
             # Send webhook
-            response = requests.post(
+            response = self.http.post(
                 self.webhook_url,
                 json=payload,
                 timeout=self.timeout,